@@ -0,0 +1,61 @@
+import argparse
+import sys
+
+from Project.Model.Database import Database
+from Project.Controller.ScratchDatabase import ScratchDatabase
+
+
+def run(args, parser):
+    ScratchDatabase.use(args, parser, "benchmark")
+
+    from Project.Controller.BenchmarkSuite import BenchmarkSuite
+    suite = BenchmarkSuite(seed=args.seed, years=args.years, iterations=args.iterations)
+    results = suite.run(args.scales)
+    BenchmarkSuite.save(results, args.output)
+    Database.get().close()
+
+
+def compare(args, parser):
+    from Project.Controller.BenchmarkSuite import BenchmarkSuite
+    regressions = BenchmarkSuite.compare(BenchmarkSuite.load(args.baseline), BenchmarkSuite.load(args.current),
+                                         threshold=args.threshold)
+    if not regressions:
+        print(f"[Benchmark] No regressions beyond {args.threshold:.0%}")
+        return 0
+
+    print(f"[Benchmark] {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+    for r in regressions:
+        change = f"+{r['change']:.0%}" if r['change'] is not None else "new"
+        print(f"  {r['scale']:>6} employees  {r['case']:<32} {r['metric']:<16} "
+              f"{r['baseline']} -> {r['current']} ({change})")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Controller benchmarks against generated datasets")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite and write a JSON baseline")
+    ScratchDatabase.add_arguments(run_parser, default="attendance_system_bench")
+    run_parser.add_argument("--scales", type=int, nargs="+", default=None,
+                            help="Employee counts (default: 100 1000 10000 50000)")
+    run_parser.add_argument("--years", type=float, default=0.25, help="Attendance history per scale")
+    run_parser.add_argument("--iterations", type=int, default=None)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--output", default="benchmark.json")
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="Allowed relative increase (default 0.2 = 20%%)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args, parser)
+    else:
+        sys.exit(compare(args, parser))
+
+
+if __name__ == "__main__":
+    main()
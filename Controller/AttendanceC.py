@@ -1,6 +1,11 @@
-from datetime import datetime, date, time, timedelta
+import csv
+from datetime import time, timedelta
 from Project.Model.Database import Database
 from Project.Model.Attendance import Attendance
+from Project.Controller.PositionRulesCache import PositionRulesCache
+from Project.Controller.LiveDayCounters import LiveDayCounters
+from Project.Controller.CumulativeTotals import CumulativeTotals
+from Project.Controller.Clock import Clock
 
 
 class AttendanceController:
@@ -37,38 +42,21 @@ class AttendanceController:
                 ORDER BY a.clock_in DESC
                     LIMIT %s \
                 """
-        return db.query_all(query, (date.today(), limit))
+        return db.query_all(query, (Clock.get().today(), limit))
 
     @staticmethod
     def get_today_stats():
-        db = Database.get()
-        today = date.today()
-        now = datetime.now()
-
-        # Get total employees
-        total_res = db.query_one("SELECT COUNT(*) as c FROM employees")
-        total = total_res['c'] if total_res else 0
-
-        # If past cutoff time, mark all employees who haven't clocked in as absent
-        if now.time() > AttendanceController.ABSENT_CUTOFF:
-            AttendanceController.mark_absent_employees()
-
-        # Count by status for today
-        stats_query = """
-                      SELECT SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) as present,
-                             SUM(CASE WHEN status = 'Late' THEN 1 ELSE 0 END)    as late,
-                             SUM(CASE WHEN status = 'Absent' THEN 1 ELSE 0 END)  as marked_absent
-                      FROM attendance
-                      WHERE date = %s \
-                      """
-        stats = db.query_one(stats_query, (today,))
-
-        present = int(stats['present'] or 0)
-        late = int(stats['late'] or 0)
-        marked_absent = int(stats['marked_absent'] or 0)
+        """
+        Today's dashboard stats from the live-day counters (one primary-key
+        read; absent marking is left to the scheduler so this never writes)
+        """
+        counters = LiveDayCounters.get(Clock.get().today())
+
+        total = counters['total_employees']
+        late = counters['late']
 
         # Calculate total signed in (present + late)
-        signed_in = present + late
+        signed_in = counters['present'] + late
 
         # Calculate absent (total employees - signed in)
         actual_absent = total - signed_in
@@ -84,41 +72,59 @@ class AttendanceController:
 
     # === UPDATED METHOD: Mark Absent for Specific Date ===
     @staticmethod
-    def mark_absent_employees(target_date=None):
+    def mark_absent_employees(target_date=None, end_date=None):
         """
         Mark employees as absent if they have no record for the target date.
+
+        Runs as a single server-side INSERT ... SELECT ... WHERE NOT EXISTS,
+        so it is idempotent under the (employee_id, date) unique key.
+        Employees are never marked absent for days before their date_hired.
+
         Args:
             target_date: Date to check (default: today)
+            end_date: Optional last date of a range starting at target_date
+
+        Returns:
+            Number of absent rows inserted
         """
         db = Database.get()
         if target_date is None:
-            target_date = date.today()
+            target_date = Clock.get().today()
+        if end_date is None:
+            end_date = target_date
+
+        days = [target_date + timedelta(days=i) for i in range((end_date - target_date).days + 1)]
+        if not days:
+            return 0
 
         try:
-            # Get all employees who have NO attendance record for the target date
-            query = """
-                    SELECT e.id
-                    FROM employees e
-                    WHERE NOT EXISTS (SELECT 1
-                                      FROM attendance a
-                                      WHERE a.employee_id = e.id
-                                        AND a.date = %s) \
-                    """
-            absent_employees = db.query_all(query, (target_date,))
-
-            # Mark each as absent
-            for emp in absent_employees:
-                db.execute(
-                    """INSERT INTO attendance (employee_id, date, status, clock_in, clock_out)
-                       VALUES (%s, %s, 'Absent', NULL, NULL)""",
-                    (emp['id'], target_date)
-                )
-
-            if absent_employees:
-                print(f"[Attendance] Marked {len(absent_employees)} employees as absent for {target_date}")
+            # Derived table of the requested days crossed with all employees
+            days_sql = " UNION ALL ".join(["SELECT %s AS day"] * len(days))
+            inserted = db.execute(f"""
+                                  INSERT IGNORE INTO attendance (employee_id, date, status, clock_in, clock_out)
+                                  SELECT e.id, d.day, 'Absent', NULL, NULL
+                                  FROM employees e
+                                           CROSS JOIN ({days_sql}) d
+                                  WHERE e.date_hired <= d.day
+                                    AND NOT EXISTS (SELECT 1
+                                                    FROM attendance a
+                                                    WHERE a.employee_id = e.id
+                                                      AND a.date = d.day)
+                                  """, tuple(days)).rowcount
+
+            if len(days) == 1:
+                LiveDayCounters.record_absent(target_date, inserted)
+            elif inserted:
+                LiveDayCounters.resync_range(target_date, end_date)
+
+            if inserted:
+                span = target_date if len(days) == 1 else f"{target_date} to {end_date}"
+                print(f"[Attendance] Marked {inserted} employees as absent for {span}")
+            return inserted
 
         except Exception as e:
             print(f"[Attendance] Error marking absent employees: {e}")
+            return 0
 
     @classmethod
     def clock_in(cls, emp_id):
@@ -132,77 +138,43 @@ class AttendanceController:
             Dictionary with success status and message
         """
         db = Database.get()
-        today = date.today()
-        now = datetime.now()
+        now = Clock.get().now()
+        today = now.date()
+        after_cutoff = now.time() > cls.ABSENT_CUTOFF
 
         try:
-            # 1. Check if already clocked in today
-            existing = db.query_one(
-                "SELECT id FROM attendance WHERE employee_id=%s AND date=%s",
-                (emp_id, today)
-            )
-            if existing:
-                return {"success": False, "message": "Already clocked in today."}
-
-            # 2. Check if past cutoff time
-            if now.time() > cls.ABSENT_CUTOFF:
-                # Still allow clock-in but mark as absent for being too late
-                status = "Absent"
-                db.execute(
-                    "INSERT INTO attendance (employee_id, clock_in, date, status) VALUES (%s, %s, %s, %s)",
-                    (emp_id, now, today, status)
-                )
+            # Classify from the cached position rules (no query on a warm
+            # cache), then insert in a single atomic statement: an unknown
+            # employee inserts nothing and the (employee_id, date) unique
+            # key rejects a second punch. The status is known up front, so
+            # nothing is read back.
+            status = "Absent" if after_cutoff else PositionRulesCache.classify(emp_id, now)
+
+            try:
+                cur = db.execute("""
+                                 INSERT INTO attendance (employee_id, clock_in, date, status)
+                                 SELECT e.id, %s, %s, %s
+                                 FROM employees e
+                                 WHERE e.id = %s
+                                 """, (now, today, status, emp_id))
+            except Exception as e:
+                if Database.is_duplicate_key(e):
+                    return {"success": False, "message": "Already clocked in today."}
+                raise
+
+            if cur.rowcount == 0:
+                return {"success": False, "message": "Employee not found."}
+
+            LiveDayCounters.record_clock_in(today, status)
+
+            if status == "Absent":
+                # Still allowed to clock in, but marked absent for being too late
                 return {
                     "success": True,
                     "message": f"Clocked in after cutoff time ({cls.ABSENT_CUTOFF.strftime('%I:%M %p')}). Marked as Absent.",
                     "status": status
                 }
 
-            # 3. Fetch employee's position settings for late calculation
-            settings = db.query_one("""
-                                    SELECT p.late_time, p.grace_period_minutes
-                                    FROM employees e
-                                             LEFT JOIN positions p ON e.position_id = p.id
-                                    WHERE e.id = %s
-                                    """, (emp_id,))
-
-            # Default values if no position found or settings are None
-            if settings and settings.get('late_time'):
-                target_time = settings['late_time']
-                # Handle if late_time is returned as timedelta or string
-                if isinstance(target_time, timedelta):
-                    total_seconds = int(target_time.total_seconds())
-                    hours = total_seconds // 3600
-                    minutes = (total_seconds % 3600) // 60
-                    seconds = total_seconds % 60
-                    target_time = time(hours, minutes, seconds)
-                elif isinstance(target_time, str):
-                    parts = target_time.split(':')
-                    target_time = time(int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) > 2 else 0)
-                grace = settings.get('grace_period_minutes', 15)
-            else:
-                target_time = time(8, 0, 0)
-                grace = 15
-
-            # 4. Calculate late threshold (target time + grace period)
-            target_datetime = datetime.combine(today, target_time)
-            threshold_datetime = target_datetime + timedelta(minutes=grace)
-            threshold_time = threshold_datetime.time()
-
-            # 5. Determine status based on current time
-            current_time = now.time()
-
-            if current_time > threshold_time:
-                status = "Late"
-            else:
-                status = "Present"
-
-            # 6. Insert attendance record
-            db.execute(
-                "INSERT INTO attendance (employee_id, clock_in, date, status) VALUES (%s, %s, %s, %s)",
-                (emp_id, now, today, status)
-            )
-
             return {
                 "success": True,
                 "message": f"Clocked in as {status}",
@@ -227,8 +199,8 @@ class AttendanceController:
             Dictionary with success status and message
         """
         db = Database.get()
-        today = date.today()
-        now = datetime.now()
+        now = Clock.get().now()
+        today = now.date()
 
         try:
             # Find today's clock-in record
@@ -265,6 +237,7 @@ class AttendanceController:
                 "UPDATE attendance SET clock_out = %s WHERE id = %s",
                 (now, record['id'])
             )
+            LiveDayCounters.record_clock_out(today)
 
             return {
                 "success": True,
@@ -336,6 +309,60 @@ class AttendanceController:
                 """
         return db.query_all(query, (employee_id, limit))
 
+    @staticmethod
+    def iter_attendance_range(start_date, end_date, chunk_size=1000):
+        """
+        Stream attendance records with employee info for a date range
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            chunk_size: Rows fetched from the server per round
+
+        Yields:
+            Attendance record dictionaries ordered by date
+        """
+        db = Database.get()
+        query = """
+                SELECT a.date,
+                       a.employee_id,
+                       CONCAT(e.first_name, ' ', IFNULL(e.middle_initial, ''), ' ', e.last_name) as employee_name,
+                       p.name as position_name,
+                       a.status,
+                       a.clock_in,
+                       a.clock_out
+                FROM attendance a
+                         JOIN employees e ON a.employee_id = e.id
+                         LEFT JOIN positions p ON e.position_id = p.id
+                WHERE a.date BETWEEN %s AND %s
+                ORDER BY a.date, a.employee_id
+                """
+        return db.query_iter(query, (start_date, end_date), chunk_size=chunk_size)
+
+    @staticmethod
+    def export_attendance_csv(start_date, end_date, path):
+        """
+        Export attendance for a date range to CSV in constant memory
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            path: Destination file path
+
+        Returns:
+            Number of rows written
+        """
+        columns = ['date', 'employee_id', 'employee_name', 'position_name', 'status', 'clock_in', 'clock_out']
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            for row in AttendanceController.iter_attendance_range(start_date, end_date):
+                writer.writerow(row)
+                count += 1
+        print(f"[Attendance] Exported {count} records ({start_date} to {end_date}) to {path}")
+        return count
+
     @staticmethod
     def generate_daily_report(target_date=None):
         """
@@ -346,7 +373,7 @@ class AttendanceController:
         db = Database.get()
 
         # Use target_date if provided, otherwise use today
-        report_date = target_date if target_date else date.today()
+        report_date = target_date if target_date else Clock.get().today()
 
         try:
             # 1. Fill in blanks for that specific date
@@ -366,14 +393,10 @@ class AttendanceController:
             absent = int(stats['absent_count'] or 0)
 
             # 3. Update the historical record
-            db.execute("""
-                       INSERT INTO reports (date, total_present_employees, total_late_employees, total_absent_employees)
-                       VALUES (%s, %s, %s, %s) ON DUPLICATE KEY
-                       UPDATE
-                           total_present_employees = %s,
-                           total_late_employees = %s,
-                           total_absent_employees = %s
-                       """, (report_date, present, late, absent, present, late, absent))
+            AttendanceController.upsert_daily_reports([(report_date, present, late, absent)])
+
+            # 4. The day's punches weren't change-logged before it had a report
+            CumulativeTotals.refresh_dates(report_date)
 
             print(f"[Attendance] Report generated for {report_date}: Present={present}, Late={late}, Absent={absent}")
             return True
@@ -382,6 +405,27 @@ class AttendanceController:
             print(f"[Attendance] Error generating report: {e}")
             return False
 
+    @staticmethod
+    def upsert_daily_reports(rows):
+        """
+        Insert or update daily report rows in batches.
+
+        Args:
+            rows: Iterable of (date, present, late, absent) tuples
+
+        Returns:
+            Number of affected rows
+        """
+        db = Database.get()
+        return db.execute_many("""
+                               INSERT INTO reports (date, total_present_employees, total_late_employees, total_absent_employees)
+                               VALUES (%s, %s, %s, %s) ON DUPLICATE KEY
+                               UPDATE
+                                   total_present_employees = VALUES(total_present_employees),
+                                   total_late_employees = VALUES(total_late_employees),
+                                   total_absent_employees = VALUES(total_absent_employees)
+                               """, rows)
+
     @staticmethod
     def get_cutoff_time():
         """Get the current absence cutoff time"""
@@ -0,0 +1,217 @@
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from Project.Model.Database import Database
+from Project.Controller.Clock import Clock, SimulatedClock
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.ReportsC import ReportController
+from Project.Controller.EmployeeC import EmployeeController
+from Project.Controller.RequestC import LeaveRequestController
+from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.PositionRulesCache import PositionRulesCache
+from Project.Controller.DatasetGenerator import DatasetGenerator
+
+
+class BenchmarkSuite:
+    """
+    Times the real controller entry points against a generated dataset.
+
+    For every scale the dataset is regenerated with the same seed, the
+    clock is set to the day after the generated history, and each case is
+    run `iterations` times. Latency percentiles and statements per call
+    come from the timed runs; peak Python memory from one extra run under
+    tracemalloc on its own input (so tracing doesn't skew the timings, and
+    a clock-in isn't traced as an "already clocked in" no-op).
+    """
+
+    SCALES = [100, 1000, 10000, 50000]
+    ITERATIONS = 20
+    HEAVY_ITERATIONS = 3
+
+    # Metrics compared by compare(); latency differences below the floor are noise
+    COMPARED_METRICS = ('p50_ms', 'p95_ms', 'queries_per_call', 'peak_kb')
+    LATENCY_FLOOR_MS = 1.0
+
+    def __init__(self, seed=42, years=0.25, iterations=None):
+        self.seed = seed
+        self.years = years
+        self.iterations = iterations or self.ITERATIONS
+
+    @staticmethod
+    def _percentile(values, pct):
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def _measure(self, calls, traced):
+        """
+        Run each callable once, timed, then `traced` under tracemalloc
+
+        Args:
+            calls: List of zero-argument callables (one per iteration)
+            traced: Zero-argument callable not run before (fresh input)
+        """
+        latencies, statements = [], []
+        for call in calls:
+            before = Database.statement_count()
+            started = time.perf_counter()
+            call()
+            latencies.append((time.perf_counter() - started) * 1000)
+            statements.append(Database.statement_count() - before)
+
+        tracemalloc.start()
+        try:
+            traced()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'count': len(latencies),
+            'mean_ms': round(sum(latencies) / len(latencies), 3),
+            'p50_ms': round(self._percentile(latencies, 50), 3),
+            'p95_ms': round(self._percentile(latencies, 95), 3),
+            'p99_ms': round(self._percentile(latencies, 99), 3),
+            'max_ms': round(max(latencies), 3),
+            'queries_per_call': round(sum(statements) / len(statements), 2),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    def _cases(self, employee_ids, start_date, end_date):
+        """
+        (name, callables, clock moment or None) for every case, in run order
+
+        Each case has a warm-up callable, one per timed iteration and a last
+        one for the tracemalloc run, each with its own input where the call
+        changes state.
+        """
+        n = self.iterations + 2
+        heavy = min(self.iterations, self.HEAVY_ITERATIONS) + 2
+        punchers = employee_ids[:n]
+        sample_dates = [start_date + timedelta(days=(i * 7) % max(1, (end_date - start_date).days))
+                        for i in range(n)]
+        # Last complete half-month and month of the generated history
+        period_start, period_end = PeriodicReportsController.get_previous_15day_period(end_date + timedelta(days=1))
+        month = end_date
+
+        return [
+            ('clock_in', [lambda e=e: AttendanceController.clock_in(e) for e in punchers],
+             datetime.combine(end_date + timedelta(days=1), datetime.min.time()) + timedelta(hours=7, minutes=55)),
+            ('get_today_stats', [AttendanceController.get_today_stats] * n, None),
+            ('clock_out', [lambda e=e: AttendanceController.clock_out(e) for e in punchers],
+             datetime.combine(end_date + timedelta(days=1), datetime.min.time()) + timedelta(hours=17, minutes=30)),
+            ('mark_absent_employees',
+             [lambda d=end_date + timedelta(days=1 + i): AttendanceController.mark_absent_employees(d)
+              for i in range(heavy)], None),
+            ('get_attendance_details_by_date',
+             [lambda d=d: ReportController.get_attendance_details_by_date(d) for d in sample_dates], None),
+            ('list_employees', [EmployeeController.list_employees] * n, None),
+            ('get_all_requests', [LeaveRequestController.get_all_requests] * n, None),
+            ('get_all_requests_pending', [lambda: LeaveRequestController.get_all_requests('Pending')] * n, None),
+            ('generate_15day_report',
+             [lambda: PeriodicReportsController.generate_15day_report(period_start, period_end)] * heavy, None),
+            ('generate_monthly_report',
+             [lambda: PeriodicReportsController.generate_monthly_report(month.year, month.month)] * heavy, None),
+        ]
+
+    def run_scale(self, employees):
+        """Generate the dataset for one scale and benchmark every case"""
+        generator = DatasetGenerator(seed=self.seed)
+        generator.generate(employees=employees, years=self.years)
+        end_date = DatasetGenerator.DEFAULT_END_DATE
+        start_date = end_date - timedelta(days=int(self.years * 365) - 1)
+
+        employee_ids = [r['id'] for r in Database.get().query_all(
+            "SELECT id FROM employees WHERE username LIKE %s ORDER BY id",
+            (DatasetGenerator.EMPLOYEE_PREFIX + "%",)
+        )]
+
+        clock = SimulatedClock(datetime.combine(end_date + timedelta(days=1), datetime.min.time()), speed=0)
+        previous_clock = Clock.get()
+        Clock.install(clock)
+        PositionRulesCache.invalidate()
+        results = {}
+        try:
+            for name, calls, moment in self._cases(employee_ids, start_date, end_date):
+                if moment:
+                    clock.set(moment)
+                # The first call of each case warms caches and isn't measured
+                warmup, calls, traced = calls[0], calls[1:-1], calls[-1]
+                warmup()
+                results[name] = self._measure(calls, traced)
+                print(f"[Benchmark] {employees:>6} employees  {name:<32} "
+                      f"p50={results[name]['p50_ms']}ms p95={results[name]['p95_ms']}ms "
+                      f"queries={results[name]['queries_per_call']}")
+        finally:
+            Clock.install(previous_clock)
+        return results
+
+    def run(self, scales=None):
+        """
+        Benchmark every scale
+
+        Returns:
+            Baseline dictionary (meta + results per scale and case)
+        """
+        scales = scales or self.SCALES
+        baseline = {
+            'meta': {
+                'backend': Database.get().backend.NAME,
+                'seed': self.seed,
+                'years': self.years,
+                'iterations': self.iterations,
+                'scales': scales,
+                'created': datetime.now().isoformat(timespec='seconds'),
+            },
+            'results': {}
+        }
+        for employees in scales:
+            baseline['results'][str(employees)] = self.run_scale(employees)
+        return baseline
+
+    @staticmethod
+    def save(baseline, path):
+        with open(path, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"[Benchmark] Results written to {path}")
+
+    @staticmethod
+    def load(path):
+        with open(path) as f:
+            return json.load(f)
+
+    @classmethod
+    def compare(cls, baseline, current, threshold=0.2):
+        """
+        Compare two result sets
+
+        Args:
+            baseline: Earlier results (dict from run/load)
+            current: New results
+            threshold: Allowed relative increase (0.2 = 20%)
+
+        Returns:
+            List of regression dicts (scale, case, metric, baseline, current, change)
+        """
+        regressions = []
+        for scale, cases in current['results'].items():
+            for case, metrics in cases.items():
+                old = baseline['results'].get(scale, {}).get(case)
+                if not old:
+                    continue
+                for metric in cls.COMPARED_METRICS:
+                    before, after = old.get(metric), metrics.get(metric)
+                    if before is None or after is None or after <= before * (1 + threshold):
+                        continue
+                    if metric.endswith('_ms') and after - before < cls.LATENCY_FLOOR_MS:
+                        continue
+                    regressions.append({
+                        'scale': scale,
+                        'case': case,
+                        'metric': metric,
+                        'baseline': before,
+                        'current': after,
+                        'change': round((after - before) / before, 3) if before else None,
+                    })
+        return regressions
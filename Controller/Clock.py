@@ -0,0 +1,87 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class Clock:
+    """
+    Source of the current time for controllers and the scheduler.
+
+    Code asks Clock.get().now() / .today() instead of calling datetime.now()
+    or date.today() directly, so a SimulatedClock can be installed to run
+    days of attendance and scheduler activity in minutes.
+    """
+
+    _current = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Installed clock (the wall clock by default)"""
+        if cls._current is None:
+            with cls._lock:
+                if cls._current is None:
+                    cls._current = Clock()
+        return cls._current
+
+    @classmethod
+    def install(cls, clock):
+        """Replace the clock used everywhere; pass None to restore the wall clock"""
+        with cls._lock:
+            cls._current = clock
+
+    def now(self):
+        return datetime.now()
+
+    def today(self):
+        return self.now().date()
+
+    def wait(self, event, seconds):
+        """
+        Wait on a threading.Event for `seconds` of clock time
+
+        Returns:
+            True if the event was set
+        """
+        return event.wait(seconds)
+
+
+class SimulatedClock(Clock):
+    """
+    Clock that starts at an arbitrary moment and runs `speed` times faster
+    than real time (speed=0 freezes it so a driver can step it with
+    advance() / set()).
+    """
+
+    # Real seconds a frozen clock sleeps in wait(), so waiting threads
+    # re-check the time a driver moved forward
+    FROZEN_WAIT_SECONDS = 0.05
+
+    def __init__(self, start, speed=0):
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._base = start
+        self._base_real = time.monotonic()
+
+    def now(self):
+        with self._lock:
+            elapsed = (time.monotonic() - self._base_real) * self.speed
+            return self._base + timedelta(seconds=elapsed)
+
+    def set(self, moment):
+        """Jump to a moment (never backwards)"""
+        with self._lock:
+            current = self._base + timedelta(seconds=(time.monotonic() - self._base_real) * self.speed)
+            self._base = max(moment, current)
+            self._base_real = time.monotonic()
+
+    def advance(self, delta):
+        """Move forward by a timedelta or a number of seconds"""
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        self.set(self.now() + delta)
+
+    def wait(self, event, seconds):
+        if self.speed > 0:
+            return event.wait(seconds / self.speed)
+        return event.wait(min(seconds, self.FROZEN_WAIT_SECONDS))
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+
+class CronSchedule:
+    """
+    Cron-like schedule: "minute hour day-of-month month day-of-week".
+
+    Each field accepts '*', a number, a range (a-b), a list (a,b,c) and a
+    step (*/n or a-b/n). Day-of-week uses cron numbering (0 = Sunday).
+    As in cron, when both day-of-month and day-of-week are restricted a
+    day matches if either one does.
+
+    Example:
+        CronSchedule("30 0 1,16 * *")  # 00:30 on the 1st and 16th
+    """
+
+    _FIELDS = (
+        ('minute', 0, 59),
+        ('hour', 0, 23),
+        ('day', 1, 31),
+        ('month', 1, 12),
+        ('weekday', 0, 6),
+    )
+
+    # Longest gap between matches (Feb 29 on a given weekday is ~28 years)
+    _MAX_DAYS_AHEAD = 366 * 28
+
+    def __init__(self, expression):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{expression}'")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(part, name, low, high)
+            for part, (name, low, high) in zip(parts, self._FIELDS)
+        )
+        self._any_day = parts[2] == '*'
+        self._any_weekday = parts[4] == '*'
+
+    @classmethod
+    def daily_at(cls, time_str):
+        """Schedule for every day at an "HH:MM" time"""
+        hour, minute = (int(p) for p in time_str.split(':'))
+        return cls(f"{minute} {hour} * * *")
+
+    @staticmethod
+    def _parse_field(text, name, low, high):
+        values = set()
+        for item in text.split(','):
+            step = 1
+            if '/' in item:
+                item, step_text = item.split('/', 1)
+                step = int(step_text)
+            if item == '*':
+                start, end = low, high
+            elif '-' in item:
+                start, end = (int(p) for p in item.split('-', 1))
+            else:
+                start = end = int(item)
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Invalid {name} field: '{text}'")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, day):
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return in_weekdays
+        if self._any_weekday:
+            return in_days
+        return in_days or in_weekdays
+
+    def next_after(self, moment):
+        """
+        First matching minute strictly after `moment`
+
+        Args:
+            moment: datetime to search from
+
+        Returns:
+            datetime with zero seconds
+        """
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        for offset in range(self._MAX_DAYS_AHEAD):
+            if offset:
+                day += timedelta(days=1)
+            if not self._day_matches(day):
+                continue
+            for hour in sorted(self.hours):
+                for minute in sorted(self.minutes):
+                    candidate = datetime(day.year, day.month, day.day, hour, minute)
+                    if candidate >= start:
+                        return candidate
+        raise ValueError(f"Cron expression never matches: '{self.expression}'")
+
+    def __repr__(self):
+        return f"CronSchedule('{self.expression}')"
@@ -0,0 +1,173 @@
+from Project.Model.Database import Database
+
+
+class CumulativeTotals:
+    """
+    Maintains employee_cumulative_attendance: for every employee and every
+    date with an attendance row, the running totals of present, late and
+    absent days and worked minutes up to and including that date.
+
+    Any date range is then answered as total(end) - total(start - 1), i.e.
+    two primary-key lookups per employee regardless of history length.
+    """
+
+    # Window over one employee's attendance, added to the totals carried in
+    # from before the rebuilt range (base)
+    _REBUILD = """
+               INSERT INTO employee_cumulative_attendance
+                   (employee_id, date, cum_present, cum_late, cum_absent, cum_minutes)
+               SELECT a.employee_id,
+                      a.date,
+                      COALESCE(b.cum_present, 0) +
+                      SUM(a.status = 'Present') OVER (PARTITION BY a.employee_id ORDER BY a.date),
+                      COALESCE(b.cum_late, 0) +
+                      SUM(a.status = 'Late') OVER (PARTITION BY a.employee_id ORDER BY a.date),
+                      COALESCE(b.cum_absent, 0) +
+                      SUM(a.status = 'Absent') OVER (PARTITION BY a.employee_id ORDER BY a.date),
+                      COALESCE(b.cum_minutes, 0) +
+                      SUM(COALESCE(TIMESTAMPDIFF(MINUTE, a.clock_in, a.clock_out), 0))
+                          OVER (PARTITION BY a.employee_id ORDER BY a.date)
+               FROM attendance a
+                        JOIN ({touched}) t ON t.employee_id = a.employee_id AND a.date >= t.from_date
+                        LEFT JOIN employee_cumulative_attendance b
+                                  ON b.employee_id = t.employee_id
+                                      AND b.date = (SELECT MAX(c.date)
+                                                    FROM employee_cumulative_attendance c
+                                                    WHERE c.employee_id = t.employee_id
+                                                      AND c.date < t.from_date)
+               """
+
+    @classmethod
+    def rebuild_all(cls):
+        """Recompute the whole table from attendance"""
+        db = Database.get()
+        with db.connection():
+            db.execute("DELETE FROM employee_cumulative_attendance")
+            rows = db.execute(cls._REBUILD.format(
+                touched="SELECT id AS employee_id, DATE('1000-01-01') AS from_date FROM employees"
+            )).rowcount
+        print(f"[Cumulative] Rebuilt {rows} running-total rows")
+        return rows
+
+    @classmethod
+    def refresh(cls, cells):
+        """
+        Rebuild running totals from the earliest touched date of each employee
+
+        Args:
+            cells: Iterable of (employee_id, date) pairs that changed
+
+        Returns:
+            Number of rows written
+        """
+        from_dates = {}
+        for employee_id, day in cells:
+            if employee_id not in from_dates or day < from_dates[employee_id]:
+                from_dates[employee_id] = day
+        if not from_dates:
+            return 0
+
+        # Staged in a session temporary table and joined, so the statements
+        # stay the same size however many employees were touched
+        db = Database.get()
+        with db.transaction():
+            db.execute("""
+                       CREATE TEMPORARY TABLE IF NOT EXISTS cumulative_touched
+                       (
+                           employee_id INT NOT NULL PRIMARY KEY,
+                           from_date DATE NOT NULL
+                       )
+                       """)
+            db.execute("DELETE FROM cumulative_touched")
+            db.execute_many("INSERT INTO cumulative_touched (employee_id, from_date) VALUES (%s, %s)",
+                            from_dates.items())
+            db.execute("""
+                       DELETE c
+                       FROM employee_cumulative_attendance c
+                                JOIN cumulative_touched t
+                                     ON t.employee_id = c.employee_id AND c.date >= t.from_date
+                       """)
+            rows = db.execute(cls._REBUILD.format(
+                touched="SELECT employee_id, from_date FROM cumulative_touched"
+            )).rowcount
+        return rows
+
+    @classmethod
+    def refresh_dates(cls, start_date, end_date=None):
+        """
+        Rebuild running totals of every employee with attendance in a date range
+
+        Used when daily reports are generated: attendance on days without a
+        report isn't written to the change log (see AttendanceChanges).
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive, default: start_date)
+
+        Returns:
+            Number of rows written
+        """
+        if end_date is None:
+            end_date = start_date
+        db = Database.get()
+        with db.connection():
+            db.execute("""
+                       DELETE FROM employee_cumulative_attendance
+                       WHERE date >= %s
+                         AND employee_id IN (SELECT employee_id FROM attendance WHERE date BETWEEN %s AND %s)
+                       """, (start_date, start_date, end_date))
+            rows = db.execute(cls._REBUILD.format(
+                touched="SELECT employee_id, MIN(date) AS from_date FROM attendance "
+                        "WHERE date BETWEEN %s AND %s GROUP BY employee_id"
+            ), (start_date, end_date)).rowcount
+        return rows
+
+    @staticmethod
+    def get_range_totals(start_date, end_date, position=None):
+        """
+        Totals per employee for [start_date, end_date] from two lookups each
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            position: Optional position name or ID filter
+
+        Returns:
+            List of dictionaries per employee
+        """
+        db = Database.get()
+        params = [end_date, start_date]
+        position_filter = ""
+        if position is not None:
+            if isinstance(position, int):
+                position_filter = "WHERE e.position_id = %s"
+            else:
+                position_filter = "WHERE p.name = %s"
+            params.append(position)
+
+        query = f"""
+                SELECT e.id as employee_id,
+                       CONCAT(e.first_name, ' ', IFNULL(e.middle_initial, ''), ' ', e.last_name) as full_name,
+                       COALESCE(p.name, 'Staff') as position,
+                       COALESCE(hi.cum_present, 0) - COALESCE(lo.cum_present, 0) as present_days,
+                       COALESCE(hi.cum_late, 0) - COALESCE(lo.cum_late, 0)       as late_days,
+                       COALESCE(hi.cum_absent, 0) - COALESCE(lo.cum_absent, 0)   as absent_days,
+                       COALESCE(hi.cum_minutes, 0) - COALESCE(lo.cum_minutes, 0) as worked_minutes
+                FROM employees e
+                         LEFT JOIN positions p ON e.position_id = p.id
+                         LEFT JOIN employee_cumulative_attendance hi
+                                   ON hi.employee_id = e.id
+                                       AND hi.date = (SELECT MAX(c.date)
+                                                      FROM employee_cumulative_attendance c
+                                                      WHERE c.employee_id = e.id
+                                                        AND c.date <= %s)
+                         LEFT JOIN employee_cumulative_attendance lo
+                                   ON lo.employee_id = e.id
+                                       AND lo.date = (SELECT MAX(c.date)
+                                                      FROM employee_cumulative_attendance c
+                                                      WHERE c.employee_id = e.id
+                                                        AND c.date < %s)
+                {position_filter}
+                ORDER BY e.first_name, e.last_name
+                """
+        return db.query_all(query, tuple(params))
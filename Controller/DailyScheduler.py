@@ -1,28 +1,88 @@
-import time
+import heapq
 import threading
-from datetime import datetime, date, timedelta
+import time
+from datetime import timedelta
+from Project.Controller.CronSchedule import CronSchedule
+from Project.Controller.Clock import Clock
 from Project.Controller.AttendanceC import AttendanceController
 from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.ReportMaintenance import ReportMaintenance
+from Project.Controller.JobLedger import JobLedger
+from Project.Controller.JobExecutor import JobExecutor
+from Project.Model.AdvisoryLock import AdvisoryLock
 
 
 class DailyScheduler:
     """
     Automated scheduler for daily attendance operations (Standard Library Version)
     No external 'schedule' library required.
+
+    Jobs sit in a heap ordered by their next deadline. The background thread
+    sleeps on a threading.Event until the earliest deadline, so it uses no
+    CPU while idle, a late wake-up still runs the job that fell due, and
+    stop() or a schedule change interrupts the wait immediately.
+
+    Only one instance per database runs jobs: the leader holds a GET_LOCK
+    advisory lock on its own connection. Other instances retry every
+    _leader_retry_seconds and take over (catching up missed runs) once the
+    leader stops or its session dies.
+
+    Every cron job run is recorded per target period in scheduler_runs
+    (JobLedger). On start, periods that fell due while the application was
+    closed and have no successful run are executed first, oldest first.
     """
 
     _scheduler_thread = None
     _running = False
+    _wakeup = threading.Event()
+    _reschedule = False
+    _leader_lock = None
+    _is_leader = False
+    _leader_retry_seconds = 30
 
     # Configuration
     _absent_time = "17:00"
     _report_time = "23:59"
+    _15day_cron = "30 0 1,16 * *"  # 00:30 on the 1st and 16th
+    _monthly_cron = "0 1 1 * *"  # 01:00 on the 1st
+    _maintenance_interval = 600  # seconds between incremental report refreshes
+
+    # Upper bound on a single wait so wall-clock changes (DST, suspend,
+    # manual clock changes) are noticed even with no job due for hours
+    _max_wait_seconds = 900
+
+    # How far back missed runs are caught up on start
+    _catchup_days = 62
 
     # State tracking
     _last_absent_date = None
     _last_report_date = None
     _last_15day_date = None
     _last_monthly_date = None
+    _last_maintenance = None
+    _next_runs = {}
+
+    @classmethod
+    def _jobs(cls):
+        """
+        Job name -> (schedule, function, last-run attribute).
+
+        Cron job functions take the scheduled datetime and return the number
+        of rows they wrote; they raise on failure.
+        """
+        return {
+            'absent': (CronSchedule.daily_at(cls._absent_time), cls._mark_absent_job, '_last_absent_date'),
+            'daily_report': (CronSchedule.daily_at(cls._report_time), cls._generate_report_job, '_last_report_date'),
+            '15day_report': (CronSchedule(cls._15day_cron), cls._check_15day_report, '_last_15day_date'),
+            'monthly_report': (CronSchedule(cls._monthly_cron), cls._check_monthly_report, '_last_monthly_date'),
+            'maintenance': (cls._maintenance_interval, cls._report_maintenance_job, None),
+        }
+
+    @staticmethod
+    def _next_deadline(schedule, now):
+        if isinstance(schedule, CronSchedule):
+            return schedule.next_after(now)
+        return now + timedelta(seconds=schedule)
 
     @classmethod
     def start(cls):
@@ -32,6 +92,7 @@ class DailyScheduler:
             return
 
         cls._running = True
+        cls._wakeup.clear()
         cls._scheduler_thread = threading.Thread(target=cls._run_scheduler, daemon=True)
         cls._scheduler_thread.start()
 
@@ -41,150 +102,368 @@ class DailyScheduler:
 
     @classmethod
     def stop(cls):
-        """Stop the scheduler"""
+        """Stop the scheduler (returns as soon as any running job finishes)"""
         cls._running = False
+        cls._wakeup.set()
+        JobExecutor.shutdown()
         if cls._scheduler_thread:
             cls._scheduler_thread.join(timeout=2)
         print("[Scheduler] Stopped")
 
+    @classmethod
+    def _build_queue(cls, jobs, now):
+        queue = []
+        for seq, (name, (schedule, _, _)) in enumerate(jobs.items()):
+            if isinstance(schedule, CronSchedule):
+                deadline = cls._next_deadline(schedule, now)
+            else:
+                # Interval jobs run right away on start, as the polling loop
+                # did, and keep their slot when cron times are changed
+                deadline = cls._next_runs.get(name, now)
+            heapq.heappush(queue, (deadline, seq, name))
+        cls._next_runs = {name: deadline for deadline, _, name in queue}
+        return queue
+
     @classmethod
     def _run_scheduler(cls):
-        """Internal loop to check time every 30 seconds"""
+        """Internal loop: wait for leadership, then run jobs while leading"""
         print("[Scheduler] Background thread started")
 
         while cls._running:
+            cls._leader_lock = AdvisoryLock("scheduler.leader")
+            if not cls._leader_lock.acquire():
+                cls._leader_lock.close()
+                Clock.get().wait(cls._wakeup, cls._leader_retry_seconds)
+                cls._wakeup.clear()
+                continue
+
+            cls._is_leader = True
+            print("[Scheduler] This instance is now the scheduler leader")
             try:
-                now = datetime.now()
-                current_time = now.strftime("%H:%M")
-                today_str = now.strftime("%Y-%m-%d")
-
-                # --- 1. DAILY ABSENT MARKING (e.g. 17:00) ---
-                if current_time == cls._absent_time:
-                    if cls._last_absent_date != today_str:
-                        cls._mark_absent_job()
-                        cls._last_absent_date = today_str
-
-                # --- 2. DAILY REPORT GENERATION (e.g. 23:59) ---
-                if current_time == cls._report_time:
-                    if cls._last_report_date != today_str:
-                        cls._generate_report_job()
-                        cls._last_report_date = today_str
-
-                # --- 3. 15-DAY REPORTS (00:30 on 1st and 16th) ---
-                if current_time == "00:30":
-                    if cls._last_15day_date != today_str:
-                        if now.day in [1, 16]:
-                            cls._check_15day_report()
-                        cls._last_15day_date = today_str
-
-                # --- 4. MONTHLY REPORTS (01:00 on 1st) ---
-                if current_time == "01:00":
-                    if cls._last_monthly_date != today_str:
-                        if now.day == 1:
-                            cls._check_monthly_report()
-                        cls._last_monthly_date = today_str
-
-                # Sleep to avoid high CPU usage
-                time.sleep(30)
+                cls._lead()
+            finally:
+                cls._is_leader = False
+                cls._next_runs = {}
+                cls._leader_lock.release()
+                if cls._running:
+                    print("[Scheduler] Lost scheduler leadership, standing by")
+
+    @classmethod
+    def _lead(cls):
+        """Sleep until the earliest deadline and run due jobs; returns on stop or lost leadership"""
+        cls._next_runs = {}
+        cls._load_last_runs()
+        jobs = cls._jobs()
+        now = Clock.get().now()
+        cls._catch_up(jobs, now)
+        queue = cls._build_queue(jobs, now)
+
+        while cls._running:
+            try:
+                if cls._reschedule:
+                    cls._reschedule = False
+                    jobs = cls._jobs()
+                    queue = cls._build_queue(jobs, Clock.get().now())
+
+                deadline, seq, name = queue[0]
+                wait = (deadline - Clock.get().now()).total_seconds()
+                if wait > 0:
+                    Clock.get().wait(cls._wakeup, min(wait, cls._max_wait_seconds))
+                    cls._wakeup.clear()
+                    continue
+
+                # Another instance may have taken over if our session dropped
+                if not cls._leader_lock.is_held():
+                    return
+
+                heapq.heappop(queue)
+                schedule, func, last_attr = jobs[name]
+                if last_attr:
+                    cls._run_job(name, deadline)
+                else:
+                    func()
+                    cls._last_maintenance = Clock.get().now()
+
+                next_deadline = cls._next_deadline(schedule, Clock.get().now())
+                cls._next_runs[name] = next_deadline
+                heapq.heappush(queue, (next_deadline, seq, name))
 
             except Exception as e:
                 print(f"[Scheduler] Error in scheduler loop: {e}")
-                time.sleep(60)
+                Clock.get().wait(cls._wakeup, 60)
+                cls._wakeup.clear()
+
+    @staticmethod
+    def _target_period(name, scheduled_for):
+        """(start, end) dates a cron job run covers"""
+        day = scheduled_for.date()
+        if name == '15day_report':
+            if day.day >= 16:
+                return day.replace(day=1), day.replace(day=15)
+            prev_month_end = day.replace(day=1) - timedelta(days=1)
+            return prev_month_end.replace(day=16), prev_month_end
+        if name == 'monthly_report':
+            prev_month_end = day.replace(day=1) - timedelta(days=1)
+            return prev_month_end.replace(day=1), prev_month_end
+        return day, day
+
+    @classmethod
+    def _period_still_due(cls, name, moment):
+        """Whether the regular run for the period of `moment` is still ahead"""
+        schedule = cls._jobs()[name][0]
+        return cls._target_period(name, schedule.next_after(moment)) == cls._target_period(name, moment)
+
+    @classmethod
+    def _run_job(cls, name, scheduled_for, manual=False):
+        """
+        Run one cron job for the period of `scheduled_for` and record it in the ledger.
+
+        A per-job advisory lock keeps a manual run on one workstation from
+        overlapping the same job on the leader. A manual run before the
+        period's scheduled time is recorded as 'early' so catch-up still
+        runs the period once it is due.
+
+        Returns:
+            Dictionary with job, success, rows, duration_ms and error
+        """
+        with AdvisoryLock.held(f"job.{name}") as acquired:
+            if not acquired:
+                print(f"[Scheduler] {name} is already running on another instance, skipped")
+                return {'job': name, 'success': False, 'rows': None, 'duration_ms': 0,
+                        'error': "Already running on another workstation"}
+            return cls._run_job_locked(name, scheduled_for, manual)
 
     @classmethod
-    def _mark_absent_job(cls):
+    def _run_job_locked(cls, name, scheduled_for, manual=False):
+        _, func, last_attr = cls._jobs()[name]
+        target_start, target_end = cls._target_period(name, scheduled_for)
+        run_type = 'scheduled'
+        if manual:
+            run_type = 'early' if cls._period_still_due(name, scheduled_for) else 'manual'
+
+        run_id = None
         try:
-            print(f"\n[Scheduler] === ABSENT MARKING JOB STARTED === {datetime.now()}")
-            AttendanceController.mark_absent_employees()
-            print(f"[Scheduler] === ABSENT MARKING JOB COMPLETED ===\n")
+            run_id = JobLedger.begin(name, target_start, target_end, scheduled_for, run_type)
         except Exception as e:
-            print(f"[Scheduler] Absent Job Error: {e}")
+            print(f"[Scheduler] Could not record {name} run: {e}")
 
-    @classmethod
-    def _generate_report_job(cls):
+        started = time.perf_counter()
+        rows, error = None, None
         try:
-            print(f"\n[Scheduler] === DAILY REPORT GENERATION STARTED === {datetime.now()}")
-            if AttendanceController.generate_daily_report():
-                print(f"[Scheduler] Daily report saved to database")
-            print(f"[Scheduler] === DAILY REPORT GENERATION COMPLETED ===\n")
+            rows = func(scheduled_for)
         except Exception as e:
-            print(f"[Scheduler] Report Job Error: {e}")
+            error = str(e) or e.__class__.__name__
+            print(f"[Scheduler] {name} failed for {target_start} to {target_end}: {error}")
+        duration_ms = int((time.perf_counter() - started) * 1000)
+
+        if run_id is not None:
+            try:
+                JobLedger.finish(run_id, duration_ms, rows, error)
+            except Exception as e:
+                print(f"[Scheduler] Could not record {name} outcome: {e}")
+
+        if error is None:
+            setattr(cls, last_attr, scheduled_for.strftime("%Y-%m-%d"))
+        return {'job': name, 'success': error is None, 'rows': rows, 'duration_ms': duration_ms, 'error': error}
+
+    @staticmethod
+    def _occurrences(jobs, since, until):
+        """(scheduled_for, seq, name) of every cron job run in (since, until], oldest first"""
+        runs = []
+        for seq, (name, (schedule, _, last_attr)) in enumerate(jobs.items()):
+            if not last_attr:
+                continue
+            moment = since
+            while True:
+                moment = schedule.next_after(moment)
+                if moment > until:
+                    break
+                runs.append((moment, seq, name))
+        runs.sort()
+        return runs
 
     @classmethod
-    def _check_15day_report(cls):
+    def _missed_runs(cls, jobs, now):
+        """Scheduled times since the ledger started whose period never succeeded, oldest first"""
+        since = JobLedger.tracking_since()
+        if since is None:
+            return []
+        since = max(since, now - timedelta(days=cls._catchup_days))
+
+        done = {}
+        missed = []
+        for run in cls._occurrences(jobs, since, now):
+            name = run[2]
+            if name not in done:
+                done[name] = JobLedger.succeeded_targets(name, (since - timedelta(days=31)).date())
+            if cls._target_period(name, run[0]) not in done[name]:
+                missed.append(run)
+        return missed
+
+    @classmethod
+    def run_due_jobs(cls, since, until):
+        """
+        Run every cron job scheduled in (since, until] in order, in the calling thread.
+
+        Used to drive the scheduler from a SimulatedClock without the
+        background thread or leadership.
+
+        Returns:
+            List of run summary dictionaries
+        """
+        return [cls._run_job(name, scheduled_for)
+                for scheduled_for, _, name in cls._occurrences(cls._jobs(), since, until)]
+
+    @classmethod
+    def _catch_up(cls, jobs, now):
+        """Execute runs missed while the application was closed"""
         try:
-            print(f"\n[Scheduler] === 15-DAY REPORT CHECK STARTED === {datetime.now()}")
-            today = date.today()
-
-            if today.day == 1:
-                # Previous month 16th to end
-                prev_month = today.replace(day=1) - timedelta(days=1)
-                end_date = prev_month
-                start_date = prev_month.replace(day=16)
-            else:  # Day 16
-                # Current month 1st to 15th
-                end_date = today.replace(day=15)
-                start_date = today.replace(day=1)
-
-            if PeriodicReportsController.generate_15day_report(start_date, end_date):
-                print(f"[Scheduler] 15-day report generated successfully")
-            print(f"[Scheduler] === 15-DAY REPORT CHECK COMPLETED ===\n")
+            missed = cls._missed_runs(jobs, now)
         except Exception as e:
-            print(f"[Scheduler] 15-Day Job Error: {e}")
+            print(f"[Scheduler] Could not check for missed runs: {e}")
+            return
+        if not missed:
+            return
+
+        print(f"[Scheduler] Catching up {len(missed)} missed run(s)")
+        for scheduled_for, _, name in missed:
+            if not cls._running:
+                break
+            cls._run_job(name, scheduled_for)
+        print(f"[Scheduler] Catch-up completed")
+
+    @classmethod
+    def _load_last_runs(cls):
+        """Restore the last-run markers from the ledger"""
+        attrs = {name: job[2] for name, job in cls._jobs().items() if job[2]}
+        for name, last_run in JobLedger.last_runs().items():
+            if name in attrs:
+                setattr(cls, attrs[name], last_run.strftime("%Y-%m-%d"))
+
+    @classmethod
+    def _mark_absent_job(cls, scheduled_for=None):
+        target = (scheduled_for or Clock.get().now()).date()
+        print(f"\n[Scheduler] === ABSENT MARKING JOB STARTED === {Clock.get().now()} (for {target})")
+        count = AttendanceController.mark_absent_employees(target)
+        print(f"[Scheduler] === ABSENT MARKING JOB COMPLETED ===\n")
+        return count
+
+    @classmethod
+    def _generate_report_job(cls, scheduled_for=None):
+        target = (scheduled_for or Clock.get().now()).date()
+        print(f"\n[Scheduler] === DAILY REPORT GENERATION STARTED === {Clock.get().now()} (for {target})")
+        if not AttendanceController.generate_daily_report(target):
+            raise RuntimeError(f"Daily report generation failed for {target}")
+        print(f"[Scheduler] Daily report saved to database")
+        print(f"[Scheduler] === DAILY REPORT GENERATION COMPLETED ===\n")
+        return 1
+
+    @classmethod
+    def _check_15day_report(cls, scheduled_for=None):
+        start_date, end_date = cls._target_period('15day_report', scheduled_for or Clock.get().now())
+        print(f"\n[Scheduler] === 15-DAY REPORT CHECK STARTED === {Clock.get().now()} ({start_date} to {end_date})")
+        if not PeriodicReportsController.generate_15day_report(start_date, end_date):
+            raise RuntimeError(f"15-day report generation failed for {start_date} to {end_date}")
+        print(f"[Scheduler] 15-day report generated successfully")
+        print(f"[Scheduler] === 15-DAY REPORT CHECK COMPLETED ===\n")
+        return 1
 
     @classmethod
-    def _check_monthly_report(cls):
+    def _check_monthly_report(cls, scheduled_for=None):
+        start_date, _ = cls._target_period('monthly_report', scheduled_for or Clock.get().now())
+        print(f"\n[Scheduler] === MONTHLY REPORT CHECK STARTED === {Clock.get().now()} ({start_date:%Y-%m})")
+        if not PeriodicReportsController.generate_monthly_report(start_date.year, start_date.month):
+            raise RuntimeError(f"Monthly report generation failed for {start_date:%Y-%m}")
+        print(f"[Scheduler] Monthly report generated successfully")
+        print(f"[Scheduler] === MONTHLY REPORT CHECK COMPLETED ===\n")
+        return 1
+
+    @classmethod
+    def _report_maintenance_job(cls):
         try:
-            print(f"\n[Scheduler] === MONTHLY REPORT CHECK STARTED === {datetime.now()}")
-            today = date.today()
-            # Generate for previous month
-            prev_month = today.replace(day=1) - timedelta(days=1)
-
-            if PeriodicReportsController.generate_monthly_report(prev_month.year, prev_month.month):
-                print(f"[Scheduler] Monthly report generated successfully")
-            print(f"[Scheduler] === MONTHLY REPORT CHECK COMPLETED ===\n")
+            ReportMaintenance.process_changes()
         except Exception as e:
-            print(f"[Scheduler] Monthly Job Error: {e}")
+            print(f"[Scheduler] Report Maintenance Error: {e}")
 
     @classmethod
     def get_status(cls):
         # FIXED: Keys now match what Main.py expects
         return {
             'running': cls._running,
+            'leader': cls._is_leader,
             'absent_time': cls._absent_time,
             'report_time': cls._report_time,
             'absent_last_run': cls._last_absent_date or 'Never',
             'report_last_run': cls._last_report_date or 'Never',
             '15day_last_run': cls._last_15day_date or 'Never',
-            'monthly_last_run': cls._last_monthly_date or 'Never'
+            'monthly_last_run': cls._last_monthly_date or 'Never',
+            'next_runs': {name: d.strftime("%Y-%m-%d %H:%M") for name, d in cls._next_runs.items()}
         }
 
+    @classmethod
+    def _request_reschedule(cls):
+        """Make the running thread rebuild its deadlines now"""
+        cls._reschedule = True
+        cls._wakeup.set()
+
     @classmethod
     def set_absent_time(cls, time_str):
+        CronSchedule.daily_at(time_str)  # validate before applying
         cls._absent_time = time_str
+        cls._request_reschedule()
         print(f"[Scheduler] Absent marking time updated to {time_str}")
 
     @classmethod
     def set_report_time(cls, time_str):
+        CronSchedule.daily_at(time_str)
         cls._report_time = time_str
+        cls._request_reschedule()
         print(f"[Scheduler] Report generation time updated to {time_str}")
 
     # Manual Triggers
+    TASK_ALIASES = {
+        'absent': 'absent',
+        'report': 'daily_report',
+        'daily_report': 'daily_report',
+        '15day': '15day_report',
+        '15day_report': '15day_report',
+        'monthly': 'monthly_report',
+        'monthly_report': 'monthly_report',
+    }
+
+    @classmethod
+    def _run_now(cls, name):
+        """Queue a manual run on the shared executor (a second press reuses the pending run)"""
+        return JobExecutor.submit(f"scheduler.{name}", lambda: cls._run_job(name, Clock.get().now(), manual=True))
+
+    @classmethod
+    def run_task_now(cls, task_name):
+        """
+        Queue a manual run of a job by task name
+
+        Returns:
+            Future resolving to the run summary dictionary
+        """
+        name = cls.TASK_ALIASES.get(task_name)
+        if name is None:
+            raise ValueError(f"Unknown scheduler task: {task_name}")
+        return cls._run_now(name)
+
     @classmethod
     def run_absent_marking_now(cls):
-        threading.Thread(target=cls._mark_absent_job, daemon=True).start()
+        return cls._run_now('absent')
 
     @classmethod
     def run_report_generation_now(cls):
-        threading.Thread(target=cls._generate_report_job, daemon=True).start()
+        return cls._run_now('daily_report')
 
     @classmethod
     def run_15day_report_now(cls):
-        threading.Thread(target=cls._check_15day_report, daemon=True).start()
+        return cls._run_now('15day_report')
 
     @classmethod
     def run_monthly_report_now(cls):
-        threading.Thread(target=cls._check_monthly_report, daemon=True).start()
+        return cls._run_now('monthly_report')
 
 
 # Public API functions (Bridge to class methods)
@@ -203,13 +482,16 @@ def set_absent_time(t): DailyScheduler.set_absent_time(t)
 def set_report_time(t): DailyScheduler.set_report_time(t)
 
 
-def trigger_absent_marking(): DailyScheduler.run_absent_marking_now()
+def trigger_absent_marking(): return DailyScheduler.run_absent_marking_now()
+
+
+def trigger_daily_report(): return DailyScheduler.run_report_generation_now()
 
 
-def trigger_daily_report(): DailyScheduler.run_report_generation_now()
+def trigger_15day_report(): return DailyScheduler.run_15day_report_now()
 
 
-def trigger_15day_report(): DailyScheduler.run_15day_report_now()
+def trigger_monthly_report(): return DailyScheduler.run_monthly_report_now()
 
 
-def trigger_monthly_report(): DailyScheduler.run_monthly_report_now()
\ No newline at end of file
+def run_task_now(task_name): return DailyScheduler.run_task_now(task_name)
@@ -0,0 +1,220 @@
+import random
+import hashlib
+from datetime import date, datetime, timedelta
+from Project.Model.Database import Database
+from Project.Model.Employee import Employee
+from Project.Controller.PositionRulesCache import PositionRulesCache
+from Project.Controller.CumulativeTotals import CumulativeTotals
+
+
+class DatasetGenerator:
+    """
+    Deterministic synthetic data for scale testing.
+
+    Everything is drawn from one random.Random(seed), so the same seed and
+    arguments always produce the same rows. Generated employees and admins
+    are recognisable by their username prefix and are replaced (with their
+    attendance and leave, via the cascades) on every run.
+
+    All generated accounts share the password PASSWORD; it is hashed once
+    instead of once per account.
+    """
+
+    EMPLOYEE_PREFIX = "gen_"
+    ADMIN_PREFIX = "genadmin_"
+    PASSWORD = "password123"
+
+    # Fixed so runs with the same seed are identical regardless of the day
+    DEFAULT_END_DATE = date(2025, 12, 31)
+
+    FIRST_NAMES = ["James", "Maria", "John", "Ana", "Mark", "Grace", "Paul", "Joy", "Carlo", "Liza",
+                   "Miguel", "Rosa", "Daniel", "Ella", "Jose", "Nina", "Luis", "Carmen", "Rafael", "Bea"]
+    LAST_NAMES = ["Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres", "Flores",
+                  "Ramos", "Rivera", "Gonzales", "Aquino", "Navarro", "Castillo", "Villanueva", "Lim"]
+    LEAVE_TYPES = [("Vacation Leave", 0.55), ("Sick Leave", 0.35), ("Others", 0.10)]
+    LEAVE_STATUSES = [("Approved", 0.75), ("Rejected", 0.10), ("Pending", 0.15)]
+
+    def __init__(self, seed=42, batch_size=5000):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.db = Database.get()
+
+        salt = hashlib.sha256(f"dataset-{seed}".encode()).digest()[:16]
+        self._salt = salt.hex()
+        self._password_hash = Employee.hash_password(self.PASSWORD, salt)
+
+    def _weighted(self, choices):
+        return self.rng.choices([c[0] for c in choices], weights=[c[1] for c in choices])[0]
+
+    def clear(self):
+        """Remove previously generated employees (attendance/leave cascade) and admins"""
+        self.db.execute("DELETE FROM employees WHERE username LIKE %s", (self.EMPLOYEE_PREFIX + "%",))
+        self.db.execute("DELETE FROM admins WHERE username LIKE %s", (self.ADMIN_PREFIX + "%",))
+
+    def generate_admins(self, count):
+        rows = []
+        for n in range(count):
+            rows.append((self.rng.choice(self.FIRST_NAMES), "", self.rng.choice(self.LAST_NAMES),
+                         f"{self.ADMIN_PREFIX}{n}@example.com", f"0917{n:07d}",
+                         f"{self.ADMIN_PREFIX}{n}", self._password_hash, self._salt))
+        return self.db.execute_many("""
+                                    INSERT INTO admins
+                                    (first_name, middle_initial, last_name, email_address, phone_number,
+                                     username, password_hash, salt)
+                                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                                    """, rows, self.batch_size)
+
+    def generate_employees(self, count, start_date, end_date):
+        """
+        Insert `count` employees spread across the existing positions.
+
+        About 70% are hired before start_date, the rest during the range.
+
+        Returns:
+            List of dicts (id, position_id, date_hired, late_rate, absent_rate)
+        """
+        positions = self.db.query_all("SELECT id FROM positions ORDER BY id")
+        position_ids = [p['id'] for p in positions] or [1]
+        # Most staff in the first (general) position, the rest spread out
+        weights = [4] + [1] * (len(position_ids) - 1)
+        span = (end_date - start_date).days
+
+        rows = []
+        for n in range(count):
+            if self.rng.random() < 0.7:
+                hired = start_date - timedelta(days=self.rng.randint(0, 5 * 365))
+            else:
+                hired = start_date + timedelta(days=self.rng.randint(0, max(span, 0)))
+            first, last = self.rng.choice(self.FIRST_NAMES), self.rng.choice(self.LAST_NAMES)
+            rows.append((first, self.rng.choice("ABCDEFGHIJKLMNOPRSTV"), last,
+                         f"{self.EMPLOYEE_PREFIX}{n}@example.com", f"0918{n:07d}",
+                         f"{self.EMPLOYEE_PREFIX}{n}", self._password_hash, self._salt, hired,
+                         self.rng.choices(position_ids, weights=weights)[0]))
+
+        self.db.execute_many("""
+                             INSERT INTO employees
+                             (first_name, middle_initial, last_name, email_address, phone_number,
+                              username, password_hash, salt, date_hired, position_id)
+                             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                             """, rows, self.batch_size)
+
+        ids = self.db.query_all(
+            "SELECT id, username FROM employees WHERE username LIKE %s",
+            (self.EMPLOYEE_PREFIX + "%",)
+        )
+        id_by_username = {r['username']: r['id'] for r in ids}
+
+        employees = []
+        for row in rows:
+            employees.append({
+                'id': id_by_username[row[5]],
+                'date_hired': row[8],
+                'position_id': row[9],
+                # Per-person habits: most are punctual, a few chronically late/absent
+                'late_rate': min(0.6, self.rng.expovariate(1 / 0.08)),
+                'absent_rate': min(0.3, self.rng.expovariate(1 / 0.03)),
+            })
+        return employees
+
+    def _leave_for(self, employee, start_date, end_date):
+        """Leave requests for one employee; returns (rows, set of approved leave days)"""
+        rows, leave_days = [], set()
+        first = max(start_date, employee['date_hired'])
+        span = (end_date - first).days
+        if span <= 0:
+            return rows, leave_days
+        for _ in range(int(span / 365 * self.rng.uniform(1, 4)) + 1):
+            leave_start = first + timedelta(days=self.rng.randint(0, span))
+            leave_end = min(end_date, leave_start + timedelta(days=self.rng.choice([0, 0, 1, 2, 4])))
+            status = self._weighted(self.LEAVE_STATUSES)
+            leave_type = self._weighted(self.LEAVE_TYPES)
+            rows.append((employee['id'], leave_type, leave_start, leave_end, f"Generated {leave_type.lower()}", status))
+            if status == "Approved":
+                day = leave_start
+                while day <= leave_end:
+                    leave_days.add(day)
+                    day += timedelta(days=1)
+        return rows, leave_days
+
+    def _attendance_for(self, employee, start_date, end_date, leave_days, threshold):
+        """Weekday attendance rows for one employee"""
+        rows = []
+        late_at = datetime.combine(date(2000, 1, 1), threshold)
+        day = max(start_date, employee['date_hired'])
+        while day <= end_date:
+            if day.weekday() < 5:
+                roll = self.rng.random()
+                if day in leave_days or roll < employee['absent_rate']:
+                    # No punch: stored the way absent marking records it
+                    rows.append((employee['id'], None, None, day, "Absent"))
+                else:
+                    if roll < employee['absent_rate'] + employee['late_rate']:
+                        offset = self.rng.uniform(1, 90)  # minutes past the threshold
+                        status = "Late"
+                    else:
+                        offset = -self.rng.uniform(0, 45)
+                        status = "Present"
+                    clock_in = datetime.combine(day, (late_at + timedelta(minutes=offset)).time())
+                    clock_out = clock_in + timedelta(hours=8, minutes=self.rng.uniform(0, 120))
+                    rows.append((employee['id'], clock_in.replace(microsecond=0),
+                                 clock_out.replace(microsecond=0), day, status))
+            day += timedelta(days=1)
+        return rows
+
+    def generate(self, employees=500, years=2, admins=3, end_date=None, progress=None):
+        """
+        Replace the generated dataset
+
+        Args:
+            employees: Number of employees
+            years: Years of attendance history ending at end_date
+            admins: Number of admin accounts
+            end_date: Last attendance date (default: DEFAULT_END_DATE)
+            progress: Optional callback(done_employees, total_employees)
+
+        Returns:
+            Dictionary of row counts per table
+        """
+        end_date = end_date or self.DEFAULT_END_DATE
+        start_date = end_date - timedelta(days=int(years * 365) - 1)
+        print(f"[Generator] seed={self.seed}: {employees} employees, {admins} admins, "
+              f"attendance {start_date} to {end_date}")
+
+        self.clear()
+        before = self.db.query_one("SELECT COALESCE(MAX(id), 0) AS max_id FROM attendance_changes")['max_id']
+
+        counts = {'admins': self.generate_admins(admins)}
+        staff = self.generate_employees(employees, start_date, end_date)
+        counts['employees'] = len(staff)
+        counts['attendance'] = 0
+        counts['leave_requests'] = 0
+
+        PositionRulesCache.invalidate()
+        attendance, leave = [], []
+        for n, employee in enumerate(staff, 1):
+            leave_rows, leave_days = self._leave_for(employee, start_date, end_date)
+            leave.extend(leave_rows)
+            attendance.extend(self._attendance_for(employee, start_date, end_date, leave_days,
+                                                   PositionRulesCache.get_threshold(employee['position_id'])))
+
+            if len(attendance) >= self.batch_size or n == len(staff):
+                counts['attendance'] += self.db.execute_many(
+                    "INSERT INTO attendance (employee_id, clock_in, clock_out, date, status) VALUES (%s, %s, %s, %s, %s)",
+                    attendance, self.batch_size
+                )
+                counts['leave_requests'] += self.db.execute_many("""
+                    INSERT INTO leave_requests (employee_id, leave_type, start_date, end_date, reason, status)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """, leave, self.batch_size)
+                attendance, leave = [], []
+                if progress:
+                    progress(n, len(staff))
+
+        # The bulk load is a fresh baseline, not a set of edits: drop the
+        # change-log rows it produced and rebuild the running totals once
+        self.db.execute("DELETE FROM attendance_changes WHERE id > %s", (before,))
+        CumulativeTotals.rebuild_all()
+
+        print(f"[Generator] Loaded {counts}")
+        return counts
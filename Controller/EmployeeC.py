@@ -1,7 +1,10 @@
 import secrets
-from datetime import date
 from Project.Model.Database import Database
 from Project.Model.Employee import Employee
+from Project.Model.AttendanceChanges import AttendanceChanges
+from Project.Controller.PositionRulesCache import PositionRulesCache
+from Project.Controller.LiveDayCounters import LiveDayCounters
+from Project.Controller.Clock import Clock
 
 
 class EmployeeController:
@@ -72,8 +75,9 @@ class EmployeeController:
         db.execute(query, (
             data['first_name'], data.get('middle_initial', ''), data['last_name'],
             data['email_address'], data['phone_number'], data['username'],
-            pw_hash, salt.hex(), date.today(), data.get('position_id', 1)
+            pw_hash, salt.hex(), Clock.get().today(), data.get('position_id', 1)
         ))
+        LiveDayCounters.seed(Clock.get().today())
 
     @staticmethod
     def update_employee(emp_id, data):
@@ -100,10 +104,16 @@ class EmployeeController:
 
         params.append(emp_id)
         db.execute(f"UPDATE employees SET {', '.join(updates)} WHERE id = %s", tuple(params))
+        PositionRulesCache.invalidate_employee(emp_id)
 
     @staticmethod
     def delete_employee(emp_id):
+        # The attendance cascade doesn't fire triggers; log the cells first
+        AttendanceChanges.record_employee(emp_id)
         Database.get().execute("DELETE FROM employees WHERE id = %s", (emp_id,))
+        PositionRulesCache.invalidate_employee(emp_id)
+        # Today's attendance rows were cascade-deleted with the employee
+        LiveDayCounters.seed(Clock.get().today())
 
     @staticmethod
     def _check_duplicates(u, e, p, exclude=None):
@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobExecutor:
+    """
+    Bounded background executor for heavy jobs (absent marking, reports).
+
+    submit() returns a Future. A job submitted again while an identical one
+    (same key) is still pending or running gets the existing Future instead
+    of a second run, so repeated button presses don't pile work onto the
+    database.
+
+    Completion is reported to listeners registered with add_listener();
+    the executor itself has no Qt dependency, so headless schedulers can
+    use it (the GUI bridges it to a Qt signal in MainController).
+    """
+
+    MAX_WORKERS = 2
+
+    _lock = threading.Lock()
+    _pool = None
+    _pending = {}  # key -> Future
+    _durations = {}  # key -> duration of the run that just finished
+    _listeners = []
+
+    @classmethod
+    def add_listener(cls, callback):
+        """
+        Call callback(key, info) whenever a job finishes
+
+        Runs on the worker thread. info has: key, success, duration_ms,
+        rows, result, error
+        """
+        with cls._lock:
+            if callback not in cls._listeners:
+                cls._listeners.append(callback)
+
+    @classmethod
+    def remove_listener(cls, callback):
+        with cls._lock:
+            if callback in cls._listeners:
+                cls._listeners.remove(callback)
+
+    @classmethod
+    def submit(cls, key, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on the pool unless `key` is already pending
+
+        Args:
+            key: Identity of the job used for de-duplication
+            func: Callable to run; a dict result with a 'rows' entry is
+                reported as the job's row count
+
+        Returns:
+            concurrent.futures.Future of the job's result
+        """
+        with cls._lock:
+            existing = cls._pending.get(key)
+            if existing is not None and not existing.done():
+                print(f"[JobExecutor] '{key}' already queued, reusing pending run")
+                return existing
+
+            if cls._pool is None:
+                cls._pool = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="job")
+            future = cls._pool.submit(cls._run, key, func, args, kwargs)
+            cls._pending[key] = future
+
+        future.add_done_callback(lambda f: cls._finished(key, f))
+        return future
+
+    @classmethod
+    def _run(cls, key, func, args, kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            with cls._lock:
+                cls._durations[key] = duration_ms
+            print(f"[JobExecutor] '{key}' finished in {duration_ms} ms")
+
+    @classmethod
+    def _finished(cls, key, future):
+        with cls._lock:
+            if cls._pending.get(key) is future:
+                del cls._pending[key]
+            duration_ms = cls._durations.pop(key, None)
+            listeners = list(cls._listeners)
+
+        info = {'key': key, 'success': False, 'duration_ms': duration_ms, 'rows': None, 'result': None,
+                'error': None}
+        if future.cancelled():
+            info['error'] = "Cancelled"
+        elif future.exception() is not None:
+            info['error'] = str(future.exception()) or future.exception().__class__.__name__
+        else:
+            result = future.result()
+            info['result'] = result
+            if isinstance(result, dict):
+                info['success'] = bool(result.get('success', True))
+                info['rows'] = result.get('rows')
+                info['error'] = result.get('error')
+            else:
+                info['success'] = result is not False
+        for listener in listeners:
+            try:
+                listener(key, info)
+            except Exception as e:
+                print(f"[JobExecutor] Listener error for '{key}': {e}")
+
+    @classmethod
+    def is_pending(cls, key):
+        with cls._lock:
+            future = cls._pending.get(key)
+            return future is not None and not future.done()
+
+    @classmethod
+    def shutdown(cls, wait=False):
+        """Stop accepting jobs; queued jobs that haven't started are cancelled"""
+        with cls._lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
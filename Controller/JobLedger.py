@@ -0,0 +1,124 @@
+from Project.Model.Database import Database
+from Project.Model.SchedulerRuns import SchedulerRuns
+from Project.Controller.Clock import Clock
+
+
+class JobLedger:
+    """
+    Records scheduler job runs in scheduler_runs.
+
+    Each run is keyed by job and target period, so a period is marked done
+    once it has succeeded and the scheduler can tell which periods were
+    missed while the application was closed. 'early' runs (started by hand
+    before the period's scheduled time) never mark it done.
+    """
+
+    @staticmethod
+    def begin(job, target_start, target_end, scheduled_for, run_type='scheduled'):
+        """
+        Mark a run as started (re-running a period reuses its row)
+
+        Args:
+            run_type: 'scheduled', 'manual' or 'early'
+
+        Returns:
+            Run ID
+        """
+        db = Database.get()
+        db.execute("""
+                   INSERT INTO scheduler_runs
+                   (job, target_start, target_end, scheduled_for, started_at, status, run_type)
+                   VALUES (%s, %s, %s, %s, NOW(), 'running', %s)
+                   ON DUPLICATE KEY UPDATE
+                       scheduled_for = VALUES(scheduled_for),
+                       run_type = VALUES(run_type),
+                       started_at = NOW(),
+                       finished_at = NULL,
+                       duration_ms = NULL,
+                       rows_affected = NULL,
+                       status = 'running',
+                       error = NULL
+                   """, (job, target_start, target_end, scheduled_for, run_type))
+        # Looked up by key: the insert id isn't portable across backends for updated rows
+        row = db.query_one("""
+                           SELECT id FROM scheduler_runs
+                           WHERE job = %s AND target_start = %s AND target_end = %s
+                           """, (job, target_start, target_end))
+        return row['id']
+
+    @staticmethod
+    def finish(run_id, duration_ms, rows_affected=None, error=None):
+        """Record the outcome of a run"""
+        db = Database.get()
+        db.execute("""
+                   UPDATE scheduler_runs
+                   SET finished_at   = NOW(),
+                       duration_ms   = %s,
+                       rows_affected = %s,
+                       status        = %s,
+                       error         = %s
+                   WHERE id = %s
+                   """, (duration_ms, rows_affected, 'failed' if error else 'success', error, run_id))
+
+    @staticmethod
+    def tracking_since():
+        """When the ledger was created (None if the table is missing)"""
+        db = Database.get()
+        try:
+            # The column itself rather than MIN(): SQLite types results by declared column
+            row = db.query_one(
+                "SELECT scheduled_for AS since FROM scheduler_runs WHERE job = %s ORDER BY scheduled_for LIMIT 1",
+                (SchedulerRuns.LEDGER_JOB,)
+            )
+        except Exception as e:
+            print(f"[JobLedger] Ledger unavailable: {e}")
+            return None
+        return row['since'] if row and row['since'] else Clock.get().now()
+
+    @staticmethod
+    def succeeded_targets(job, since_date):
+        """Set of (target_start, target_end) completed for periods ending on or after `since_date`"""
+        db = Database.get()
+        rows = db.query_all("""
+                            SELECT target_start, target_end
+                            FROM scheduler_runs
+                            WHERE job = %s
+                              AND status = 'success'
+                              AND run_type <> 'early'
+                              AND target_end >= %s
+                            """, (job, since_date))
+        return {(r['target_start'], r['target_end']) for r in rows}
+
+    @staticmethod
+    def last_runs():
+        """Latest successful scheduled time per job"""
+        db = Database.get()
+        try:
+            rows = db.query_all("""
+                                SELECT r.job, r.scheduled_for AS last_run
+                                FROM scheduler_runs r
+                                WHERE r.status = 'success'
+                                  AND r.job <> %s
+                                  AND r.scheduled_for = (SELECT MAX(s.scheduled_for)
+                                                         FROM scheduler_runs s
+                                                         WHERE s.job = r.job
+                                                           AND s.status = 'success')
+                                """, (SchedulerRuns.LEDGER_JOB,))
+        except Exception as e:
+            print(f"[JobLedger] Error reading last runs: {e}")
+            return {}
+        return {r['job']: r['last_run'] for r in rows}
+
+    @staticmethod
+    def get_recent_runs(limit=50):
+        db = Database.get()
+        try:
+            return db.query_all("""
+                                SELECT * FROM scheduler_runs
+                                WHERE job <> %s
+                                ORDER BY scheduled_for DESC, id DESC
+                                LIMIT %s
+                                """, (SchedulerRuns.LEDGER_JOB, limit))
+        except Exception as e:
+            print(f"[JobLedger] Error getting runs: {e}")
+            return []
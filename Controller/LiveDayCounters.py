@@ -0,0 +1,126 @@
+from Project.Model.Database import Database
+
+
+class LiveDayCounters:
+    """
+    Per-day attendance counters kept in attendance_daily_counters.
+
+    The row for a day is seeded once from a single aggregate and then
+    incremented server-side by clock-in, clock-out and absent marking, so
+    every running instance reads the same O(1) primary-key row instead of
+    re-aggregating attendance.
+    """
+
+    STATUS_COLUMNS = {
+        'Present': 'present',
+        'Late': 'late',
+        'Absent': 'absent'
+    }
+
+    _AGGREGATE = """
+                 SELECT (SELECT COUNT(*) FROM employees)                   as total_employees,
+                        COALESCE(SUM(status = 'Present'), 0)               as present,
+                        COALESCE(SUM(status = 'Late'), 0)                  as late,
+                        COALESCE(SUM(status = 'Absent'), 0)                as absent,
+                        COALESCE(SUM(clock_out IS NOT NULL), 0)            as clocked_out
+                 FROM attendance
+                 WHERE date = %s
+                 """
+
+    @classmethod
+    def seed(cls, day):
+        """
+        (Re)compute the counters for a day from attendance and persist them
+
+        Returns:
+            Counter dictionary, or None if seeding failed
+        """
+        db = Database.get()
+        try:
+            db.execute("""
+                       INSERT INTO attendance_daily_counters
+                           (date, total_employees, present, late, absent, clocked_out)
+                       SELECT %s, agg.total_employees, agg.present, agg.late, agg.absent, agg.clocked_out
+                       FROM (""" + cls._AGGREGATE + """) agg
+                       ON DUPLICATE KEY UPDATE
+                           total_employees = VALUES(total_employees),
+                           present = VALUES(present),
+                           late = VALUES(late),
+                           absent = VALUES(absent),
+                           clocked_out = VALUES(clocked_out)
+                       """, (day, day))
+        except Exception as e:
+            print(f"[Counters] Error seeding counters for {day}: {e}")
+            return None
+        return cls.get(day)
+
+    @classmethod
+    def get(cls, day):
+        """
+        Read the counters for a day (read-only).
+
+        If the day hasn't been seeded yet the values are aggregated on the
+        fly without writing anything.
+        """
+        db = Database.get()
+        row = db.query_one(
+            "SELECT total_employees, present, late, absent, clocked_out FROM attendance_daily_counters WHERE date = %s",
+            (day,)
+        )
+        if row is None:
+            row = db.query_one(cls._AGGREGATE, (day,))
+        return {key: int(row[key] or 0) for key in ('total_employees', 'present', 'late', 'absent', 'clocked_out')}
+
+    @classmethod
+    def resync_range(cls, start_date, end_date):
+        """Recompute already-seeded counter rows in a date range from attendance"""
+        db = Database.get()
+        try:
+            db.execute("""
+                       UPDATE attendance_daily_counters c
+                           JOIN (SELECT date,
+                                        SUM(status = 'Present')     as present,
+                                        SUM(status = 'Late')        as late,
+                                        SUM(status = 'Absent')      as absent,
+                                        SUM(clock_out IS NOT NULL)  as clocked_out
+                                 FROM attendance
+                                 WHERE date BETWEEN %s AND %s
+                                 GROUP BY date) a ON a.date = c.date
+                       SET c.present     = a.present,
+                           c.late        = a.late,
+                           c.absent      = a.absent,
+                           c.clocked_out = a.clocked_out
+                       """, (start_date, end_date))
+        except Exception as e:
+            print(f"[Counters] Error resyncing {start_date} to {end_date}: {e}")
+
+    @classmethod
+    def _increment(cls, day, column, amount=1):
+        """Atomically bump one counter; seed the day if it has no row yet"""
+        if amount == 0:
+            return
+        db = Database.get()
+        try:
+            cur = db.execute(
+                f"UPDATE attendance_daily_counters SET {column} = {column} + %s WHERE date = %s",
+                (amount, day)
+            )
+            if cur.rowcount == 0:
+                # The seed aggregate already includes the change being recorded
+                cls.seed(day)
+        except Exception as e:
+            print(f"[Counters] Error updating {column} for {day}: {e}")
+
+    @classmethod
+    def record_clock_in(cls, day, status):
+        column = cls.STATUS_COLUMNS.get(status)
+        if column:
+            cls._increment(day, column)
+
+    @classmethod
+    def record_clock_out(cls, day):
+        cls._increment(day, 'clocked_out')
+
+    @classmethod
+    def record_absent(cls, day, count):
+        cls._increment(day, 'absent', count)
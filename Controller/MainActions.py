@@ -0,0 +1,156 @@
+from Project.Controller.EmployeeC import EmployeeController
+from Project.Controller.ReportsC import ReportController
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.RequestC import LeaveRequestController
+from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.PositionC import PositionController
+from Project.Model.Admin import Admin
+from Project.Model.Employee import Employee
+from Project.Model.QueryBudget import QueryBudget
+
+
+class MainActions:
+    """
+    Database work behind the admin window's pages and dialogs.
+
+    MainController shows the widgets and dialogs; everything it sends to
+    the database goes through one of these calls, each under the budget of
+    its UI action (see QueryBudget). Kept free of Qt so the budgets can be
+    checked without a display.
+    """
+
+    # Statements each UI action may send. Dialog actions budget only their
+    # database work, never the time a dialog is open.
+    REFRESH_DASHBOARD_BUDGET = 3
+    REFRESH_EMPLOYEES_BUDGET = 1
+    REFRESH_REPORTS_BUDGET = 3
+    REFRESH_REQUESTS_BUDGET = 1
+    LOGIN_BUDGET = 2
+    DIALOG_OPEN_BUDGET = 1  # position list of the add/edit employee dialogs
+    ADD_EMPLOYEE_BUDGET = 4  # duplicate check, insert, today's counters re-seed
+    EDIT_EMPLOYEE_BUDGET = 1
+    DELETE_EMPLOYEE_BUDGET = 4
+    CREDENTIALS_BUDGET = 2
+    THEME_BUDGET = 1
+    DETAILS_BUDGET = 1
+
+    # --- PAGE LOADS (run on the PageLoader pool) ---
+
+    @staticmethod
+    @QueryBudget.limit(REFRESH_DASHBOARD_BUDGET, name="MainController.refresh_dashboard")
+    def fetch_dashboard():
+        """
+        Returns:
+            (today's stats, recent attendance rows formatted for the table)
+        """
+        # Get today's attendance stats
+        stats = AttendanceController.get_today_stats()
+
+        # Get attendance records for table with full details
+        records = AttendanceController.get_recent_attendance(50)
+
+        # Format records for the table
+        formatted_records = []
+        for record in records:
+            formatted_records.append({
+                'employee_id': record.get('employee_id'),
+                'employee_name': record.get('employee_name'),
+                'position': record.get('position_name', 'Staff'),
+                'email': record.get('email_address', 'N/A'),
+                'phone': record.get('phone_number', 'N/A'),
+                'status': record.get('status'),
+                'clock_in': record.get('clock_in').strftime('%I:%M %p') if record.get('clock_in') else '-',
+                'clock_out': record.get('clock_out').strftime('%I:%M %p') if record.get('clock_out') else '-'
+            })
+        return stats, formatted_records
+
+    @staticmethod
+    @QueryBudget.limit(REFRESH_EMPLOYEES_BUDGET, name="MainController.refresh_employees")
+    def fetch_employees():
+        return EmployeeController.list_employees()
+
+    @staticmethod
+    @QueryBudget.limit(REFRESH_REPORTS_BUDGET, name="MainController.refresh_reports")
+    def fetch_reports():
+        """
+        Returns:
+            (daily, 15-day, monthly) report lists
+        """
+        return (ReportController.get_report_history(),
+                ReportController.get_15day_reports(),
+                ReportController.get_monthly_reports())
+
+    @staticmethod
+    @QueryBudget.limit(REFRESH_REQUESTS_BUDGET, name="MainController.refresh_requests")
+    def fetch_requests(status_filter):
+        return LeaveRequestController.get_all_requests(status_filter)
+
+    # --- ACTIONS ---
+
+    @staticmethod
+    @QueryBudget.limit(DIALOG_OPEN_BUDGET, name="MainController.open_employee_dialog")
+    def employee_dialog_positions():
+        """Positions for the add/edit employee dialogs (empty if they can't be read)"""
+        try:
+            return PositionController.get_all_positions()
+        except Exception as e:
+            print(f"[MainActions] Error loading positions: {e}")
+            return []
+
+    @staticmethod
+    @QueryBudget.limit(LOGIN_BUDGET, name="MainController.on_login")
+    def login(username, password):
+        """
+        Returns:
+            (admin, employee); at most one is set
+        """
+        admin = Admin.authenticate(username, password)
+        employee = None if admin else Employee.authenticate(username, password)
+        return admin, employee
+
+    @staticmethod
+    @QueryBudget.limit(ADD_EMPLOYEE_BUDGET, name="MainController.on_add_employee")
+    def add_employee(data):
+        EmployeeController.add_employee(data)
+
+    @staticmethod
+    @QueryBudget.limit(EDIT_EMPLOYEE_BUDGET, name="MainController.on_edit_employee")
+    def update_employee(emp_id, data):
+        EmployeeController.update_employee(emp_id, data)
+
+    @staticmethod
+    @QueryBudget.limit(DELETE_EMPLOYEE_BUDGET, name="MainController.on_delete_employee")
+    def delete_employee(emp_id):
+        EmployeeController.delete_employee(emp_id)
+
+    @staticmethod
+    @QueryBudget.limit(CREDENTIALS_BUDGET, name="MainController.on_credentials_change")
+    def change_credentials(admin_id, current_password, new_username, new_password):
+        """
+        Returns:
+            False if the current password is wrong (nothing is changed)
+        """
+        if not Admin.verify_password(admin_id, current_password):
+            return False
+        Admin.update_credentials(admin_id, new_username, new_password)
+        return True
+
+    @staticmethod
+    @QueryBudget.limit(THEME_BUDGET, name="MainController.on_theme_change")
+    def update_theme(admin_id, theme):
+        Admin.update_theme(admin_id, theme)
+
+    @staticmethod
+    @QueryBudget.limit(DETAILS_BUDGET, name="MainController.show_report_details")
+    def daily_details(report_date):
+        return ReportController.get_attendance_details_by_date(report_date)
+
+    @staticmethod
+    @QueryBudget.limit(DETAILS_BUDGET, name="MainController.on_report_row_click")
+    def details_for_15day(start_date, end_date):
+        return PeriodicReportsController.get_details_for_15day(start_date, end_date)
+
+    @staticmethod
+    @QueryBudget.limit(DETAILS_BUDGET, name="MainController.on_report_row_click")
+    def details_for_month(year, month):
+        return PeriodicReportsController.get_details_for_month(year, month)
@@ -1,24 +1,48 @@
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
 from Project.View.Dialogs import AddEmployeeDialog, ChangeCredentialsDialog, CompactMessageDialog, EditEmployeeDialog
 # Import Controllers
-from Project.Controller.EmployeeC import EmployeeController
-from Project.Controller.ReportsC import ReportController
 from Project.Controller.AttendanceC import AttendanceController
-from Project.Controller.RequestC import LeaveRequestController
+from Project.Controller.MainActions import MainActions
+from Project.Controller.JobExecutor import JobExecutor
+from Project.Controller.PageLoader import PageLoader
 # Import Models
-from Project.Model.Admin import Admin
-from Project.Model.Employee import Employee
+from Project.Model.QueryBudget import QueryBudget
+
+
+class JobSignals(QObject):
+    """
+    Qt bridge for JobExecutor completion.
+
+    job_finished(key, info) is emitted from the worker thread; slots
+    connected from the GUI thread receive it there (queued connection).
+    """
+    job_finished = pyqtSignal(str, dict)
 
 
 class MainController:
+    # Database work goes through MainActions, which carries each action's
+    # budget; refresh_* may not send any statement on the GUI thread.
+    GUI_REFRESH_BUDGET = 0
+
     def __init__(self, main_window):
         self.main_window = main_window
         self.current_admin_id = None
         self.db_connected = False
+        self.loader = PageLoader()
+        self.job_signals = JobSignals()
+        self.job_signals.job_finished.connect(self.on_job_finished)
+        # Keep the exact callable so shutdown() can unregister it
+        self._job_listener = self.job_signals.job_finished.emit
+        JobExecutor.add_listener(self._job_listener)
 
     def set_db_connected(self, connected):
         self.db_connected = connected
 
+    def shutdown(self):
+        """Drop pending page loads before the application exits"""
+        JobExecutor.remove_listener(self._job_listener)
+        self.loader.shutdown()
+
     def on_login(self, username, password, login_page):
         if not username or not password:
             CompactMessageDialog.show_warning(self.main_window, "Error", "Please enter username and password.")
@@ -26,8 +50,9 @@ class MainController:
 
         if self.db_connected:
             try:
-                # --- 1. TRY ADMIN LOGIN ---
-                admin = Admin.authenticate(username, password)
+                admin, employee = MainActions.login(username, password)
+
+                # --- 1. ADMIN LOGIN ---
                 if admin:
                     self.current_admin_id = admin.get("id")
                     # Update Theme
@@ -62,8 +87,7 @@ class MainController:
 
                     return True
 
-                # --- 2. TRY EMPLOYEE LOGIN ---
-                employee = Employee.authenticate(username, password)
+                # --- 2. EMPLOYEE LOGIN ---
                 if employee:
                     login_page.clear_fields()
 
@@ -113,16 +137,23 @@ class MainController:
             return False
 
     # --- REFRESH METHODS ---
+    # The queries run on the PageLoader pool (MainActions.fetch_*);
+    # refresh_* only schedules the load and fills widgets.
 
+    def _load_page(self, key, page, fetch, on_loaded, on_failed):
+        """Fetch in the background, superseding loads for other pages"""
+        self.loader.cancel_others(key)
+        self.loader.load(key, fetch, on_loaded, on_failed, on_busy=getattr(page, 'set_loading', None))
+
+    @QueryBudget.limit(GUI_REFRESH_BUDGET)
     def refresh_dashboard(self, dashboard_page):
         """Refresh dashboard with latest attendance data"""
         if not self.db_connected:
             print("[MainC] Skipping dashboard refresh - DB not connected")
             return
 
-        try:
-            # Get today's attendance stats
-            stats = AttendanceController.get_today_stats()
+        def show(data):
+            stats, formatted_records = data
 
             # Extract stats
             total = stats.get('total', 0)
@@ -134,65 +165,40 @@ class MainController:
 
             # Update stat cards and pie chart
             dashboard_page.update_stats(total, clocked_in, not_clocked_in)
-
-            # Get attendance records for table with full details
-            records = AttendanceController.get_recent_attendance(50)
-
-            # Format records for the table
-            formatted_records = []
-            for record in records:
-                formatted_records.append({
-                    'employee_id': record.get('employee_id'),
-                    'employee_name': record.get('employee_name'),
-                    'position': record.get('position_name', 'Staff'),
-                    'email': record.get('email_address', 'N/A'),
-                    'phone': record.get('phone_number', 'N/A'),
-                    'status': record.get('status'),
-                    'clock_in': record.get('clock_in').strftime('%I:%M %p') if record.get('clock_in') else '-',
-                    'clock_out': record.get('clock_out').strftime('%I:%M %p') if record.get('clock_out') else '-'
-                })
-
             dashboard_page.populate_attendance_table(formatted_records)
 
             print(f"[Dashboard] Refreshed successfully with {len(formatted_records)} records")
 
-        except Exception as e:
-            print(f"[Dashboard] Refresh error: {e}")
-            import traceback
-            traceback.print_exc()
+        def show_error(error):
+            print(f"[Dashboard] Refresh error: {error}")
 
             # Show at least something if there's an error
             dashboard_page.update_stats(0, 0, 0)
             dashboard_page.populate_attendance_table([])
 
+        self._load_page('dashboard', dashboard_page, MainActions.fetch_dashboard, show, show_error)
+
+    @QueryBudget.limit(GUI_REFRESH_BUDGET)
     def refresh_employees(self, employees_page):
         if not self.db_connected: return
-        try:
-            emp_list = EmployeeController.list_employees()
-            employees_page.populate_table(emp_list)
-        except Exception as e:
-            print(f"[MainController] Error refreshing employees: {e}")
+        self._load_page('employees', employees_page, MainActions.fetch_employees, employees_page.populate_table,
+                        lambda error: print(f"[MainController] Error refreshing employees: {error}"))
 
+    @QueryBudget.limit(GUI_REFRESH_BUDGET)
     def refresh_reports(self, reports_page):
         if not self.db_connected: return
-        try:
-            # 1. Load Daily
-            daily = ReportController.get_report_history()
-            reports_page.populate_table(daily)
 
-            # 2. Load 15-Day
-            periodic_15 = ReportController.get_15day_reports()
+        def show(data):
+            daily, periodic_15, monthly = data
+            reports_page.populate_table(daily)
             reports_page.populate_15day(periodic_15)
-
-            # 3. Load Monthly
-            monthly = ReportController.get_monthly_reports()
             reports_page.populate_monthly(monthly)
 
             # Wire click event (UPDATED to handle type)
             reports_page.on_report_clicked = self.on_report_row_click
 
-        except Exception as e:
-            print(f"[MainController] Error refreshing reports: {e}")
+        self._load_page('reports', reports_page, MainActions.fetch_reports, show,
+                        lambda error: print(f"[MainController] Error refreshing reports: {error}"))
 
     def on_report_row_click(self, r_type, data):
         """Handle clicks from any report table"""
@@ -203,15 +209,13 @@ class MainController:
 
             elif r_type == '15day':
                 # Data is dict {start, end}
-                from Project.Controller.PeriodicReportsC import PeriodicReportsController
-                details = PeriodicReportsController.get_details_for_15day(data['start'], data['end'])
+                details = MainActions.details_for_15day(data['start'], data['end'])
                 title = f"15-Day Report ({data['start']} to {data['end']})"
                 self.show_periodic_details(title, details)
 
             elif r_type == 'monthly':
                 # Data is dict {year, month}
-                from Project.Controller.PeriodicReportsC import PeriodicReportsController
-                details = PeriodicReportsController.get_details_for_month(data['year'], data['month'])
+                details = MainActions.details_for_month(data['year'], data['month'])
                 import calendar
                 m_name = calendar.month_name[data['month']]
                 title = f"Monthly Report - {m_name} {data['year']}"
@@ -231,22 +235,23 @@ class MainController:
         dialog = PeriodicReportDetails(title, data, self.main_window)
         dialog.exec()
 
+    @QueryBudget.limit(GUI_REFRESH_BUDGET)
     def refresh_requests(self, requests_page):
         if not self.db_connected: return
-        try:
-            requests_page.load_data()
-        except Exception as e:
-            print(f"[MainController] Error refreshing requests: {e}")
+        status_filter = requests_page.get_status_filter()
+        self._load_page('requests', requests_page, lambda: MainActions.fetch_requests(status_filter),
+                        requests_page.show_requests,
+                        lambda error: print(f"[MainController] Error refreshing requests: {error}"))
 
     # --- ACTIONS ---
 
     def on_add_employee(self, employees_page):
         if not self.db_connected: return False
         try:
-            dialog = AddEmployeeDialog(self.main_window)
+            dialog = AddEmployeeDialog(self.main_window, positions=MainActions.employee_dialog_positions())
             if dialog.exec() and dialog.employee_data:
                 try:
-                    EmployeeController.add_employee(dialog.employee_data)
+                    MainActions.add_employee(dialog.employee_data)
                     CompactMessageDialog.show_success(self.main_window, "Success", "Employee added!")
                     self.refresh_employees(employees_page)
                     return True
@@ -261,10 +266,11 @@ class MainController:
     def on_edit_employee(self, employee_data):
         if not self.db_connected: return False
         try:
-            dialog = EditEmployeeDialog(employee_data, self.main_window)
+            dialog = EditEmployeeDialog(employee_data, self.main_window,
+                                        positions=MainActions.employee_dialog_positions())
             if dialog.exec() and dialog.updated_data:
                 try:
-                    EmployeeController.update_employee(dialog.updated_data["employee_id"], dialog.updated_data)
+                    MainActions.update_employee(dialog.updated_data["employee_id"], dialog.updated_data)
                     CompactMessageDialog.show_success(self.main_window, "Success", "Updated successfully!")
                     return True
                 except Exception as e:
@@ -278,7 +284,7 @@ class MainController:
     def on_delete_employee(self, employee_id):
         if not self.db_connected: return False
         try:
-            EmployeeController.delete_employee(employee_id)
+            MainActions.delete_employee(employee_id)
             CompactMessageDialog.show_success(self.main_window, "Success", "Employee deleted.")
             return True
         except Exception as e:
@@ -291,14 +297,15 @@ class MainController:
             if dialog.exec() and dialog.credentials_data:
                 if not self.db_connected: return False
                 try:
-                    if not Admin.verify_password(self.current_admin_id, dialog.credentials_data["current"]):
-                        CompactMessageDialog.show_warning(self.main_window, "Error", "Current password incorrect.")
-                        return False
-                    Admin.update_credentials(
+                    verified = MainActions.change_credentials(
                         self.current_admin_id,
+                        dialog.credentials_data["current"],
                         dialog.credentials_data["username"],
                         dialog.credentials_data["password"]
                     )
+                    if not verified:
+                        CompactMessageDialog.show_warning(self.main_window, "Error", "Current password incorrect.")
+                        return False
                     CompactMessageDialog.show_success(self.main_window, "Success",
                                                       "Credentials updated. Please login again.")
                     self.current_admin_id = None  # Force logout
@@ -314,7 +321,7 @@ class MainController:
     def on_theme_change(self, theme):
         if self.db_connected and self.current_admin_id:
             try:
-                Admin.update_theme(self.current_admin_id, theme)
+                MainActions.update_theme(self.current_admin_id, theme)
             except Exception as e:
                 print(f"[MainC] Theme update error: {e}")
         self.main_window.apply_theme(theme)
@@ -355,7 +362,7 @@ class MainController:
 
         try:
             # Get detailed data
-            details = ReportController.get_attendance_details_by_date(report_date)
+            details = MainActions.daily_details(report_date)
             if details:
                 # Format date for display
                 date_str = report_date.strftime("%Y-%m-%d") if hasattr(report_date, 'strftime') else str(report_date)
@@ -372,42 +379,65 @@ class MainController:
             CompactMessageDialog.show_warning(self.main_window, "Error", f"Failed to load report: {str(e)}")
 
     def on_scheduler_task(self, task_name):
-            """Handle manual scheduler task execution"""
-            try:
-                from Project.Controller.DailyScheduler import run_task_now
+        """Queue a manual scheduler task; the result arrives via on_job_finished"""
+        try:
+            from Project.Controller.DailyScheduler import run_task_now
 
-                print(f"[MainC] Running scheduler task: {task_name}")
-                run_task_now(task_name)
+            print(f"[MainC] Running scheduler task: {task_name}")
+            run_task_now(task_name)
+
+        except Exception as e:
+            print(f"[MainC] Scheduler task error: {e}")
+            import traceback
+            traceback.print_exc()
+            CompactMessageDialog.show_warning(
+                self.main_window,
+                "Error",
+                f"Failed to run task: {str(e)}"
+            )
 
-                task_display = "Absent Marking" if task_name == "absent" else "Report Generation"
-                CompactMessageDialog.show_success(
-                    self.main_window,
-                    "Task Completed",
-                    f"{task_display} task executed successfully!"
-                )
+    TASK_DISPLAY_NAMES = {
+        'scheduler.absent': "Absent Marking",
+        'scheduler.daily_report': "Daily Report Generation",
+        'scheduler.15day_report': "15-Day Report Generation",
+        'scheduler.monthly_report': "Monthly Report Generation",
+    }
+
+    def on_job_finished(self, key, info):
+        """Report a finished background job and refresh the visible page once"""
+        task_display = self.TASK_DISPLAY_NAMES.get(key)
+        if task_display is None:
+            return
 
-                # Refresh dashboard if it's the current page
-                current_index = self.main_window.stack.currentIndex()
-                if current_index == 1:  # Dashboard
-                    self.refresh_dashboard(self.main_window.stack.widget(1))
-                elif current_index == 3:  # Reports
-                    self.refresh_reports(self.main_window.stack.widget(3))
+        if info.get('success'):
+            details = [f"{info.get('duration_ms') or 0} ms"]
+            if info.get('rows') is not None:
+                details.insert(0, f"{info['rows']} rows")
+            CompactMessageDialog.show_success(
+                self.main_window,
+                "Task Completed",
+                f"{task_display} task executed successfully! ({', '.join(details)})"
+            )
+        else:
+            CompactMessageDialog.show_warning(
+                self.main_window,
+                "Error",
+                f"{task_display} failed: {info.get('error') or 'Unknown error'}"
+            )
 
-            except Exception as e:
-                print(f"[MainC] Scheduler task error: {e}")
-                import traceback
-                traceback.print_exc()
-                CompactMessageDialog.show_warning(
-                    self.main_window,
-                    "Error",
-                    f"Failed to run task: {str(e)}"
-                )
+        current_index = self.main_window.stack.currentIndex()
+        if current_index == 1:  # Dashboard
+            self.refresh_dashboard(self.main_window.stack.widget(1))
+        elif current_index == 3:  # Reports
+            self.refresh_reports(self.main_window.stack.widget(3))
 
+    @QueryBudget.limit(GUI_REFRESH_BUDGET)
     def refresh_settings(self, settings_page):
         """Refresh settings page with scheduler status"""
         try:
             from Project.Controller.DailyScheduler import get_status
             status = get_status()
-            settings_page.update_scheduler_status(status)
+            if hasattr(settings_page, 'update_scheduler_status'):
+                settings_page.update_scheduler_status(status)
         except Exception as e:
             print(f"[MainC] Error refreshing settings: {e}")
\ No newline at end of file
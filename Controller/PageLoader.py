@@ -0,0 +1,140 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class LoadSignals(QObject):
+    """
+    Qt bridge for page loads.
+
+    Emitted from the pool thread; connected from the GUI thread, so the
+    slot runs there (queued connection).
+    """
+    finished = pyqtSignal(str, int, bool, object)  # key, generation, success, result or error text
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, loader, key, generation, fetch):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.loader = loader
+        self.key = key
+        self.generation = generation
+        self.fetch = fetch
+
+    def run(self):
+        # Superseded while queued: don't touch the database at all
+        if not self.loader.is_current(self.key, self.generation):
+            return
+        started = time.perf_counter()
+        try:
+            result, success = self.fetch(), True
+        except Exception as e:
+            print(f"[PageLoader] '{self.key}' load failed: {e}")
+            result, success = str(e) or e.__class__.__name__, False
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        print(f"[PageLoader] '{self.key}' finished in {duration_ms} ms")
+        self.loader.signals.finished.emit(self.key, self.generation, success, result)
+
+
+class PageLoader:
+    """
+    Runs page data queries on a QThreadPool and hands the results back to
+    the GUI thread.
+
+    Each load() for a key supersedes the previous one: a queued task is
+    taken off the pool before it starts, and a result that arrives after a
+    newer load was requested is dropped. A running query can't be
+    interrupted, so MAX_THREADS bounds how many superseded queries can
+    still be in flight.
+
+    Create it on the GUI thread.
+    """
+
+    MAX_THREADS = 2
+
+    def __init__(self):
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(self.MAX_THREADS)
+        self.signals = LoadSignals()
+        self.signals.finished.connect(self._deliver)
+
+        self._lock = threading.Lock()
+        self._generations = {}  # key -> latest generation
+        self._tasks = {}  # key -> (task, on_loaded, on_failed, on_busy)
+
+    def is_current(self, key, generation):
+        with self._lock:
+            return self._generations.get(key) == generation
+
+    def load(self, key, fetch, on_loaded, on_failed=None, on_busy=None):
+        """
+        Fetch data off the GUI thread
+
+        Args:
+            key: Identity of the load (one page); a new load replaces the pending one
+            fetch: Zero-argument callable run on the pool; must not touch widgets
+            on_loaded: Called on the GUI thread with fetch()'s result
+            on_failed: Called on the GUI thread with the error text
+            on_busy: Called on the GUI thread with True now and False when
+                the latest load for the key has finished (loading indicator)
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._tasks.pop(key, None)
+            task = _LoadTask(self, key, generation, fetch)
+            self._tasks[key] = (task, on_loaded, on_failed, on_busy)
+
+        if previous is not None:
+            self.pool.tryTake(previous[0])
+        if on_busy:
+            on_busy(True)
+        self.pool.start(task)
+        return generation
+
+    def cancel(self, key):
+        """Drop the pending load for a key (its result will be ignored)"""
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            entry = self._tasks.pop(key, None)
+        if entry is None:
+            return
+        task, _, _, on_busy = entry
+        self.pool.tryTake(task)
+        if on_busy:
+            on_busy(False)
+
+    def cancel_others(self, key):
+        """Drop the pending loads of every other key (the user moved on)"""
+        with self._lock:
+            others = [k for k in self._tasks if k != key]
+        for other in others:
+            self.cancel(other)
+
+    def _deliver(self, key, generation, success, result):
+        with self._lock:
+            if self._generations.get(key) != generation:
+                return
+            _, on_loaded, on_failed, on_busy = self._tasks.pop(key)
+
+        if on_busy:
+            on_busy(False)
+        try:
+            if success:
+                on_loaded(result)
+            elif on_failed:
+                on_failed(result)
+        except Exception as e:
+            print(f"[PageLoader] Error applying '{key}': {e}")
+            import traceback
+            traceback.print_exc()
+
+    def shutdown(self, wait_ms=2000):
+        """Forget pending loads and wait briefly for running ones"""
+        with self._lock:
+            self._tasks.clear()
+            self._generations = {k: g + 1 for k, g in self._generations.items()}
+        self.pool.clear()
+        self.pool.waitForDone(wait_ms)
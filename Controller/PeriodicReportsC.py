@@ -1,6 +1,8 @@
+import calendar
 from datetime import date, timedelta
 from Project.Model.Database import Database
 from Project.Model.PeriodicReports import PeriodicReports
+from Project.Controller.Clock import Clock
 
 
 class PeriodicReportsController:
@@ -11,10 +13,6 @@ class PeriodicReportsController:
         """Initialize periodic reports tables"""
         PeriodicReports.initialize()
 
-    # ... [Keep existing generate methods: generate_15day_report, generate_monthly_report, etc.] ...
-    # ... [Paste the previous generation logic here if you are replacing the whole file,
-    #      OR just add the NEW methods below to your existing file] ...
-
     # === NEW METHODS FOR POPUP DETAILS ===
 
     @staticmethod
@@ -59,17 +57,285 @@ class PeriodicReportsController:
             print(f"[PeriodicC] Error getting monthly details: {e}")
             return []
 
-    # ... [Keep existing getter methods: get_15day_reports, get_monthly_reports, etc.] ...
+    @staticmethod
+    def get_previous_15day_period(today=None):
+        """
+        Most recent complete half-month period
+
+        Returns:
+            Tuple (start_date, end_date): 16th-end of last month when run in
+            the first half of a month, otherwise the 1st-15th of this month
+        """
+        today = today or Clock.get().today()
+        if today.day <= 15:
+            prev_month_end = today.replace(day=1) - timedelta(days=1)
+            return prev_month_end.replace(day=16), prev_month_end
+        return today.replace(day=1), today.replace(day=15)
+
+    # Per-employee aggregation over raw attendance for one period
+    _EMPLOYEE_AGGREGATE = """
+                          SELECT a.employee_id,
+                                 SUM(a.status = 'Present')                                         as present_days,
+                                 SUM(a.status = 'Late')                                            as late_days,
+                                 SUM(a.status = 'Absent')                                          as absent_days,
+                                 COALESCE(SUM(TIMESTAMPDIFF(MINUTE, a.clock_in, a.clock_out)), 0) / 60 as total_hours_worked,
+                                 ROUND(100 * SUM(a.status = 'Present') / COUNT(*), 2)             as attendance_rate
+                          FROM attendance a
+                          WHERE a.date BETWEEN %s AND %s {employee_filter}
+                          GROUP BY a.employee_id
+                          """
+
+    @staticmethod
+    def _employee_filter(column, employee_ids):
+        """SQL fragment and params restricting a query to some employees"""
+        if not employee_ids:
+            return "", []
+        employee_ids = list(employee_ids)
+        return f"AND {column} IN ({', '.join(['%s'] * len(employee_ids))})", employee_ids
+
+    @staticmethod
+    def generate_15day_report(start_date=None, end_date=None, employee_ids=None):
+        """
+        Generate the 15-day report for a period.
+
+        One grouped aggregation over attendance bulk-upserts the per-employee
+        rows in employee_15day_performance; the reports_15day summary is then
+        derived from those rows without rescanning attendance.
+
+        Args:
+            start_date: Period start (default: previous complete half-month)
+            end_date: Period end
+            employee_ids: Only recompute these employees' rows (summary is
+                always re-derived for the whole period)
+
+        Returns:
+            True on success, False on error
+        """
+        if start_date is None or end_date is None:
+            start_date, end_date = PeriodicReportsController.get_previous_15day_period()
+
+        db = Database.get()
+        raw_filter, raw_params = PeriodicReportsController._employee_filter('a.employee_id', employee_ids)
+        perf_filter, perf_params = PeriodicReportsController._employee_filter('employee_id', employee_ids)
+        try:
+            with db.transaction():
+                if employee_ids:
+                    # Drop rows of employees that may no longer have attendance in the period
+                    db.execute(
+                        f"DELETE FROM employee_15day_performance WHERE period_start = %s AND period_end = %s {perf_filter}",
+                        (start_date, end_date, *perf_params)
+                    )
+
+                db.execute("""
+                                       INSERT INTO employee_15day_performance
+                                       (employee_id, period_start, period_end, present_days, late_days,
+                                        absent_days, total_hours_worked, attendance_rate, generated_at)
+                                       SELECT agg.employee_id, %s, %s, agg.present_days, agg.late_days,
+                                              agg.absent_days, agg.total_hours_worked, agg.attendance_rate, %s
+                                       FROM (""" + PeriodicReportsController._EMPLOYEE_AGGREGATE.format(
+                    employee_filter=raw_filter) + """) agg
+                                       ON DUPLICATE KEY UPDATE
+                                           present_days = VALUES(present_days),
+                                           late_days = VALUES(late_days),
+                                           absent_days = VALUES(absent_days),
+                                           total_hours_worked = VALUES(total_hours_worked),
+                                           attendance_rate = VALUES(attendance_rate),
+                                           generated_at = VALUES(generated_at)
+                                       """, (start_date, end_date, Clock.get().now(), start_date, end_date, *raw_params))
+
+                PeriodicReportsController._upsert_15day_summary(start_date, end_date)
+
+            print(f"[PeriodicC] 15-day report generated for {start_date} to {end_date}")
+            return True
+        except Exception as e:
+            print(f"[PeriodicC] Error generating 15-day report: {e}")
+            return False
+
+    @staticmethod
+    def _upsert_15day_summary(start_date, end_date):
+        """Derive the reports_15day row from employee_15day_performance"""
+        db = Database.get()
+        work_days = (end_date - start_date).days + 1
+        db.execute("""
+                   INSERT INTO reports_15day
+                   (period_start, period_end, total_present, total_late, total_absent, total_work_days,
+                    average_present_rate, average_late_rate, average_absent_rate, generated_at)
+                   SELECT %s, %s, t.present, t.late, t.absent, %s,
+                          COALESCE(ROUND(100 * t.present / NULLIF(t.records, 0), 2), 0),
+                          COALESCE(ROUND(100 * t.late / NULLIF(t.records, 0), 2), 0),
+                          COALESCE(ROUND(100 * t.absent / NULLIF(t.records, 0), 2), 0),
+                          %s
+                   FROM (SELECT COALESCE(SUM(present_days), 0)                            as present,
+                                COALESCE(SUM(late_days), 0)                               as late,
+                                COALESCE(SUM(absent_days), 0)                             as absent,
+                                COALESCE(SUM(present_days + late_days + absent_days), 0) as records
+                         FROM employee_15day_performance
+                         WHERE period_start = %s AND period_end = %s) t
+                   ON DUPLICATE KEY UPDATE
+                       total_present = VALUES(total_present),
+                       total_late = VALUES(total_late),
+                       total_absent = VALUES(total_absent),
+                       total_work_days = VALUES(total_work_days),
+                       average_present_rate = VALUES(average_present_rate),
+                       average_late_rate = VALUES(average_late_rate),
+                       average_absent_rate = VALUES(average_absent_rate),
+                       generated_at = VALUES(generated_at)
+                   """, (start_date, end_date, work_days, Clock.get().now(), start_date, end_date))
+
+    @staticmethod
+    def _complete_15day_periods(periods):
+        """
+        Which 15-day periods have an aggregate that can be rolled up
+
+        A period counts as complete when its reports_15day row was generated
+        after the period ended (so it saw every day of it). generated_at is
+        written from Clock, so this holds under a simulated clock too.
+        """
+        db = Database.get()
+        placeholders = " OR ".join(["(period_start = %s AND period_end = %s)"] * len(periods))
+        params = [d for period in periods for d in period]
+        rows = db.query_all(
+            f"SELECT period_start, period_end, generated_at FROM reports_15day WHERE {placeholders}",
+            tuple(params)
+        )
+        complete = set()
+        for r in rows:
+            if r['generated_at'] and r['generated_at'].date() > r['period_end']:
+                complete.add((r['period_start'], r['period_end']))
+        return complete
 
     @staticmethod
-    def generate_15day_report(start_date=None, end_date=None):
-        # [Use previous code for this method]
-        pass # Placeholder to indicate existing code remains
+    def generate_monthly_report(year=None, month=None, employee_ids=None):
+        """
+        Generate the monthly report as a rollup of lower-level aggregates.
+
+        Each half of the month is taken from employee_15day_performance when
+        its 15-day aggregate is complete; only the missing halves are
+        aggregated from raw attendance (daily reports hold no per-employee
+        rows, so they are never used). The reports_monthly summary is then
+        derived from the per-employee monthly rows and records its source
+        ('15day', '15day+raw' or 'raw').
+
+        Args:
+            year: Report year (default: previous month)
+            month: Report month
+            employee_ids: Only recompute these employees' rows (summary is
+                always re-derived for the whole month)
+
+        Returns:
+            True on success, False on error
+        """
+        if year is None or month is None:
+            prev_month = Clock.get().today().replace(day=1) - timedelta(days=1)
+            year, month = prev_month.year, prev_month.month
+
+        period_start = date(year, month, 1)
+        period_end = date(year, month, calendar.monthrange(year, month)[1])
+        halves = [(period_start, date(year, month, 15)), (date(year, month, 16), period_end)]
+
+        db = Database.get()
+        raw_filter, raw_params = PeriodicReportsController._employee_filter('a.employee_id', employee_ids)
+        perf_filter, perf_params = PeriodicReportsController._employee_filter('employee_id', employee_ids)
+        try:
+            complete = PeriodicReportsController._complete_15day_periods(halves)
+
+            parts = []
+            params = [year, month, period_start, period_end, Clock.get().now()]
+            for half_start, half_end in halves:
+                if (half_start, half_end) in complete:
+                    parts.append("""
+                                 SELECT employee_id, present_days, late_days, absent_days, total_hours_worked
+                                 FROM employee_15day_performance
+                                 WHERE period_start = %s AND period_end = %s {perf_filter}
+                                 """.format(perf_filter=perf_filter))
+                    params.extend([half_start, half_end, *perf_params])
+                else:
+                    parts.append("""
+                                 SELECT employee_id, present_days, late_days, absent_days, total_hours_worked
+                                 FROM (""" + PeriodicReportsController._EMPLOYEE_AGGREGATE.format(
+                        employee_filter=raw_filter) + """) raw_half
+                                 """)
+                    params.extend([half_start, half_end, *raw_params])
+
+            if len(complete) == len(halves):
+                source = '15day'
+            elif complete:
+                source = '15day+raw'
+            else:
+                source = 'raw'
+
+            with db.transaction():
+                if employee_ids:
+                    # Drop rows of employees that may no longer have attendance in the month
+                    db.execute(
+                        f"DELETE FROM employee_monthly_performance WHERE year = %s AND month = %s {perf_filter}",
+                        (year, month, *perf_params)
+                    )
+
+                db.execute("""
+                           INSERT INTO employee_monthly_performance
+                           (employee_id, year, month, period_start, period_end, present_days, late_days,
+                            absent_days, total_hours_worked, attendance_rate, generated_at)
+                           SELECT parts.employee_id, %s, %s, %s, %s,
+                                  SUM(parts.present_days),
+                                  SUM(parts.late_days),
+                                  SUM(parts.absent_days),
+                                  SUM(parts.total_hours_worked),
+                                  COALESCE(ROUND(100 * SUM(parts.present_days) /
+                                                 NULLIF(SUM(parts.present_days + parts.late_days + parts.absent_days), 0), 2), 0),
+                                  %s
+                           FROM (""" + " UNION ALL ".join(parts) + """) parts
+                           GROUP BY parts.employee_id
+                           ON DUPLICATE KEY UPDATE
+                               present_days = VALUES(present_days),
+                               late_days = VALUES(late_days),
+                               absent_days = VALUES(absent_days),
+                               total_hours_worked = VALUES(total_hours_worked),
+                               attendance_rate = VALUES(attendance_rate),
+                               generated_at = VALUES(generated_at)
+                           """, tuple(params))
+
+                PeriodicReportsController._upsert_monthly_summary(year, month, period_start, period_end, source)
+
+            print(f"[PeriodicC] Monthly report generated for {year}-{month:02d} (source: {source})")
+            return True
+        except Exception as e:
+            print(f"[PeriodicC] Error generating monthly report: {e}")
+            return False
 
     @staticmethod
-    def generate_monthly_report(year=None, month=None):
-        # [Use previous code for this method]
-        pass # Placeholder to indicate existing code remains
+    def _upsert_monthly_summary(year, month, period_start, period_end, source):
+        """Derive the reports_monthly row from employee_monthly_performance"""
+        db = Database.get()
+        work_days = (period_end - period_start).days + 1
+        db.execute("""
+                   INSERT INTO reports_monthly
+                   (year, month, period_start, period_end, total_present, total_late, total_absent, total_work_days,
+                    average_present_rate, average_late_rate, average_absent_rate, source, generated_at)
+                   SELECT %s, %s, %s, %s, t.present, t.late, t.absent, %s,
+                          COALESCE(ROUND(100 * t.present / NULLIF(t.records, 0), 2), 0),
+                          COALESCE(ROUND(100 * t.late / NULLIF(t.records, 0), 2), 0),
+                          COALESCE(ROUND(100 * t.absent / NULLIF(t.records, 0), 2), 0),
+                          %s, %s
+                   FROM (SELECT COALESCE(SUM(present_days), 0)                            as present,
+                                COALESCE(SUM(late_days), 0)                               as late,
+                                COALESCE(SUM(absent_days), 0)                             as absent,
+                                COALESCE(SUM(present_days + late_days + absent_days), 0) as records
+                         FROM employee_monthly_performance
+                         WHERE year = %s AND month = %s) t
+                   ON DUPLICATE KEY UPDATE
+                       period_start = VALUES(period_start),
+                       period_end = VALUES(period_end),
+                       total_present = VALUES(total_present),
+                       total_late = VALUES(total_late),
+                       total_absent = VALUES(total_absent),
+                       total_work_days = VALUES(total_work_days),
+                       average_present_rate = VALUES(average_present_rate),
+                       average_late_rate = VALUES(average_late_rate),
+                       average_absent_rate = VALUES(average_absent_rate),
+                       source = VALUES(source),
+                       generated_at = VALUES(generated_at)
+                   """, (year, month, period_start, period_end, work_days, source, Clock.get().now(), year, month))
 
     @staticmethod
     def get_15day_reports(limit=10):
@@ -83,6 +349,4 @@ class PeriodicReportsController:
         db = Database.get()
         try:
             return db.query_all("SELECT * FROM reports_monthly ORDER BY year DESC, month DESC LIMIT %s", (limit,))
-        except: return []
-
-    # Internal helpers (_generate_employee_...) also remain
\ No newline at end of file
+        except: return []
\ No newline at end of file
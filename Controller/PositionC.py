@@ -1,5 +1,6 @@
 from Project.Model.Database import Database
 from Project.Model.Positions import Position
+from Project.Controller.PositionRulesCache import PositionRulesCache
 
 
 class PositionController:
@@ -67,6 +68,7 @@ class PositionController:
                     VALUES (%s, %s, %s) \
                     """
             db.execute(query, (name, late_time_str, grace_period))
+            PositionRulesCache.invalidate()
             return True, "Position added successfully."
 
         except Exception as e:
@@ -110,6 +112,7 @@ class PositionController:
             params.append(position_id)
             query = f"UPDATE positions SET {', '.join(updates)} WHERE id = %s"
             db.execute(query, tuple(params))
+            PositionRulesCache.invalidate()
 
             return True, "Position updated successfully."
 
@@ -142,6 +145,7 @@ class PositionController:
             # Delete position
             query = "DELETE FROM positions WHERE id = %s"
             db.execute(query, (position_id,))
+            PositionRulesCache.invalidate()
             return True, "Position deleted successfully."
 
         except Exception as e:
@@ -0,0 +1,125 @@
+import threading
+import time as _time
+from datetime import datetime, date, time, timedelta
+from Project.Model.Database import Database
+
+
+class PositionRulesCache:
+    """
+    In-memory cache of late thresholds per position and the
+    employee -> position map used to classify clock-ins without a query.
+
+    Invalidated by PositionController (add/update/delete) and
+    EmployeeController (update/delete). Entries also expire after
+    TTL_SECONDS so changes made from another workstation are picked up.
+    """
+
+    DEFAULT_LATE_TIME = time(8, 0, 0)
+    DEFAULT_GRACE_MINUTES = 15
+    TTL_SECONDS = 300
+
+    _lock = threading.RLock()
+    _thresholds = {}  # position_id -> late threshold (late_time + grace)
+    _employee_positions = {}  # employee_id -> position_id
+    _loaded_at = None
+
+    @staticmethod
+    def to_time(value):
+        """Normalize a TIME column (timedelta, string or time) into a time"""
+        if isinstance(value, time):
+            return value
+        if isinstance(value, timedelta):
+            total_seconds = int(value.total_seconds())
+            return time((total_seconds // 3600) % 24, (total_seconds % 3600) // 60, total_seconds % 60)
+        if isinstance(value, str):
+            parts = value.split(':')
+            return time(int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) > 2 else 0)
+        return None
+
+    @classmethod
+    def compute_threshold(cls, late_time, grace_minutes):
+        """Late threshold = late_time + grace period"""
+        target_time = cls.to_time(late_time) if late_time else None
+        if target_time is None:
+            target_time = cls.DEFAULT_LATE_TIME
+        if grace_minutes is None:
+            grace_minutes = cls.DEFAULT_GRACE_MINUTES
+        threshold = datetime.combine(date.today(), target_time) + timedelta(minutes=grace_minutes)
+        return threshold.time()
+
+    @classmethod
+    def _default_threshold(cls):
+        return cls.compute_threshold(cls.DEFAULT_LATE_TIME, cls.DEFAULT_GRACE_MINUTES)
+
+    @classmethod
+    def _ensure_loaded(cls):
+        with cls._lock:
+            if cls._loaded_at is not None and _time.monotonic() - cls._loaded_at < cls.TTL_SECONDS:
+                return
+            db = Database.get()
+            positions = db.query_all("SELECT id, late_time, grace_period_minutes FROM positions")
+            employees = db.query_all("SELECT id, position_id FROM employees")
+            cls._thresholds = {
+                p['id']: cls.compute_threshold(p['late_time'], p['grace_period_minutes'])
+                for p in positions
+            }
+            cls._employee_positions = {e['id']: e['position_id'] for e in employees}
+            cls._loaded_at = _time.monotonic()
+
+    @classmethod
+    def get_position_id(cls, employee_id):
+        """
+        Position of an employee, loading a single employee on a cache miss
+
+        Returns:
+            Position ID, or None if the employee doesn't exist (or has no position)
+        """
+        cls._ensure_loaded()
+        with cls._lock:
+            if employee_id in cls._employee_positions:
+                return cls._employee_positions[employee_id]
+
+        row = Database.get().query_one("SELECT position_id FROM employees WHERE id = %s", (employee_id,))
+        if not row:
+            return None
+        with cls._lock:
+            cls._employee_positions[employee_id] = row['position_id']
+        return row['position_id']
+
+    @classmethod
+    def get_threshold(cls, position_id):
+        """Late threshold for a position (default 08:15 if unknown)"""
+        cls._ensure_loaded()
+        with cls._lock:
+            return cls._thresholds.get(position_id) or cls._default_threshold()
+
+    @classmethod
+    def get_threshold_for_employee(cls, employee_id):
+        return cls.get_threshold(cls.get_position_id(employee_id))
+
+    @classmethod
+    def classify(cls, employee_id, clock_in_time):
+        """
+        Classify a clock-in as 'Present' or 'Late'
+
+        Args:
+            employee_id: Employee ID
+            clock_in_time: datetime or time of the punch
+        """
+        if isinstance(clock_in_time, datetime):
+            clock_in_time = clock_in_time.time()
+        return "Late" if clock_in_time > cls.get_threshold_for_employee(employee_id) else "Present"
+
+    @classmethod
+    def invalidate(cls):
+        """Drop everything; the next lookup reloads positions and employees"""
+        with cls._lock:
+            cls._thresholds = {}
+            cls._employee_positions = {}
+            cls._loaded_at = None
+
+    @classmethod
+    def invalidate_employee(cls, employee_id):
+        """Forget one employee's position (reloaded on next lookup)"""
+        with cls._lock:
+            cls._employee_positions.pop(employee_id, None)
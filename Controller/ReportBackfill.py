@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from Project.Model.Database import Database
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.CumulativeTotals import CumulativeTotals
+from Project.Controller.Clock import Clock
+
+
+def _init_worker(settings):
+    """
+    Process-pool initializer.
+
+    A forked worker inherits the parent's Database pool and its open
+    sockets; drop them (without closing, the parent still uses them) so
+    the worker opens its own pool. Spawned workers only need the settings.
+    """
+    Database.detach()
+    Database.configure(**settings)
+
+
+def _backfill_chunk(start_date, end_date, mark_absent):
+    """Process-pool entry point (runs on the worker's own connection pool)"""
+    return ReportBackfill.backfill_range(start_date, end_date, mark_absent)
+
+
+class ReportBackfill:
+    """
+    Rebuilds daily `reports` rows for a date range.
+
+    Absent marking for the whole range is one set-based INSERT, every day's
+    counts come from one GROUP BY date, and the results are upserted in
+    bulk. Long ranges can be split into chunks and run across a process pool;
+    running totals for the range are refreshed once at the end.
+    """
+
+    @staticmethod
+    def backfill_range(start_date, end_date, mark_absent=True):
+        """
+        Backfill one contiguous range in the current process
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            mark_absent: Fill missing attendance with Absent rows first
+
+        Returns:
+            Number of report days written
+        """
+        db = Database.get()
+
+        if mark_absent:
+            AttendanceController.mark_absent_employees(start_date, end_date)
+
+        rows = db.query_all("""
+                            SELECT date,
+                                   SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) as present_count,
+                                   SUM(CASE WHEN status = 'Late' THEN 1 ELSE 0 END)    as late_count,
+                                   SUM(CASE WHEN status = 'Absent' THEN 1 ELSE 0 END)  as absent_count
+                            FROM attendance
+                            WHERE date BETWEEN %s AND %s
+                            GROUP BY date
+                            """, (start_date, end_date))
+        counts = {r['date']: r for r in rows}
+
+        # Days without any attendance still get a (zero) report row, the
+        # same as generate_daily_report would write for them
+        report_rows = []
+        day = start_date
+        while day <= end_date:
+            r = counts.get(day)
+            if r:
+                report_rows.append((day, int(r['present_count'] or 0), int(r['late_count'] or 0),
+                                    int(r['absent_count'] or 0)))
+            else:
+                report_rows.append((day, 0, 0, 0))
+            day += timedelta(days=1)
+
+        AttendanceController.upsert_daily_reports(report_rows)
+        return len(report_rows)
+
+    @staticmethod
+    def split_range(start_date, end_date, chunk_days):
+        """Split [start_date, end_date] into consecutive chunks of chunk_days"""
+        chunks = []
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + timedelta(days=1)
+        return chunks
+
+    @classmethod
+    def backfill(cls, start_date, end_date=None, mark_absent=True, chunk_days=31, workers=1, progress=None):
+        """
+        Rebuild daily reports for a date range
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive, default: start_date)
+            mark_absent: Fill missing attendance with Absent rows first
+            chunk_days: Days handled per chunk
+            workers: Processes to use; 1 runs every chunk in this process
+            progress: Optional callback(done_days, total_days)
+
+        Returns:
+            Number of report days written
+        """
+        if end_date is None:
+            end_date = start_date
+        if end_date > Clock.get().today():
+            end_date = Clock.get().today()
+        if start_date > end_date:
+            return 0
+
+        chunks = cls.split_range(start_date, end_date, chunk_days)
+        total_days = (end_date - start_date).days + 1
+        done = 0
+        print(f"[Backfill] Rebuilding reports {start_date} to {end_date} "
+              f"({total_days} days, {len(chunks)} chunks, {workers} worker(s))")
+
+        def report(days):
+            nonlocal done
+            done += days
+            print(f"[Backfill] {done}/{total_days} days")
+            if progress:
+                progress(done, total_days)
+
+        if workers <= 1 or len(chunks) == 1:
+            for chunk_start, chunk_end in chunks:
+                report(cls.backfill_range(chunk_start, chunk_end, mark_absent))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(Database.configured_settings(),)) as pool:
+                futures = [pool.submit(_backfill_chunk, s, e, mark_absent) for s, e in chunks]
+                for future in as_completed(futures):
+                    report(future.result())
+
+        # Once for the whole range (chunks would rebuild overlapping totals)
+        CumulativeTotals.refresh_dates(start_date, end_date)
+
+        print(f"[Backfill] Completed {done} days")
+        return done
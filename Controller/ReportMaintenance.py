@@ -0,0 +1,145 @@
+import calendar
+from Project.Model.Database import Database
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.CumulativeTotals import CumulativeTotals
+from Project.Controller.Clock import Clock
+
+
+class ReportMaintenance:
+    """
+    Incremental refresh of stored reports from the attendance change log.
+
+    Only aggregates that already exist are refreshed: daily `reports` rows
+    for touched dates, and the 15-day / monthly per-employee rows of the
+    touched employees (their summaries are re-derived from those rows).
+    Running totals are rebuilt from each touched employee's earliest change.
+    Aggregates that haven't been generated yet are left to the scheduler.
+    """
+
+    BATCH_LIMIT = 50000
+
+    @staticmethod
+    def _half_month(day):
+        if day.day <= 15:
+            return day.replace(day=1), day.replace(day=15)
+        return day.replace(day=16), day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+    @classmethod
+    def process_changes(cls):
+        """
+        Refresh aggregates affected by logged attendance changes
+
+        Returns:
+            Dictionary with counts of changes and refreshed aggregates
+        """
+        db = Database.get()
+        changes = db.query_all(
+            "SELECT id, date, employee_id FROM attendance_changes ORDER BY id LIMIT %s",
+            (cls.BATCH_LIMIT,)
+        )
+        if not changes:
+            return {'changes': 0, 'days': 0, 'periods_15day': 0, 'months': 0}
+
+        cells = {(c['date'], c['employee_id']) for c in changes}
+        dates = sorted({day for day, _ in cells})
+        periods = {}
+        months = {}
+        for day, employee_id in cells:
+            periods.setdefault(cls._half_month(day), set()).add(employee_id)
+            months.setdefault((day.year, day.month), set()).add(employee_id)
+
+        CumulativeTotals.refresh((employee_id, day) for day, employee_id in cells)
+        days_done = cls._refresh_daily(dates)
+        periods_done = cls._refresh_15day(periods)
+        months_done = cls._refresh_monthly(months)
+
+        # Delete only the rows that were read: a lower id that was still
+        # uncommitted during the read leaves a gap and waits for the next run
+        db.execute_many("DELETE FROM attendance_changes WHERE id BETWEEN %s AND %s",
+                        cls._id_ranges(c['id'] for c in changes))
+
+        result = {'changes': len(cells), 'days': days_done, 'periods_15day': periods_done, 'months': months_done}
+        print(f"[Maintenance] Processed {len(cells)} changed cells: {days_done} daily, "
+              f"{periods_done} 15-day, {months_done} monthly reports refreshed")
+        return result
+
+    @staticmethod
+    def _id_ranges(ids):
+        """Collapse ids into (first, last) runs of consecutive values"""
+        ranges = []
+        for change_id in sorted(ids):
+            if ranges and change_id == ranges[-1][1] + 1:
+                ranges[-1][1] = change_id
+            else:
+                ranges.append([change_id, change_id])
+        return [tuple(r) for r in ranges]
+
+    @staticmethod
+    def _refresh_daily(dates):
+        """Recount existing daily report rows for the touched dates"""
+        if not dates:
+            return 0
+        db = Database.get()
+        placeholders = ", ".join(["%s"] * len(dates))
+        existing = db.query_all(f"SELECT date FROM reports WHERE date IN ({placeholders})", tuple(dates))
+        existing = [r['date'] for r in existing]
+        if not existing:
+            return 0
+
+        placeholders = ", ".join(["%s"] * len(existing))
+        rows = db.query_all(f"""
+                             SELECT date,
+                                    SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) as present_count,
+                                    SUM(CASE WHEN status = 'Late' THEN 1 ELSE 0 END)    as late_count,
+                                    SUM(CASE WHEN status = 'Absent' THEN 1 ELSE 0 END)  as absent_count
+                             FROM attendance
+                             WHERE date IN ({placeholders})
+                             GROUP BY date
+                             """, tuple(existing))
+        counts = {r['date']: r for r in rows}
+
+        report_rows = []
+        for day in existing:
+            r = counts.get(day)
+            if r:
+                report_rows.append((day, int(r['present_count'] or 0), int(r['late_count'] or 0),
+                                    int(r['absent_count'] or 0)))
+            else:
+                report_rows.append((day, 0, 0, 0))
+        AttendanceController.upsert_daily_reports(report_rows)
+        return len(report_rows)
+
+    @staticmethod
+    def _refresh_15day(periods):
+        """Recompute touched employees in already generated 15-day periods"""
+        if not periods:
+            return 0
+        db = Database.get()
+        refreshed = 0
+        for (start_date, end_date), employee_ids in sorted(periods.items()):
+            if start_date > Clock.get().today():
+                continue
+            exists = db.query_one(
+                "SELECT id FROM reports_15day WHERE period_start = %s AND period_end = %s",
+                (start_date, end_date)
+            )
+            if exists and PeriodicReportsController.generate_15day_report(start_date, end_date, employee_ids):
+                refreshed += 1
+        return refreshed
+
+    @staticmethod
+    def _refresh_monthly(months):
+        """Recompute touched employees in already generated months"""
+        if not months:
+            return 0
+        db = Database.get()
+        refreshed = 0
+        for (year, month), employee_ids in sorted(months.items()):
+            exists = db.query_one(
+                "SELECT id FROM reports_monthly WHERE year = %s AND month = %s",
+                (year, month)
+            )
+            if exists and PeriodicReportsController.generate_monthly_report(year, month, employee_ids):
+                refreshed += 1
+        return refreshed
@@ -2,6 +2,7 @@ from datetime import date
 from Project.Model.Database import Database
 from Project.Model.Reports import Reports
 from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.CumulativeTotals import CumulativeTotals
 
 class ReportController:
 
@@ -31,6 +32,42 @@ class ReportController:
     def get_monthly_reports(limit=12):
         return PeriodicReportsController.get_monthly_reports(limit)
 
+    @staticmethod
+    def get_range_summary(start_date, end_date, position=None):
+        """
+        Attendance summary for any date range from the running-total table
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            position: Optional position name or ID
+
+        Returns:
+            Dictionary with per-employee rows and overall totals, or None on error
+        """
+        try:
+            employees = CumulativeTotals.get_range_totals(start_date, end_date, position)
+            totals = {'present': 0, 'late': 0, 'absent': 0, 'hours_worked': 0.0}
+            for emp in employees:
+                emp['hours_worked'] = round(int(emp.pop('worked_minutes') or 0) / 60, 2)
+                recorded = emp['present_days'] + emp['late_days'] + emp['absent_days']
+                emp['attendance_rate'] = round(100 * emp['present_days'] / recorded, 2) if recorded else 0.0
+                totals['present'] += emp['present_days']
+                totals['late'] += emp['late_days']
+                totals['absent'] += emp['absent_days']
+                totals['hours_worked'] += emp['hours_worked']
+
+            return {
+                'start': start_date,
+                'end': end_date,
+                'position': position,
+                'employees': employees,
+                'totals': totals
+            }
+        except Exception as e:
+            print(f"[ReportsC] Error getting range summary: {e}")
+            return None
+
     @staticmethod
     def get_attendance_details_by_date(report_date):
         """
@@ -0,0 +1,61 @@
+import os
+
+from Project.Model.Database import Database
+from Project.Model.Migrations import Migrations
+
+
+class ScratchDatabase:
+    """
+    Database options shared by the command-line tools that write synthetic
+    data (Simulate.py, GenerateData.py, Benchmark.py), and the guard that
+    keeps them off the live database.
+    """
+
+    @staticmethod
+    def add_arguments(parser, default):
+        """
+        Add --database, --backend and --sqlite-path
+
+        Args:
+            parser: argparse parser (or sub-command parser)
+            default: Default scratch database name
+        """
+        parser.add_argument("--database", default=default,
+                            help="Scratch database (never the live one)")
+        parser.add_argument("--backend", choices=["mysql", "sqlite"], default=None,
+                            help="Database backend (default: ATTENDANCE_DB_BACKEND or mysql)")
+        parser.add_argument("--sqlite-path", default=None,
+                            help="SQLite file or ':memory:' (default: <database>.sqlite3)")
+
+    @staticmethod
+    def _live_sqlite_path():
+        path = Database.effective_setting('sqlite_path') or f"{Database.effective_setting('database')}.sqlite3"
+        return None if path == ':memory:' else os.path.abspath(path)
+
+    @classmethod
+    def use(cls, args, parser, action):
+        """
+        Point Database at the scratch database from `args` and migrate it
+
+        The live database is the one the application would connect to
+        (ATTENDANCE_DB_* environment variables included); naming it exits
+        through parser.error.
+
+        Args:
+            args: Parsed arguments (see add_arguments)
+            parser: Parser used to report the error
+            action: Verb for the error message ("simulate", ...)
+        """
+        live = Database.effective_setting('database')
+        if args.database == live:
+            parser.error(f"refusing to {action} in the live database '{live}'")
+        if args.sqlite_path and os.path.abspath(args.sqlite_path) == cls._live_sqlite_path():
+            parser.error(f"refusing to {action} in the live database file '{args.sqlite_path}'")
+
+        Database.configure(database=args.database)
+        if args.backend:
+            Database.configure(backend=args.backend)
+        if args.sqlite_path:
+            Database.configure(sqlite_path=args.sqlite_path)
+
+        Migrations.migrate()
@@ -0,0 +1,158 @@
+import random
+import time
+from datetime import datetime, timedelta
+from Project.Model.Database import Database
+from Project.Controller.Clock import Clock, SimulatedClock
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.EmployeeC import EmployeeController
+from Project.Controller.DailyScheduler import DailyScheduler
+from Project.Controller.ReportMaintenance import ReportMaintenance
+
+
+class SimulationDriver:
+    """
+    Replays days of synthetic clock-ins/outs and scheduler jobs on a
+    SimulatedClock, as fast as the database allows.
+
+    Punches go through AttendanceController exactly as the kiosk sends
+    them and every cron job fires at its simulated deadline, so a full
+    payroll cycle runs in minutes. Meant for a scratch database: it writes
+    attendance, reports and ledger rows.
+    """
+
+    # Punch model: arrival around 08:00, ~6% no-shows, 8-9.5h shifts
+    ARRIVAL_MEAN_MINUTES = 8 * 60
+    ARRIVAL_STDDEV_MINUTES = 12
+    ABSENCE_RATE = 0.06
+    SHIFT_EXTRA_MINUTES = 90
+
+    def __init__(self, seed=None, workdays_only=True):
+        self.rng = random.Random(seed)
+        self.workdays_only = workdays_only
+        self.latencies = {}  # operation -> list of milliseconds
+        self.rows = {}  # job name -> rows written
+
+    def _timed(self, operation, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.latencies.setdefault(operation, []).append((time.perf_counter() - started) * 1000)
+        return result
+
+    def ensure_employees(self, count):
+        """Create synthetic employees until at least `count` exist (hired today on the clock)"""
+        db = Database.get()
+        existing = db.query_one("SELECT COUNT(*) AS c FROM employees")['c']
+        positions = [p['id'] for p in db.query_all("SELECT id FROM positions")] or [1]
+        for n in range(existing, count):
+            EmployeeController.add_employee({
+                'first_name': f"Sim{n}",
+                'last_name': "Employee",
+                'email_address': f"sim{n}@example.com",
+                'phone_number': f"09{n:09d}",
+                'username': f"sim{n}",
+                'password': f"sim{n}-password",
+                'position_id': self.rng.choice(positions)
+            })
+        return max(existing, count)
+
+    def _day_events(self, day, employees):
+        """Sorted (moment, kind, employee_id) punches for one day"""
+        events = []
+        if self.workdays_only and day.weekday() >= 5:
+            return events
+        midnight = datetime.combine(day, datetime.min.time())
+        for emp in employees:
+            if emp['date_hired'] and emp['date_hired'] > day:
+                continue
+            if self.rng.random() < self.ABSENCE_RATE:
+                continue
+            arrival = self.rng.gauss(self.ARRIVAL_MEAN_MINUTES, self.ARRIVAL_STDDEV_MINUTES)
+            clock_in = midnight + timedelta(minutes=max(0, arrival))
+            shift = AttendanceController.MIN_WORK_HOURS * 60 + self.rng.uniform(1, self.SHIFT_EXTRA_MINUTES)
+            events.append((clock_in, 'clock_in', emp['id']))
+            events.append((clock_in + timedelta(minutes=shift), 'clock_out', emp['id']))
+        events.sort()
+        return events
+
+    def _advance(self, clock, moment):
+        """Run scheduler jobs due up to `moment`, then move the clock there"""
+        current = clock.now()
+        if moment <= current:
+            return
+        for run in DailyScheduler.run_due_jobs(current, moment):
+            self.latencies.setdefault(f"job.{run['job']}", []).append(run['duration_ms'])
+            self.rows[run['job']] = self.rows.get(run['job'], 0) + (run['rows'] or 0)
+        clock.set(moment)
+
+    def run(self, start_date, days, employees=None):
+        """
+        Simulate `days` days starting at `start_date`
+
+        Args:
+            start_date: First simulated date
+            days: Number of days
+            employees: Create synthetic employees up to this count first
+
+        Returns:
+            Metrics dictionary (see summarize)
+        """
+        clock = SimulatedClock(datetime.combine(start_date, datetime.min.time()), speed=0)
+        previous_clock = Clock.get()
+        Clock.install(clock)
+        wall_start = time.perf_counter()
+        punches = 0
+        try:
+            if employees:
+                self.ensure_employees(employees)
+            staff = Database.get().query_all("SELECT id, date_hired FROM employees")
+            print(f"[Simulation] {days} days from {start_date} with {len(staff)} employees")
+
+            for offset in range(days):
+                day = start_date + timedelta(days=offset)
+                for moment, kind, emp_id in self._day_events(day, staff):
+                    self._advance(clock, moment)
+                    func = AttendanceController.clock_in if kind == 'clock_in' else AttendanceController.clock_out
+                    self._timed(kind, func, emp_id)
+                    punches += 1
+
+                self._advance(clock, datetime.combine(day + timedelta(days=1), datetime.min.time()))
+                self._timed('maintenance', ReportMaintenance.process_changes)
+                print(f"[Simulation] {day} done ({punches} punches so far)")
+        finally:
+            Clock.install(previous_clock)
+
+        return self.summarize(days, punches, time.perf_counter() - wall_start)
+
+    @staticmethod
+    def _percentile(values, pct):
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def summarize(self, days, punches, wall_seconds):
+        """
+        Returns:
+            Dictionary with totals and per-operation count, total, p50, p95, max (ms)
+            and throughput (operations per wall second)
+        """
+        operations = {}
+        for name, values in sorted(self.latencies.items()):
+            total = sum(values)
+            operations[name] = {
+                'count': len(values),
+                'total_ms': round(total, 2),
+                'p50_ms': round(self._percentile(values, 50), 2),
+                'p95_ms': round(self._percentile(values, 95), 2),
+                'max_ms': round(max(values), 2),
+                'per_second': round(len(values) / (total / 1000), 2) if total else None,
+            }
+            job = name[4:] if name.startswith('job.') else None
+            if job in self.rows:
+                operations[name]['rows'] = self.rows[job]
+        return {
+            'days': days,
+            'punches': punches,
+            'wall_seconds': round(wall_seconds, 2),
+            'simulated_days_per_minute': round(days / (wall_seconds / 60), 2) if wall_seconds else None,
+            'operations': operations
+        }
@@ -0,0 +1,45 @@
+import argparse
+from datetime import date
+
+from Project.Model.Database import Database
+from Project.Controller.ScratchDatabase import ScratchDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a deterministic synthetic dataset for scale testing")
+    ScratchDatabase.add_arguments(parser, default="attendance_system_sim")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--admins", type=int, default=3)
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="Last attendance date (default: a fixed date so runs are comparable)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--reports", action="store_true",
+                        help="Also rebuild daily reports for the generated range")
+    args = parser.parse_args()
+
+    ScratchDatabase.use(args, parser, "generate data")
+
+    from Project.Controller.DatasetGenerator import DatasetGenerator
+    generator = DatasetGenerator(seed=args.seed, batch_size=args.batch_size)
+    counts = generator.generate(
+        employees=args.employees,
+        years=args.years,
+        admins=args.admins,
+        end_date=args.end,
+        progress=lambda done, total: print(f"[Generator] {done}/{total} employees")
+    )
+
+    if args.reports:
+        from datetime import timedelta
+        from Project.Controller.ReportBackfill import ReportBackfill
+        end = args.end or DatasetGenerator.DEFAULT_END_DATE
+        ReportBackfill.backfill(end - timedelta(days=int(args.years * 365) - 1), end, mark_absent=False)
+
+    print(f"[Generator] Done: {counts}")
+    Database.get().close()
+
+
+if __name__ == "__main__":
+    main()
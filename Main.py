@@ -41,12 +41,7 @@ except ImportError as e:
 # Import Models
 from Project.Model.Database import Database
 from Project.Model.Admin import Admin
-from Project.Model.Employee import Employee
-from Project.Model.Positions import Position
-from Project.Model.Attendance import Attendance
-from Project.Model.Reports import Reports
-from Project.Model.PeriodicReports import PeriodicReports
-from Project.Model.Request import LeaveRequest
+from Project.Model.Migrations import Migrations
 
 # === GLOBAL STYLESHEET TO FIX INVISIBLE TEXT IN DIALOGS ===
 GLOBAL_STYLESHEET = """
@@ -105,6 +100,7 @@ def print_scheduler_status():
         status = get_status()
         print("\n[Scheduler] Status Report:")
         print(f"  Running: {status['running']}")
+        print(f"  Leader: {status.get('leader', False)}")
         print(f"  Absent marking at: {status['absent_time']}")
         print(f"  Report generation at: {status['report_time']}")
         print(f"  Last absent run: {status['absent_last_run']}")
@@ -115,6 +111,20 @@ def print_scheduler_status():
         traceback.print_exc()
 
 
+def print_query_stats(top=10):
+    """Print the statements that took the most total time this session"""
+    try:
+        stats = Database.get_query_stats(top=top)
+        if not stats:
+            return
+        print(f"\n[Database] Top {len(stats)} statements by total time:")
+        for s in stats:
+            print(f"  {s['total_ms']:>10.1f}ms  n={s['calls']:<6} p50={s['p50_ms']}ms p95={s['p95_ms']}ms "
+                  f"slow={s['slow']}  {s['fingerprint'][:100]}")
+    except Exception as e:
+        print(f"[Database] Error getting query stats: {e}")
+
+
 def get_resource_path(relative_path):
     """Get absolute path to resource - works for dev and PyInstaller"""
     try:
@@ -172,24 +182,9 @@ def main():
         db = Database.get()
         print("[Boot] Database connected successfully")
 
-        # Initialize all tables in correct order
-        Position.initialize()
-        print(" - Positions Table OK")
-
-        Employee.initialize()
-        print(" - Employees Table OK")
-
-        Attendance.initialize()
-        print(" - Attendance Table OK")
-
-        Reports.initialize()
-        print(" - Reports Table OK")
-
-        PeriodicReports.initialize()
-        print(" - Periodic Reports Tables OK (15-day & Monthly)")
-
-        LeaveRequest.initialize()
-        print(" - Leave Requests Table OK")
+        # Bring schema up to date (single version check when current)
+        Migrations.migrate()
+        print(" - Schema OK")
 
         Admin.ensure_default_admin()
         print(" - Admin User OK")
@@ -264,9 +259,6 @@ def main():
         settings_page = SettingsPage()
         print(" - Settings page created")
 
-        PeriodicReports.initialize()
-        print(" - Periodic Reports Tables OK (15-day & Monthly)")
-
         pages = [
             login_page,
             dashboard_page,
@@ -341,6 +333,10 @@ def main():
 
         sidebar.btn_settings.clicked.connect(lambda: main_window.show_page(5, "Settings"))
 
+        # Page-initiated loads (becoming visible, filter changes) go through
+        # the controller so they run off the GUI thread too
+        requests_page.on_load_requested = lambda: controller.refresh_requests(requests_page)
+
         sidebar.btn_logout.clicked.connect(lambda: (
             main_window.show_login() if controller.on_logout() else None
         ))
@@ -403,6 +399,8 @@ def main():
     try:
         exit_code = app.exec()
 
+        controller.shutdown()
+
         # STOP SCHEDULER ON EXIT
         if SCHEDULER_AVAILABLE:
             try:
@@ -414,6 +412,7 @@ def main():
                 import traceback
                 traceback.print_exc()
 
+        print_query_stats()
         print("[Shutdown] Application closed")
         return exit_code
 
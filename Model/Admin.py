@@ -79,7 +79,6 @@ class Admin:
         """
         Authenticate an admin - utility function
         """
-        cls.initialize()
         db = Database.get()
         user = db.query_one("SELECT * FROM admins WHERE username = %s", (username,))
         if not user:
@@ -102,7 +101,6 @@ class Admin:
     @classmethod
     def create_admin(cls, first_name, middle_initial, last_name, email, phone, username, password):
         """Create a new admin - utility for seeding"""
-        cls.initialize()
         db = Database.get()
         salt = secrets.token_bytes(SALT_BYTES)
         pw_hash = cls.hash_password(password, salt)
@@ -145,7 +143,6 @@ class Admin:
     @classmethod
     def ensure_default_admin(cls):
         """Create default admin if none exists - utility"""
-        cls.initialize()
         db = Database.get()
         row = db.query_one("SELECT COUNT(1) AS c FROM admins")
         if row and row["c"] == 0:
@@ -0,0 +1,122 @@
+import threading
+from contextlib import contextmanager
+from Project.Model.Database import Database
+
+
+class AdvisoryLock:
+    """
+    Server-wide named lock (MySQL GET_LOCK) held on a dedicated connection.
+
+    The lock belongs to the connection's session, so it is released when
+    release() is called, when the connection is closed, or when the server
+    notices the holder died - letting another instance acquire it.
+    Names are prefixed with the database name so several installs can share
+    one server.
+
+    Backends without server locks (SQLite) use process-local locks instead,
+    which only exclude other threads of this application.
+    """
+
+    _local_locks = {}
+    _local_locks_guard = threading.Lock()
+
+    def __init__(self, name):
+        self.name = f"{Database.DATABASE}.{name}"[:64]
+        self._conn = None
+        self._local = None
+
+    @staticmethod
+    def _server_locks():
+        return Database.get().backend.SUPPORTS_ADVISORY_LOCKS
+
+    def _local_lock(self):
+        with AdvisoryLock._local_locks_guard:
+            return AdvisoryLock._local_locks.setdefault(self.name, threading.Lock())
+
+    def acquire(self, timeout=0):
+        """
+        Try to take the lock
+
+        Args:
+            timeout: Seconds to wait for another holder to release it
+
+        Returns:
+            True if this session now holds the lock
+        """
+        if not self._server_locks():
+            if self._local is None:
+                lock = self._local_lock()
+                acquired = lock.acquire(timeout=timeout) if timeout > 0 else lock.acquire(blocking=False)
+                if not acquired:
+                    return False
+                self._local = lock
+            return True
+        try:
+            if self._conn is None:
+                self._conn = Database.get().open_dedicated()
+            with self._conn.cursor() as cursor:
+                cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (self.name, timeout))
+                row = cursor.fetchone()
+            return bool(row and row['acquired'] == 1)
+        except Exception as e:
+            print(f"[AdvisoryLock] Error acquiring '{self.name}': {e}")
+            self.close()
+            return False
+
+    def is_held(self):
+        """Whether this session still holds the lock (False if the connection dropped)"""
+        if self._local is not None:
+            return True
+        if self._conn is None:
+            return False
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.execute("SELECT IS_USED_LOCK(%s) = CONNECTION_ID() AS held", (self.name,))
+                row = cursor.fetchone()
+            return bool(row and row['held'])
+        except Exception as e:
+            print(f"[AdvisoryLock] Lost connection holding '{self.name}': {e}")
+            self.close()
+            return False
+
+    def release(self):
+        if self._conn is None:
+            self.close()
+            return
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (self.name,))
+        except Exception as e:
+            print(f"[AdvisoryLock] Error releasing '{self.name}': {e}")
+        self.close()
+
+    def close(self):
+        """Close the session (which also frees the lock)"""
+        if self._local is not None:
+            self._local.release()
+            self._local = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    @classmethod
+    @contextmanager
+    def held(cls, name, timeout=0):
+        """
+        Hold a lock for the duration of a block
+
+        Yields:
+            True if the lock was acquired, False if another session holds it
+        """
+        lock = cls(name)
+        acquired = lock.acquire(timeout)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                lock.release()
+            else:
+                lock.close()
@@ -1,3 +1,4 @@
+import re
 from Project.Model.Database import Database
 
 
@@ -42,3 +43,23 @@ class Attendance:
                    ) ON DELETE CASCADE
                        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
                    """)
+
+    @staticmethod
+    def explain_access(query, params=None):
+        """
+        EXPLAIN a statement (MySQL) and report how it reads the attendance table
+
+        Args:
+            query: Statement as sent by a controller
+            params: Its parameters
+
+        Returns:
+            List of (access type, key) for each step on attendance; key is
+            None when the step scans the table
+        """
+        names = {'attendance'} | set(re.findall(r'\battendance\s+(?:AS\s+)?(\w+)', query, re.IGNORECASE))
+        plan = Database.get().query_all("EXPLAIN " + query, params)
+        return [(step.get('type'), step.get('key')) for step in plan
+                if step.get('table') in names
+                # The target row of INSERT ... SELECT isn't a read
+                and (step.get('select_type') or '').upper() not in ('INSERT', 'REPLACE')]
@@ -0,0 +1,83 @@
+from Project.Model.Database import Database
+
+
+class AttendanceChanges:
+    """Attendance change log model - handles table and trigger initialization only"""
+
+    # A cell is logged only once its day has a daily report. Days after the
+    # latest report (today's clock-ins, clock-outs and absent marking) are
+    # summarized by the daily report job, which also refreshes the running
+    # totals of that day, so the normal flow of punches logs nothing.
+    _REPORTED = "{day} <= (SELECT MAX(r.date) FROM reports r)"
+
+    @classmethod
+    def initialize(cls):
+        """
+        Create the attendance_changes log and the triggers that fill it.
+
+        Inserts, updates and deletes on attendance append the touched
+        (date, employee_id) cell so stored reports can be refreshed
+        incrementally. Foreign-key cascades don't fire triggers, so
+        EmployeeController.delete_employee records its cells explicitly.
+        """
+        db = Database.get()
+        db.execute("""
+                   CREATE TABLE IF NOT EXISTS attendance_changes
+                   (
+                       id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                       date DATE NOT NULL,
+                       employee_id INT NOT NULL,
+                       changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                   ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                   """)
+        cls.create_triggers()
+
+    @classmethod
+    def create_triggers(cls):
+        """(Re)create the attendance triggers that fill the change log"""
+        db = Database.get()
+        db.execute("DROP TRIGGER IF EXISTS trg_attendance_changes_insert")
+        db.execute(f"""
+                   CREATE TRIGGER trg_attendance_changes_insert
+                       AFTER INSERT ON attendance
+                       FOR EACH ROW
+                       INSERT INTO attendance_changes (date, employee_id)
+                       SELECT NEW.date, NEW.employee_id FROM DUAL
+                       WHERE {cls._REPORTED.format(day='NEW.date')}
+                   """)
+
+        # An update that keeps the row in its cell logs that cell once
+        db.execute("DROP TRIGGER IF EXISTS trg_attendance_changes_update")
+        db.execute(f"""
+                   CREATE TRIGGER trg_attendance_changes_update
+                       AFTER UPDATE ON attendance
+                       FOR EACH ROW
+                       INSERT INTO attendance_changes (date, employee_id)
+                       SELECT OLD.date, OLD.employee_id FROM DUAL
+                       WHERE {cls._REPORTED.format(day='OLD.date')}
+                       UNION ALL
+                       SELECT NEW.date, NEW.employee_id FROM DUAL
+                       WHERE {cls._REPORTED.format(day='NEW.date')}
+                         AND (NEW.date <> OLD.date OR NEW.employee_id <> OLD.employee_id)
+                   """)
+
+        db.execute("DROP TRIGGER IF EXISTS trg_attendance_changes_delete")
+        db.execute(f"""
+                   CREATE TRIGGER trg_attendance_changes_delete
+                       AFTER DELETE ON attendance
+                       FOR EACH ROW
+                       INSERT INTO attendance_changes (date, employee_id)
+                       SELECT OLD.date, OLD.employee_id FROM DUAL
+                       WHERE {cls._REPORTED.format(day='OLD.date')}
+                   """)
+
+    @staticmethod
+    def record_employee(employee_id):
+        """Log every attendance cell of an employee (used before cascade deletes)"""
+        db = Database.get()
+        db.execute("""
+                   INSERT INTO attendance_changes (date, employee_id)
+                   SELECT date, employee_id
+                   FROM attendance
+                   WHERE employee_id = %s
+                   """, (employee_id,))
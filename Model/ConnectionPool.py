@@ -0,0 +1,159 @@
+import threading
+import time
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of database connections.
+
+    Connections are created lazily through `factory` up to `max_size`.
+    Idle connections are health-checked on checkout and connections idle
+    for longer than `max_idle_seconds` are retired (down to `min_size`).
+    """
+
+    def __init__(self, factory, min_size=1, max_size=10, max_idle_seconds=300,
+                 health_check_after=30, acquire_timeout=10):
+        """
+        Args:
+            factory: Callable returning a new open connection
+            min_size: Connections kept open even when idle
+            max_size: Hard upper bound of open connections
+            max_idle_seconds: Idle time after which surplus connections are closed
+            health_check_after: Idle seconds after which a connection is pinged on checkout
+            acquire_timeout: Seconds to wait for a free connection before giving up
+        """
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_after = health_check_after
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Condition()
+        self._idle = []  # list of (connection, released_at)
+        self._in_use = set()
+        self._closed = False
+
+        # Statistics
+        self._created = 0
+        self._discarded = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._health_failures = 0
+        self._peak_in_use = 0
+
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+
+    def _create(self):
+        conn = self._factory()
+        self._created += 1
+        return conn
+
+    def _discard(self, conn):
+        self._discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn, idle_for):
+        """Ping connections that have been idle for a while"""
+        if idle_for < self.health_check_after:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            self._health_failures += 1
+            return False
+
+    def _retire_idle(self, now):
+        """Close surplus connections that exceeded the idle limit (lock held)"""
+        keep = []
+        total = len(self._idle) + len(self._in_use)
+        for conn, released_at in self._idle:
+            if now - released_at > self.max_idle_seconds and total > self.min_size:
+                self._discard(conn)
+                total -= 1
+            else:
+                keep.append((conn, released_at))
+        self._idle = keep
+
+    def acquire(self):
+        """Check out a healthy connection, blocking while the pool is exhausted"""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+
+            waited = False
+            while True:
+                now = time.monotonic()
+                self._retire_idle(now)
+
+                while self._idle:
+                    conn, released_at = self._idle.pop()
+                    if self._is_healthy(conn, now - released_at):
+                        return self._checkout(conn)
+                    self._discard(conn)
+
+                if len(self._in_use) < self.max_size:
+                    return self._checkout(self._create())
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise TimeoutError(
+                        f"No database connection available after {self.acquire_timeout}s "
+                        f"(max_size={self.max_size})"
+                    )
+                if not waited:
+                    self._waits += 1
+                    waited = True
+                self._lock.wait(remaining)
+
+    def _checkout(self, conn):
+        self._in_use.add(conn)
+        self._checkouts += 1
+        self._peak_in_use = max(self._peak_in_use, len(self._in_use))
+        return conn
+
+    def release(self, conn, broken=False):
+        """Return a connection to the pool (or drop it if it is broken)"""
+        with self._lock:
+            self._in_use.discard(conn)
+            if broken or self._closed:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._lock.notify()
+
+    def close(self):
+        """Close idle connections and refuse new checkouts"""
+        with self._lock:
+            self._closed = True
+            for conn, _ in self._idle:
+                self._discard(conn)
+            self._idle = []
+            self._lock.notify_all()
+
+    def get_stats(self):
+        """Snapshot of pool usage"""
+        with self._lock:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'open': len(self._idle) + len(self._in_use),
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'peak_in_use': self._peak_in_use,
+                'created': self._created,
+                'discarded': self._discarded,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'health_failures': self._health_failures,
+                'closed': self._closed
+            }
@@ -0,0 +1,23 @@
+from Project.Model.Database import Database
+
+
+class CumulativeAttendance:
+    """Per-employee running attendance totals model - handles table initialization only"""
+
+    @classmethod
+    def initialize(cls):
+        """Create the employee_cumulative_attendance table if it doesn't exist"""
+        db = Database.get()
+        db.execute("""
+                   CREATE TABLE IF NOT EXISTS employee_cumulative_attendance
+                   (
+                       employee_id INT NOT NULL,
+                       date DATE NOT NULL,
+                       cum_present INT DEFAULT 0,
+                       cum_late INT DEFAULT 0,
+                       cum_absent INT DEFAULT 0,
+                       cum_minutes BIGINT DEFAULT 0,
+                       PRIMARY KEY (employee_id, date),
+                       FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE CASCADE
+                   ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                   """)
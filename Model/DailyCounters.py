@@ -0,0 +1,22 @@
+from Project.Model.Database import Database
+
+
+class DailyCounters:
+    """Live-day attendance counters model - handles table initialization only"""
+
+    @classmethod
+    def initialize(cls):
+        """Create the attendance_daily_counters table if it doesn't exist"""
+        db = Database.get()
+        db.execute("""
+                   CREATE TABLE IF NOT EXISTS attendance_daily_counters
+                   (
+                       date DATE PRIMARY KEY,
+                       total_employees INT DEFAULT 0,
+                       present INT DEFAULT 0,
+                       late INT DEFAULT 0,
+                       absent INT DEFAULT 0,
+                       clocked_out INT DEFAULT 0,
+                       updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                   ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                   """)
@@ -1,86 +1,516 @@
-import pymysql
-from pymysql.cursors import DictCursor
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+from Project.Model.ConnectionPool import ConnectionPool
+from Project.Model.QueryStats import QueryStats
+from Project.Model.QueryBudget import QueryBudget
 
 
 class Database:
     _instance = None
-    _connection = None
+    _instance_lock = threading.Lock()
+    _pool = None
+    _backend = None
+
+    # Backend: 'mysql' (server) or 'sqlite' (embedded file or in-memory)
+    BACKEND = 'mysql'
+
+    # Connection settings
+    HOST = 'localhost'
+    USER = 'root'  # Change this to your MySQL username
+    PASSWORD = ''  # Change this to your MySQL password
+    DATABASE = 'attendance_system'
+
+    # SQLite settings: database file (default '<DATABASE>.sqlite3'), or ':memory:'
+    SQLITE_PATH = None
+    SQLITE_WAL = True
+
+    # Environment variables overriding the settings above
+    ENVIRONMENT = {
+        'BACKEND': 'ATTENDANCE_DB_BACKEND',
+        'HOST': 'ATTENDANCE_DB_HOST',
+        'USER': 'ATTENDANCE_DB_USER',
+        'PASSWORD': 'ATTENDANCE_DB_PASSWORD',
+        'DATABASE': 'ATTENDANCE_DB_NAME',
+        'SQLITE_PATH': 'ATTENDANCE_DB_PATH',
+        'SQLITE_WAL': 'ATTENDANCE_DB_WAL',
+    }
+    _configured = set()
+
+    # Statements sent since start (see statement_count)
+    _statements = 0
+    _statements_lock = threading.Lock()
+    _captures = threading.local()
+
+    # Pool settings
+    POOL_MIN_SIZE = 1
+    POOL_MAX_SIZE = 8
+    POOL_MAX_IDLE_SECONDS = 300
 
     @classmethod
     def get(cls):
         """Get database instance (singleton pattern)"""
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def _count_statement(cls, n=1, query=None, params=None):
+        with cls._statements_lock:
+            cls._statements += n
+        QueryBudget.record(n)
+        captured = getattr(cls._captures, 'statements', None)
+        if captured is not None and query is not None:
+            captured.append((query, params))
+
+    @classmethod
+    @contextmanager
+    def capture(cls):
+        """
+        Collect the statements this thread sends inside the block.
+
+        Yields:
+            List that fills with (query, params) tuples, in order
+        """
+        previous = getattr(cls._captures, 'statements', None)
+        statements = cls._captures.statements = []
+        try:
+            yield statements
+        finally:
+            cls._captures.statements = previous
+            if previous is not None:
+                previous.extend(statements)
+
+    @classmethod
+    def statement_count(cls):
+        """Total statements sent to the server by this process (for benchmarks)"""
+        return cls._statements
+
+    @staticmethod
+    @contextmanager
+    def _measured(query, params=None, statements=1):
+        """
+        Count and time a statement for QueryStats.
+
+        The block sets probe['rows'] to the rows returned or affected.
+        """
+        Database._count_statement(statements, query, params)
+        probe = {'rows': 0}
+        error = None
+        started = time.perf_counter()
+        try:
+            yield probe
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            QueryStats.record(query, time.perf_counter() - started, probe['rows'], params, error)
+
+    @classmethod
+    def configure(cls, **settings):
+        """
+        Override connection settings before the first connection is made.
+
+        Explicit settings win over the ATTENDANCE_DB_* environment variables.
+
+        Args:
+            **settings: Any of backend, host, user, password, database,
+                sqlite_path, sqlite_wal
+        """
+        if cls._pool is not None:
+            raise RuntimeError("Database is already connected; configure it before first use")
+        for key, value in settings.items():
+            attr = key.upper()
+            if attr not in cls.ENVIRONMENT:
+                raise ValueError(f"Unknown database setting: {key}")
+            setattr(cls, attr, value)
+            cls._configured.add(attr)
+
+    @classmethod
+    def configured_settings(cls):
+        """Settings passed to configure(), as keyword arguments for another process"""
+        return {attr.lower(): getattr(cls, attr) for attr in cls._configured}
+
+    @classmethod
+    def detach(cls):
+        """
+        Forget the inherited pool and backend without closing them.
+
+        For forked worker processes: the parent keeps using those sockets,
+        so the child must open its own connections on first use.
+        """
+        cls._instance = None
+        cls._pool = None
+        cls._backend = None
+
+    @classmethod
+    def effective_setting(cls, name):
+        """
+        Value a setting connects with: configure(), else its environment
+        variable, else the class default
+
+        Args:
+            name: Setting name (database, backend, sqlite_path, ...)
+        """
+        attr = name.upper()
+        variable = cls.ENVIRONMENT[attr]
+        if attr in cls._configured or variable not in os.environ:
+            return getattr(cls, attr)
+        value = os.environ[variable]
+        if attr == 'SQLITE_WAL':
+            value = value.strip().lower() not in ('0', 'false', 'no', 'off')
+        return value
+
+    @classmethod
+    def _apply_environment(cls):
+        for attr in cls.ENVIRONMENT:
+            setattr(cls, attr, cls.effective_setting(attr))
+
+    @classmethod
+    def _create_backend(cls):
+        cls._apply_environment()
+        backend = cls.BACKEND.strip().lower()
+        if backend == 'sqlite':
+            from Project.Model.SQLiteBackend import SQLiteBackend
+            return SQLiteBackend(cls.SQLITE_PATH or f"{cls.DATABASE}.sqlite3", wal=cls.SQLITE_WAL)
+        if backend == 'mysql':
+            # Imported here so SQLite installs don't need pymysql
+            from Project.Model.MySQLBackend import MySQLBackend
+            return MySQLBackend(cls.HOST, cls.USER, cls.PASSWORD, cls.DATABASE)
+        raise ValueError(f"Unknown database backend: {cls.BACKEND}")
+
     def __init__(self):
-        """Initialize database connection"""
-        if Database._connection is None:
+        """Initialize the backend and the connection pool"""
+        self._local = threading.local()
+        if Database._pool is None:
             try:
-                # First, connect without specifying database to create it
-                temp_connection = pymysql.connect(
-                    host='localhost',
-                    user='root',  # Change this to your MySQL username
-                    password='',  # Change this to your MySQL password
-                    cursorclass=DictCursor
-                )
+                backend = self._create_backend()
+                backend.prepare()
 
-                # Create database if it doesn't exist
-                with temp_connection.cursor() as cursor:
-                    cursor.execute("CREATE DATABASE IF NOT EXISTS attendance_system")
-                    print("[Database] Database 'attendance_system' created or already exists")
-
-                temp_connection.close()
-
-                # Now connect to the database
-                Database._connection = pymysql.connect(
-                    host='localhost',
-                    user='root',  # Change this to your MySQL username
-                    password='',  # Change this to your MySQL password
-                    database='attendance_system',
-                    cursorclass=DictCursor,
-                    autocommit=True
+                max_size = backend.pool_max_size(self.POOL_MAX_SIZE)
+                Database._pool = ConnectionPool(
+                    backend.connect,
+                    min_size=min(self.POOL_MIN_SIZE, max_size),
+                    max_size=max_size,
+                    max_idle_seconds=self.POOL_MAX_IDLE_SECONDS
                 )
-                print("[Database] Connected successfully to 'attendance_system'")
+                Database._backend = backend
+                print(f"[Database] Connected successfully to {backend.describe()} "
+                      f"(pool {min(self.POOL_MIN_SIZE, max_size)}-{max_size})")
             except Exception as e:
                 print(f"[Database] Connection failed: {e}")
                 raise
 
-    def execute(self, query, params=None):
-        """Execute a query that doesn't return results (INSERT, UPDATE, DELETE)"""
+    @property
+    def backend(self):
+        """The active backend (MySQLBackend or SQLiteBackend)"""
+        return Database._backend
+
+    def open_dedicated(self):
+        """
+        Open a connection outside the pool.
+
+        For session-scoped state that must outlive a single checkout, such
+        as advisory locks; the caller is responsible for closing it.
+        """
+        return Database._backend.connect()
+
+    @contextmanager
+    def connection(self):
+        """
+        Check out a connection for the current thread.
+
+        Nested use on the same thread reuses the connection that is already
+        checked out, so a block of statements runs on a single session.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = Database._pool.acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        broken = False
         try:
-            with Database._connection.cursor() as cursor:
-                cursor.execute(query, params or ())
-                Database._connection.commit()
-                return cursor
+            yield conn
         except Exception as e:
-            print(f"[Database] Execute error: {e}")
-            Database._connection.rollback()
+            broken = Database._backend.is_connection_error(e)
             raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            Database._pool.release(conn, broken=broken)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the block's statements as one transaction on one connection.
+
+        execute() and execute_many() inside the block don't commit; the
+        block commits when it ends and rolls back if it raises. A nested
+        block joins the outer transaction.
+        """
+        with self.connection() as conn:
+            if getattr(self._local, 'transaction', False):
+                yield conn
+                return
+            conn.begin()
+            self._local.transaction = True
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._local.transaction = False
+
+    def _in_transaction(self):
+        return getattr(self._local, 'transaction', False)
+
+    def execute(self, query, params=None):
+        """Execute a query that doesn't return results (INSERT, UPDATE, DELETE)"""
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    with Database._measured(query, params) as probe:
+                        cursor.execute(query, params or ())
+                        probe['rows'] = max(cursor.rowcount, 0)
+                    if not self._in_transaction():
+                        conn.commit()
+                    return cursor
+            except Exception as e:
+                print(f"[Database] Execute error: {e}")
+                if not self._in_transaction():
+                    conn.rollback()
+                raise
+
+    def execute_many(self, query, rows, batch_size=1000):
+        """
+        Execute one statement for many parameter rows.
+
+        INSERT/REPLACE statements are rewritten into multi-row
+        `VALUES (...), (...)` batches; other statements fall back to the
+        driver's executemany. Each batch runs in its own transaction
+        (inside transaction() they all join the open one).
+
+        Args:
+            query: Statement with a single `VALUES (...)` placeholder group
+            rows: Iterable of parameter tuples
+            batch_size: Maximum rows sent per round trip
+
+        Returns:
+            Total number of affected rows
+        """
+        rows = [tuple(r) for r in rows]
+        if not rows:
+            return 0
+
+        split = self._split_values_clause(query)
+        if split and Database._backend.MAX_PARAMS:
+            # Stay under the backend's bound-parameter limit
+            batch_size = max(1, min(batch_size, Database._backend.MAX_PARAMS // len(rows[0])))
+        affected = 0
+
+        with self.connection() as conn:
+            joined = self._in_transaction()
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                try:
+                    if not joined:
+                        conn.begin()
+                    with Database._measured(query, statements=1 if split else len(batch)) as probe:
+                        with conn.cursor() as cursor:
+                            if split:
+                                head, group, tail = split
+                                statement = head + ", ".join([group] * len(batch)) + tail
+                                params = [value for row in batch for value in row]
+                                probe['rows'] = cursor.execute(statement, params)
+                            else:
+                                probe['rows'] = cursor.executemany(query, batch) or 0
+                    affected += probe['rows']
+                    if not joined:
+                        conn.commit()
+                except Exception as e:
+                    print(f"[Database] Execute many error: {e}")
+                    if not joined:
+                        conn.rollback()
+                    raise
+
+        return affected
+
+    @classmethod
+    def is_duplicate_key(cls, error):
+        """Whether an exception is a unique/primary key violation"""
+        return bool(cls._backend and cls._backend.is_duplicate_key(error))
+
+    @classmethod
+    def is_missing_table(cls, error):
+        """Whether an exception says the table doesn't exist"""
+        return bool(cls._backend and cls._backend.is_missing_table(error))
+
+    def index_exists(self, table, index_name):
+        """Whether the table has an index (or unique key) with this name"""
+        return Database._backend.index_exists(self, table, index_name)
+
+    def column_exists(self, table, column):
+        """Whether the table has this column"""
+        return Database._backend.column_exists(self, table, column)
+
+    @staticmethod
+    def _split_values_clause(query):
+        """
+        Split an INSERT/REPLACE statement around its `VALUES (...)` group.
+
+        Returns:
+            Tuple (head, group, tail) or None if the statement can't be batched
+        """
+        stripped = query.lstrip().upper()
+        if not (stripped.startswith("INSERT") or stripped.startswith("REPLACE")):
+            return None
+
+        upper = query.upper()
+        idx = upper.find("VALUES")
+        if idx == -1:
+            return None
+        open_idx = query.find("(", idx)
+        if open_idx == -1:
+            return None
+
+        depth = 0
+        for pos in range(open_idx, len(query)):
+            if query[pos] == "(":
+                depth += 1
+            elif query[pos] == ")":
+                depth -= 1
+                if depth == 0:
+                    return query[:open_idx], query[open_idx:pos + 1], query[pos + 1:]
+        return None
 
     def query_one(self, query, params=None):
         """Execute a query and return one result"""
-        try:
-            with Database._connection.cursor() as cursor:
-                cursor.execute(query, params or ())
-                return cursor.fetchone()
-        except Exception as e:
-            print(f"[Database] Query one error: {e}")
-            raise
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    with Database._measured(query, params) as probe:
+                        cursor.execute(query, params or ())
+                        row = cursor.fetchone()
+                        probe['rows'] = 1 if row else 0
+                    return row
+            except Exception as e:
+                print(f"[Database] Query one error: {e}")
+                raise
 
     def query_all(self, query, params=None):
         """Execute a query and return all results"""
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    with Database._measured(query, params) as probe:
+                        cursor.execute(query, params or ())
+                        rows = cursor.fetchall()
+                        probe['rows'] = len(rows)
+                    return rows
+            except Exception as e:
+                print(f"[Database] Query all error: {e}")
+                raise
+
+    def query_iter(self, query, params=None, chunk_size=1000, chunks=False):
+        """
+        Stream query results through an unbuffered server-side cursor.
+
+        A dedicated pooled connection is held until the generator is
+        exhausted or closed, so rows are never materialized all at once.
+        Other queries issued on the same thread while iterating use their
+        own connection. Backends without streaming cursors (SQLite) fetch
+        the result first and yield it in the same shape.
+
+        Args:
+            query: SELECT statement
+            params: Query parameters
+            chunk_size: Rows fetched from the server per round
+            chunks: Yield lists of up to chunk_size rows instead of single rows
+
+        Yields:
+            Row dictionaries (or lists of them when chunks=True)
+        """
+        if not Database._backend.SUPPORTS_STREAMING:
+            rows = self.query_all(query, params)
+            for start in range(0, len(rows), chunk_size):
+                if chunks:
+                    yield rows[start:start + chunk_size]
+                else:
+                    yield from rows[start:start + chunk_size]
+            return
+
+        conn = Database._pool.acquire()
+        broken = False
+        cursor = Database._backend.stream_cursor(conn)
+        # Only time spent in the driver counts, not the consumer's work between chunks
+        fetched, elapsed, error = 0, 0.0, None
         try:
-            with Database._connection.cursor() as cursor:
-                cursor.execute(query, params or ())
-                return cursor.fetchall()
+            Database._count_statement(1, query, params)
+            started = time.perf_counter()
+            cursor.execute(query, params or ())
+            elapsed += time.perf_counter() - started
+            while True:
+                started = time.perf_counter()
+                rows = cursor.fetchmany(chunk_size)
+                elapsed += time.perf_counter() - started
+                if not rows:
+                    break
+                fetched += len(rows)
+                if chunks:
+                    yield rows
+                else:
+                    yield from rows
         except Exception as e:
-            print(f"[Database] Query all error: {e}")
+            print(f"[Database] Query iter error: {e}")
+            broken = Database._backend.is_connection_error(e)
+            error = e
             raise
+        finally:
+            # Closing an unbuffered cursor drains any unread rows so the
+            # connection is clean before it goes back to the pool
+            try:
+                cursor.close()
+            except Exception:
+                broken = True
+            Database._pool.release(conn, broken=broken)
+            QueryStats.record(query, elapsed, fetched, params, error)
+
+    def get_pool_stats(self):
+        """Return connection pool usage statistics"""
+        if Database._pool is None:
+            return {}
+        return Database._pool.get_stats()
+
+    @staticmethod
+    def get_query_stats(top=None, order_by='total_ms'):
+        """
+        Per-statement latency statistics (see QueryStats.snapshot)
+
+        Args:
+            top: Only the N most expensive statements
+            order_by: Sort key, descending
+        """
+        return QueryStats.snapshot(top=top, order_by=order_by)
 
     def close(self):
-        """Close the database connection"""
-        if Database._connection:
-            Database._connection.close()
-            Database._connection = None
-            print("[Database] Connection closed")
\ No newline at end of file
+        """Close all pooled connections"""
+        if Database._pool:
+            Database._pool.close()
+            Database._backend.close()
+            Database._pool = None
+            Database._backend = None
+            Database._instance = None
+            print("[Database] Connection pool closed")
@@ -0,0 +1,162 @@
+from Project.Model.Database import Database
+from Project.Model.Admin import Admin
+from Project.Model.Employee import Employee
+from Project.Model.Positions import Position
+from Project.Model.Attendance import Attendance
+from Project.Model.Reports import Reports
+from Project.Model.PeriodicReports import PeriodicReports
+from Project.Model.Request import LeaveRequest
+from Project.Model.DailyCounters import DailyCounters
+from Project.Model.AttendanceChanges import AttendanceChanges
+from Project.Model.CumulativeAttendance import CumulativeAttendance
+from Project.Model.SchedulerRuns import SchedulerRuns
+
+
+def _baseline(db):
+    """Create the original tables (safe on installs that already have them)"""
+    Position.initialize()
+    Employee.initialize()
+    Attendance.initialize()
+    Reports.initialize()
+    PeriodicReports.initialize()
+    LeaveRequest.initialize()
+    Admin.initialize()
+
+
+def _attendance_indexes(db):
+    """Unique (employee_id, date) key and (date, status) index on attendance"""
+    if not db.index_exists('attendance', 'uk_attendance_employee_date'):
+        # Collapse duplicate rows for the same employee and day, keeping the
+        # row with a clock-in (or the oldest one) so the unique key can apply
+        removed = db.execute("""
+                             DELETE a1
+                             FROM attendance a1
+                                      JOIN attendance a2
+                                           ON a1.employee_id = a2.employee_id
+                                               AND a1.date = a2.date
+                                               AND a1.id <> a2.id
+                             WHERE (a1.clock_in IS NULL AND a2.clock_in IS NOT NULL)
+                                OR ((a1.clock_in IS NULL) = (a2.clock_in IS NULL) AND a1.id > a2.id)
+                             """).rowcount
+        if removed:
+            print(f"[Migrations] Removed {removed} duplicate attendance rows")
+        db.execute("ALTER TABLE attendance ADD UNIQUE KEY uk_attendance_employee_date (employee_id, date)")
+
+    if not db.index_exists('attendance', 'idx_attendance_date_status'):
+        db.execute("ALTER TABLE attendance ADD INDEX idx_attendance_date_status (date, status)")
+
+
+def _daily_counters(db):
+    DailyCounters.initialize()
+
+
+def _monthly_rollup_source(db):
+    if not db.column_exists('reports_monthly', 'source'):
+        PeriodicReports.add_rollup_source()
+
+
+def _attendance_change_log(db):
+    AttendanceChanges.initialize()
+
+
+def _cumulative_totals(db):
+    from Project.Controller.CumulativeTotals import CumulativeTotals
+    CumulativeAttendance.initialize()
+    CumulativeTotals.rebuild_all()
+
+
+def _scheduler_runs(db):
+    SchedulerRuns.initialize()
+
+
+def _reported_day_change_log(db):
+    AttendanceChanges.create_triggers()
+
+
+def _scheduler_run_type(db):
+    if not db.column_exists('scheduler_runs', 'run_type'):
+        SchedulerRuns.add_run_type()
+
+
+class Migrations:
+    """
+    Versioned schema migrations.
+
+    Each entry in MIGRATIONS is (version, description, function). Versions
+    must be strictly increasing; a function receives the Database instance
+    and is only run once per install, after which its version is recorded
+    in the schema_version table.
+    """
+
+    MIGRATIONS = [
+        (1, "Baseline tables", _baseline),
+        (2, "Attendance (employee_id, date) unique key and (date, status) index", _attendance_indexes),
+        (3, "Live-day attendance counters table", _daily_counters),
+        (4, "Monthly report rollup source column", _monthly_rollup_source),
+        (5, "Attendance change log and triggers", _attendance_change_log),
+        (6, "Per-employee cumulative attendance totals", _cumulative_totals),
+        (7, "Scheduler job run ledger", _scheduler_runs),
+        (8, "Log attendance changes only for days with a daily report", _reported_day_change_log),
+        (9, "Scheduler run type (scheduled, manual, early)", _scheduler_run_type),
+    ]
+
+    @classmethod
+    def latest_version(cls):
+        return cls.MIGRATIONS[-1][0] if cls.MIGRATIONS else 0
+
+    @classmethod
+    def current_version(cls):
+        """Return the applied schema version (0 if never migrated)"""
+        db = Database.get()
+        try:
+            row = db.query_one("SELECT MAX(version) AS v FROM schema_version")
+        except Exception as e:
+            # Anything but a missing table (connection lost, no privilege)
+            # must not look like a fresh install and re-run every migration
+            if Database.is_missing_table(e):
+                return 0
+            raise
+        return int(row['v'] or 0) if row else 0
+
+    @classmethod
+    def _ensure_version_table(cls, db):
+        db.execute("""
+                   CREATE TABLE IF NOT EXISTS schema_version
+                   (
+                       version INT PRIMARY KEY,
+                       description VARCHAR(255) NOT NULL,
+                       applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                   ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                   """)
+
+    @classmethod
+    def migrate(cls):
+        """
+        Bring the schema up to date.
+
+        A current install costs a single SELECT; pending migrations are
+        applied in version order.
+
+        Returns:
+            List of versions that were applied
+        """
+        db = Database.get()
+        current = cls.current_version()
+        pending = [m for m in cls.MIGRATIONS if m[0] > current]
+        if not pending:
+            print(f"[Migrations] Schema up to date (version {current})")
+            return []
+
+        cls._ensure_version_table(db)
+        applied = []
+        for version, description, func in pending:
+            print(f"[Migrations] Applying {version}: {description}")
+            func(db)
+            db.execute(
+                "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                (version, description)
+            )
+            applied.append(version)
+
+        print(f"[Migrations] Schema migrated to version {applied[-1]}")
+        return applied
@@ -0,0 +1,97 @@
+import pymysql
+from pymysql.cursors import DictCursor, SSDictCursor
+
+
+class MySQLBackend:
+    """
+    MySQL/MariaDB server backend (pymysql).
+
+    The database is created on first use; connections are autocommit with
+    dictionary rows, which is what the rest of the code expects from every
+    backend.
+    """
+
+    NAME = 'mysql'
+    SUPPORTS_ADVISORY_LOCKS = True
+    SUPPORTS_STREAMING = True
+    # No practical limit on bound parameters per statement
+    MAX_PARAMS = None
+
+    def __init__(self, host, user, password, database):
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+
+    def describe(self):
+        return f"MySQL '{self.database}' on {self.host}"
+
+    def prepare(self):
+        """Create the database if it doesn't exist"""
+        temp_connection = pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            cursorclass=DictCursor
+        )
+        try:
+            with temp_connection.cursor() as cursor:
+                cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
+                print(f"[Database] Database '{self.database}' created or already exists")
+        finally:
+            temp_connection.close()
+
+    def pool_max_size(self, requested):
+        return requested
+
+    def connect(self):
+        """Open a new connection to the attendance database"""
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            cursorclass=DictCursor,
+            autocommit=True
+        )
+
+    def stream_cursor(self, conn):
+        """Unbuffered cursor for query_iter"""
+        return conn.cursor(SSDictCursor)
+
+    @staticmethod
+    def is_connection_error(error):
+        return isinstance(error, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
+
+    @staticmethod
+    def is_duplicate_key(error):
+        return isinstance(error, pymysql.err.IntegrityError) and error.args and error.args[0] == 1062
+
+    @staticmethod
+    def is_missing_table(error):
+        return isinstance(error, pymysql.err.ProgrammingError) and error.args and error.args[0] == 1146
+
+    @staticmethod
+    def index_exists(db, table, index_name):
+        row = db.query_one("""
+                           SELECT COUNT(*) AS c
+                           FROM information_schema.statistics
+                           WHERE table_schema = DATABASE()
+                             AND table_name = %s
+                             AND index_name = %s
+                           """, (table, index_name))
+        return bool(row and row['c'])
+
+    @staticmethod
+    def column_exists(db, table, column):
+        row = db.query_one("""
+                           SELECT COUNT(*) AS c
+                           FROM information_schema.columns
+                           WHERE table_schema = DATABASE()
+                             AND table_name = %s
+                             AND column_name = %s
+                           """, (table, column))
+        return bool(row and row['c'])
+
+    def close(self):
+        pass
@@ -294,4 +294,10 @@ class PeriodicReports:
                        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
                    """)
 
-        print("[PeriodicReports] Tables initialized: 15-day and monthly reports")
\ No newline at end of file
+        print("[PeriodicReports] Tables initialized: 15-day and monthly reports")
+
+    @classmethod
+    def add_rollup_source(cls):
+        """Record which aggregates each monthly report was built from"""
+        db = Database.get()
+        db.execute("ALTER TABLE reports_monthly ADD COLUMN source VARCHAR(32) DEFAULT 'raw'")
\ No newline at end of file
@@ -37,11 +37,7 @@ class Position:
             ('Team Head', '09:00:00', 15)
         ]
 
-        for name, time, grace in default_positions:
-            try:
-                db.execute(
-                    "INSERT IGNORE INTO positions (name, late_time, grace_period_minutes) VALUES (%s, %s, %s)",
-                    (name, time, grace)
-                )
-            except:
-                pass  # Position already exists
+        db.execute_many(
+            "INSERT IGNORE INTO positions (name, late_time, grace_period_minutes) VALUES (%s, %s, %s)",
+            default_positions
+        )
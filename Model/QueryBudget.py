@@ -0,0 +1,134 @@
+import os
+import threading
+import functools
+from collections import deque
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A block sent more statements than its QueryBudget allows"""
+
+
+class QueryBudget:
+    """
+    Counts the statements a block sends through Database on the current
+    thread and flags the block when it exceeds its declared budget.
+
+    `queries` counts statements (each row of a driver executemany is one);
+    `round_trips` counts calls into the driver. Budgets nest: a statement
+    counts against every budget open on the thread.
+
+    By default an exceeded budget is printed and kept in violations(); in
+    strict mode (strict=True, or ATTENDANCE_QUERY_BUDGET_STRICT=1 for test
+    and CI runs) QueryBudgetExceeded is raised instead. Tests use it as a
+    context manager:
+
+        with QueryBudget("refresh_reports", max_queries=3, strict=True):
+            controller.refresh_reports(page)
+
+    Blocks that open a modal dialog should only wrap their database work,
+    since the dialog's event loop runs other handlers on the same thread.
+    """
+
+    STRICT = os.environ.get('ATTENDANCE_QUERY_BUDGET_STRICT', '').strip().lower() not in ('', '0', 'false', 'no')
+
+    _local = threading.local()
+    _violations = deque(maxlen=100)
+    _violations_lock = threading.Lock()
+
+    def __init__(self, name, max_queries, max_round_trips=None, strict=None):
+        """
+        Args:
+            name: Label used in messages
+            max_queries: Allowed statements
+            max_round_trips: Allowed driver calls (defaults to max_queries)
+            strict: Raise when exceeded (default: STRICT)
+        """
+        self.name = name
+        self.max_queries = max_queries
+        self.max_round_trips = max_round_trips if max_round_trips is not None else max_queries
+        self.strict = self.STRICT if strict is None else strict
+        self.queries = 0
+        self.round_trips = 0
+
+    @classmethod
+    def _stack(cls):
+        stack = getattr(cls._local, 'stack', None)
+        if stack is None:
+            stack = cls._local.stack = []
+        return stack
+
+    @classmethod
+    def record(cls, queries=1):
+        """Count one driver call of `queries` statements against the open budgets (called by Database)"""
+        stack = getattr(cls._local, 'stack', None)
+        if not stack:
+            return
+        for budget in stack:
+            budget.queries += queries
+            budget.round_trips += 1
+
+    def __enter__(self):
+        self.queries = 0
+        self.round_trips = 0
+        self._stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stack = self._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        elif self in stack:
+            stack.remove(self)
+        # A failing block is reported by its own exception, not by the budget
+        if exc_type is None:
+            self.check()
+        return False
+
+    def check(self):
+        """Report (or raise) if the counts so far exceed the budget"""
+        if self.queries <= self.max_queries and self.round_trips <= self.max_round_trips:
+            return
+        message = (f"{self.name} sent {self.queries} statements in {self.round_trips} round trips "
+                   f"(budget {self.max_queries}/{self.max_round_trips})")
+        with QueryBudget._violations_lock:
+            QueryBudget._violations.append({
+                'name': self.name,
+                'queries': self.queries,
+                'round_trips': self.round_trips,
+                'max_queries': self.max_queries,
+                'max_round_trips': self.max_round_trips,
+            })
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        print(f"[QueryBudget] Exceeded: {message}")
+
+    @classmethod
+    def limit(cls, max_queries, max_round_trips=None, name=None):
+        """
+        Decorator form: the whole call runs under one budget
+
+        Args:
+            max_queries: Allowed statements per call
+            max_round_trips: Allowed driver calls per call
+            name: Label (default: the function's qualified name)
+        """
+        def decorator(func):
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with cls(label, max_queries, max_round_trips):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def violations(cls):
+        """Recent budget violations (most recent last)"""
+        with cls._violations_lock:
+            return list(cls._violations)
+
+    @classmethod
+    def clear_violations(cls):
+        with cls._violations_lock:
+            cls._violations.clear()
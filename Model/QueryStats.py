@@ -0,0 +1,217 @@
+import os
+import re
+import threading
+import logging
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+
+class QueryStats:
+    """
+    Per-statement latency statistics and slow-query log.
+
+    Statements are grouped by fingerprint: whitespace collapsed, literals
+    and placeholders replaced with '?', and IN (...) lists and multi-row
+    VALUES batches collapsed so the same code path always lands in one
+    entry. Each entry keeps call/row/error counts, total and maximum time,
+    and the most recent SAMPLE_SIZE latencies for percentiles.
+
+    Statements slower than SLOW_QUERY_MS are appended to a rotating log
+    file in LOG_DIR (parameters only when LOG_PARAMS is set, since they can
+    contain personal data).
+    """
+
+    # Environment variables: ATTENDANCE_SLOW_QUERY_MS, ATTENDANCE_LOG_DIR, ATTENDANCE_SLOW_QUERY_LOG
+    SLOW_QUERY_MS = float(os.environ.get('ATTENDANCE_SLOW_QUERY_MS', 200))
+    LOG_DIR = os.environ.get('ATTENDANCE_LOG_DIR', 'logs')
+    LOG_PATH = os.environ.get('ATTENDANCE_SLOW_QUERY_LOG', os.path.join(LOG_DIR, 'slow_queries.log'))
+    LOG_MAX_BYTES = 1024 * 1024
+    LOG_BACKUPS = 3
+    LOG_PARAMS = False
+
+    SAMPLE_SIZE = 500
+    MAX_FINGERPRINTS = 2000
+
+    _entries = {}
+    _lock = threading.Lock()
+    _fingerprints = {}
+    _logger = None
+    _log_lock = threading.Lock()  # opening/closing the log file, never held with _lock
+    _log_failed = False
+
+    _STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+    _NUMBER = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+    _PLACEHOLDER = re.compile(r'%s|%\(\w+\)s')
+    _IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+    _VALUES_LIST = re.compile(r'\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+', re.IGNORECASE)
+
+    @classmethod
+    def configure(cls, slow_query_ms=None, log_path=None, max_bytes=None, backups=None, log_params=None):
+        """Change the slow-query threshold or log settings (reopens the log)"""
+        if slow_query_ms is not None:
+            cls.SLOW_QUERY_MS = slow_query_ms
+        if log_path is not None:
+            cls.LOG_PATH = log_path
+        if max_bytes is not None:
+            cls.LOG_MAX_BYTES = max_bytes
+        if backups is not None:
+            cls.LOG_BACKUPS = backups
+        if log_params is not None:
+            cls.LOG_PARAMS = log_params
+        with cls._log_lock:
+            cls._close_logger()
+            cls._log_failed = False
+
+    @classmethod
+    def fingerprint(cls, query):
+        """Normalized form of a statement (cached per query text)"""
+        cached = cls._fingerprints.get(query)
+        if cached is not None:
+            return cached
+
+        text = cls._STRING.sub('?', query)
+        text = cls._PLACEHOLDER.sub('?', text)
+        text = cls._NUMBER.sub('?', text)
+        text = ' '.join(text.split())
+        text = cls._IN_LIST.sub('IN (...)', text)
+        text = cls._VALUES_LIST.sub(r'VALUES \1, ...', text)
+
+        if len(cls._fingerprints) >= cls.MAX_FINGERPRINTS:
+            cls._fingerprints.clear()
+        cls._fingerprints[query] = text
+        return text
+
+    @classmethod
+    def record(cls, query, seconds, rows=0, params=None, error=None):
+        """
+        Record one statement execution
+
+        Args:
+            query: Statement text as sent by the caller
+            seconds: Elapsed time
+            rows: Rows returned or affected
+            params: Parameters (written to the slow log only if LOG_PARAMS)
+            error: Exception raised by the statement, if any
+        """
+        fingerprint = cls.fingerprint(query)
+        elapsed_ms = seconds * 1000
+        with cls._lock:
+            entry = cls._entries.get(fingerprint)
+            if entry is None:
+                entry = {
+                    'calls': 0,
+                    'errors': 0,
+                    'rows': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'slow': 0,
+                    'samples': deque(maxlen=cls.SAMPLE_SIZE),
+                }
+                cls._entries[fingerprint] = entry
+            entry['calls'] += 1
+            entry['rows'] += rows or 0
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['samples'].append(elapsed_ms)
+            if error is not None:
+                entry['errors'] += 1
+
+            slow = cls.SLOW_QUERY_MS is not None and elapsed_ms >= cls.SLOW_QUERY_MS
+            if slow:
+                entry['slow'] += 1
+
+        # Written outside the lock so other threads' statements don't wait on disk
+        if slow:
+            cls._log_slow(fingerprint, elapsed_ms, rows, params, error)
+
+    @classmethod
+    def _get_logger(cls):
+        """Rotating slow-query logger, opened on first use"""
+        with cls._log_lock:
+            if cls._logger is not None:
+                return cls._logger
+            logger = logging.getLogger('attendance.slow_queries')
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            log_dir = os.path.dirname(cls.LOG_PATH)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            handler = RotatingFileHandler(cls.LOG_PATH, maxBytes=cls.LOG_MAX_BYTES,
+                                          backupCount=cls.LOG_BACKUPS, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            logger.addHandler(handler)
+            cls._logger = logger
+            return logger
+
+    @classmethod
+    def _close_logger(cls):
+        if cls._logger is not None:
+            for handler in list(cls._logger.handlers):
+                cls._logger.removeHandler(handler)
+                handler.close()
+            cls._logger = None
+
+    @classmethod
+    def _log_slow(cls, fingerprint, elapsed_ms, rows, params, error):
+        if cls._log_failed:
+            return
+        message = f"{elapsed_ms:.1f}ms rows={rows} {fingerprint}"
+        if cls.LOG_PARAMS and params:
+            message += f" params={str(params)[:500]}"
+        if error is not None:
+            message += f" error={error}"
+        try:
+            cls._get_logger().info(message)
+        except Exception as e:
+            # Stop writing the file; slow statements are still counted
+            with cls._log_lock:
+                if not cls._log_failed:
+                    print(f"[QueryStats] Slow query log unavailable: {e}")
+                cls._log_failed = True
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    @classmethod
+    def snapshot(cls, top=None, order_by='total_ms'):
+        """
+        Current statistics per fingerprint
+
+        Args:
+            top: Only the first N entries
+            order_by: Sort key, descending (total_ms, calls, p95_ms, max_ms, rows, ...)
+
+        Returns:
+            List of dictionaries (fingerprint, calls, errors, rows, total_ms,
+            mean_ms, p50_ms, p95_ms, p99_ms, max_ms, slow)
+        """
+        with cls._lock:
+            items = [(fingerprint, dict(entry, samples=sorted(entry['samples'])))
+                     for fingerprint, entry in cls._entries.items()]
+
+        result = []
+        for fingerprint, entry in items:
+            samples = entry['samples']
+            result.append({
+                'fingerprint': fingerprint,
+                'calls': entry['calls'],
+                'errors': entry['errors'],
+                'rows': entry['rows'],
+                'total_ms': round(entry['total_ms'], 3),
+                'mean_ms': round(entry['total_ms'] / entry['calls'], 3),
+                'p50_ms': round(cls._percentile(samples, 50), 3),
+                'p95_ms': round(cls._percentile(samples, 95), 3),
+                'p99_ms': round(cls._percentile(samples, 99), 3),
+                'max_ms': round(entry['max_ms'], 3),
+                'slow': entry['slow'],
+            })
+        result.sort(key=lambda r: r[order_by], reverse=True)
+        return result[:top] if top else result
+
+    @classmethod
+    def reset(cls):
+        """Forget all collected statistics"""
+        with cls._lock:
+            cls._entries = {}
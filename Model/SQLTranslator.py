@@ -0,0 +1,260 @@
+import re
+import threading
+
+
+class SQLTranslator:
+    """
+    Rewrites the MySQL dialect used by the models and controllers into
+    SQLite.
+
+    Covers what this project uses: %s placeholders, CREATE TABLE options
+    (AUTO_INCREMENT, ENGINE, ENUM, inline KEY/INDEX, ON UPDATE
+    CURRENT_TIMESTAMP), ALTER TABLE ... ADD [UNIQUE] KEY/INDEX, INSERT
+    IGNORE, ON DUPLICATE KEY UPDATE / VALUES(), multi-table UPDATE ... JOIN
+    and DELETE alias FROM ... JOIN, single-statement triggers, FROM DUAL,
+    and the NOW/CURDATE/CONCAT/TIMESTAMPDIFF/LAST_INSERT_ID functions.
+
+    A statement may translate into several (e.g. a CREATE TABLE plus its
+    CREATE INDEX statements), so to_sqlite() returns a list. Results are
+    cached per query text.
+    """
+
+    CACHE_SIZE = 1024
+
+    _cache = {}
+    _lock = threading.Lock()
+
+    _TIMESTAMPDIFF_FACTORS = {
+        'SECOND': 86400,
+        'MINUTE': 1440,
+        'HOUR': 24,
+        'DAY': 1,
+    }
+
+    @classmethod
+    def to_sqlite(cls, query):
+        """
+        Translate one MySQL statement
+
+        Returns:
+            List of SQLite statements (qmark placeholders)
+        """
+        with cls._lock:
+            cached = cls._cache.get(query)
+        if cached is not None:
+            return cached
+
+        translated = cls._translate(query)
+        with cls._lock:
+            if len(cls._cache) >= cls.CACHE_SIZE:
+                cls._cache.clear()
+            cls._cache[query] = translated
+        return translated
+
+    # --- Helpers -------------------------------------------------------
+
+    @staticmethod
+    def _matching_paren(text, open_idx):
+        """Index of the ')' closing the '(' at open_idx (quote-aware)"""
+        depth = 0
+        quote = None
+        for pos in range(open_idx, len(text)):
+            ch = text[pos]
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in ("'", '"', '`'):
+                quote = ch
+            elif ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+                if depth == 0:
+                    return pos
+        raise ValueError(f"Unbalanced parentheses in: {text[:80]}")
+
+    @staticmethod
+    def _split_top_level(text, separator=','):
+        """Split on separator outside parentheses and quotes"""
+        parts, depth, quote, start = [], 0, None, 0
+        for pos, ch in enumerate(text):
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in ("'", '"', '`'):
+                quote = ch
+            elif ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            elif ch == separator and depth == 0:
+                parts.append(text[start:pos])
+                start = pos + 1
+        parts.append(text[start:])
+        return parts
+
+    @classmethod
+    def _rewrite_calls(cls, sql, name, build):
+        """Replace every NAME(args...) call with build(list_of_args)"""
+        pattern = re.compile(r'\b' + name + r'\s*\(', re.IGNORECASE)
+        while True:
+            match = pattern.search(sql)
+            if not match:
+                return sql
+            open_idx = match.end() - 1
+            close_idx = cls._matching_paren(sql, open_idx)
+            args = [a.strip() for a in cls._split_top_level(sql[open_idx + 1:close_idx])]
+            sql = sql[:match.start()] + build(args) + sql[close_idx + 1:]
+
+    @classmethod
+    def _timestampdiff(cls, args):
+        unit, start, end = args[0].upper(), args[1], args[2]
+        factor = cls._TIMESTAMPDIFF_FACTORS[unit]
+        return f"CAST(ROUND((julianday({end}) - julianday({start})) * {factor}, 6) AS INTEGER)"
+
+    # --- Statement rewrites --------------------------------------------
+
+    @classmethod
+    def _translate(cls, query):
+        sql = query.replace('%s', '?').replace('%%', '%').strip().rstrip(';')
+        upper = sql.upper()
+
+        if re.match(r'CREATE\s+TABLE\b', upper):
+            return cls._create_table(sql)
+        if re.match(r'ALTER\s+TABLE\b', upper):
+            index = cls._alter_add_index(sql)
+            if index:
+                return [index]
+        if re.match(r'CREATE\s+TRIGGER\b', upper):
+            return [cls._trigger(sql)]
+
+        sql = cls._functions(sql)
+        if re.match(r'DELETE\s+\w+\s+FROM\b', sql, re.IGNORECASE):
+            sql = cls._delete_join(sql)
+        elif re.match(r'UPDATE\s+\w+\s+(AS\s+)?\w+\s+JOIN\b', sql, re.IGNORECASE):
+            sql = cls._update_join(sql)
+
+        sql = re.sub(r'^INSERT\s+IGNORE\b', 'INSERT OR IGNORE', sql, flags=re.IGNORECASE)
+        if re.search(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', sql, re.IGNORECASE):
+            sql = cls._upsert(sql)
+        return [sql]
+
+    @classmethod
+    def _functions(cls, sql):
+        sql = re.sub(r'\bNOW\(\)', "datetime('now', 'localtime')", sql, flags=re.IGNORECASE)
+        sql = re.sub(r'\bCURDATE\(\)', "date('now', 'localtime')", sql, flags=re.IGNORECASE)
+        sql = re.sub(r'\bLAST_INSERT_ID\(\)', "last_insert_rowid()", sql, flags=re.IGNORECASE)
+        sql = re.sub(r'\s+FROM\s+DUAL\b', "", sql, flags=re.IGNORECASE)
+        sql = cls._rewrite_calls(sql, 'CONCAT', lambda args: "(" + " || ".join(args) + ")")
+        sql = cls._rewrite_calls(sql, 'TIMESTAMPDIFF', cls._timestampdiff)
+        return sql
+
+    @classmethod
+    def _column_definition(cls, item):
+        item = re.sub(r'\b(BIG)?INT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b',
+                      'INTEGER PRIMARY KEY AUTOINCREMENT', item, flags=re.IGNORECASE)
+        item = re.sub(r'\bAUTO_INCREMENT\b', '', item, flags=re.IGNORECASE)
+        item = re.sub(r'\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b', '', item, flags=re.IGNORECASE)
+        item = re.sub(r'\bENUM\s*\([^)]*\)', 'TEXT', item, flags=re.IGNORECASE)
+        item = re.sub(r'\bDEFAULT\s+CURRENT_TIMESTAMP\b', "DEFAULT (datetime('now', 'localtime'))",
+                      item, flags=re.IGNORECASE)
+        return item.strip()
+
+    @classmethod
+    def _create_table(cls, sql):
+        match = re.match(r'CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(', sql, re.IGNORECASE)
+        table = match.group(2)
+        open_idx = match.end() - 1
+        body = sql[open_idx + 1:cls._matching_paren(sql, open_idx)]
+
+        items, indexes = [], []
+        for raw in cls._split_top_level(body):
+            item = re.sub(r'\s+', ' ', raw).strip()
+            index = re.match(r'(UNIQUE\s+)?(?:KEY|INDEX)\s+(\w+)\s*\((.*)\)$', item, re.IGNORECASE)
+            if index:
+                unique = "UNIQUE " if index.group(1) else ""
+                indexes.append(f"CREATE {unique}INDEX IF NOT EXISTS {index.group(2)} "
+                               f"ON {table} ({index.group(3)})")
+            else:
+                items.append(cls._column_definition(item))
+
+        create = f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(items)})"
+        return [create] + indexes
+
+    @staticmethod
+    def _alter_add_index(sql):
+        match = re.match(r'ALTER\s+TABLE\s+(\w+)\s+ADD\s+(UNIQUE\s+)?(?:KEY|INDEX)\s+(\w+)\s*\((.*)\)\s*$',
+                         sql, re.IGNORECASE | re.DOTALL)
+        if not match:
+            return None
+        unique = "UNIQUE " if match.group(2) else ""
+        return f"CREATE {unique}INDEX IF NOT EXISTS {match.group(3)} ON {match.group(1)} ({match.group(4)})"
+
+    @classmethod
+    def _trigger(cls, sql):
+        match = re.match(r'(CREATE\s+TRIGGER\s+.*?\bFOR\s+EACH\s+ROW)\s+(.*)$', sql, re.IGNORECASE | re.DOTALL)
+        if not match or re.match(r'BEGIN\b', match.group(2), re.IGNORECASE):
+            return sql
+        return f"{match.group(1)} BEGIN {cls._functions(match.group(2))}; END"
+
+    @staticmethod
+    def _delete_join(sql):
+        """DELETE a FROM t a JOIN ... -> DELETE FROM t WHERE rowid IN (SELECT a.rowid FROM t a JOIN ...)"""
+        match = re.match(r'DELETE\s+(\w+)\s+FROM\s+(\w+)\s+(?:AS\s+)?(\w+)\b(.*)$', sql, re.IGNORECASE | re.DOTALL)
+        if not match or match.group(1) != match.group(3):
+            return sql
+        alias, table, rest = match.group(1), match.group(2), match.group(4)
+        return f"DELETE FROM {table} WHERE rowid IN (SELECT {alias}.rowid FROM {table} {alias}{rest})"
+
+    @classmethod
+    def _update_join(cls, sql):
+        """UPDATE t a JOIN src b ON cond SET a.x = ... -> UPDATE t AS a SET x = ... FROM src AS b WHERE cond"""
+        match = re.match(r'UPDATE\s+(\w+)\s+(?:AS\s+)?(\w+)\s+JOIN\s+', sql, re.IGNORECASE)
+        table, alias = match.group(1), match.group(2)
+        rest = sql[match.end():]
+
+        if rest.startswith('('):
+            close_idx = cls._matching_paren(rest, 0)
+            source, rest = rest[:close_idx + 1], rest[close_idx + 1:]
+        else:
+            source, rest = rest.split(None, 1)
+        source_match = re.match(r'\s*(?:AS\s+)?(\w+)\s+ON\s+(.*?)\s+SET\s+(.*)$', rest, re.IGNORECASE | re.DOTALL)
+        source_alias, condition, assignments = source_match.groups()
+
+        where = None
+        where_match = re.search(r'\s+WHERE\s+', assignments, re.IGNORECASE)
+        if where_match:
+            assignments, where = assignments[:where_match.start()], assignments[where_match.end():]
+
+        targets = []
+        for assignment in cls._split_top_level(assignments):
+            targets.append(re.sub(r'^\s*' + alias + r'\.(\w+)\s*=', r'\1 =', assignment.strip()))
+
+        statement = (f"UPDATE {table} AS {alias} SET {', '.join(targets)} "
+                     f"FROM {source} AS {source_alias} WHERE {condition}")
+        if where:
+            statement += f" AND ({where})"
+        return statement
+
+    @classmethod
+    def _upsert(cls, sql):
+        """INSERT ... ON DUPLICATE KEY UPDATE c = VALUES(c) -> INSERT ... ON CONFLICT DO UPDATE SET c = excluded.c"""
+        match = re.search(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', sql, re.IGNORECASE)
+        head, tail = sql[:match.start()].rstrip(), sql[match.end():]
+
+        assignments = []
+        for assignment in cls._split_top_level(tail):
+            assignment = assignment.strip()
+            # id = LAST_INSERT_ID(id) only exposes the row id to MySQL clients
+            if re.match(r'\w+\s*=\s*LAST_INSERT_ID\(', assignment, re.IGNORECASE):
+                continue
+            assignments.append(re.sub(r'\bVALUES\s*\(\s*(\w+)\s*\)', r'excluded.\1', assignment,
+                                      flags=re.IGNORECASE))
+
+        # INSERT ... SELECT needs a WHERE before ON CONFLICT to parse unambiguously
+        insert = re.match(r'(INSERT\s+(?:OR\s+IGNORE\s+)?INTO\s+\w+\s*\([^)]*\))\s*(SELECT\b.*)$',
+                          head, re.IGNORECASE | re.DOTALL)
+        if insert:
+            head = f"{insert.group(1)} SELECT * FROM ({insert.group(2)}) WHERE true"
+
+        return f"{head} ON CONFLICT DO UPDATE SET {', '.join(assignments)}"
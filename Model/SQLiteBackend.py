@@ -0,0 +1,236 @@
+import os
+import re
+import sqlite3
+import itertools
+from decimal import Decimal
+from datetime import date, datetime, time, timedelta
+
+from Project.Model.SQLTranslator import SQLTranslator
+
+
+def _format_timedelta(value):
+    seconds = int(value.total_seconds())
+    sign = "-" if seconds < 0 else ""
+    seconds = abs(seconds)
+    return f"{sign}{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(sep=' ', timespec='seconds'))
+sqlite3.register_adapter(time, lambda t: t.isoformat(timespec='seconds'))
+sqlite3.register_adapter(timedelta, _format_timedelta)
+sqlite3.register_adapter(Decimal, float)
+
+_TIME = re.compile(r'^(-?)(\d{1,3}):(\d{2}):(\d{2})(?:\.\d+)?$')
+
+
+def _to_date(value):
+    return date.fromisoformat(value.decode()[:10])
+
+
+def _to_datetime(value):
+    return datetime.fromisoformat(value.decode())
+
+
+def _to_timedelta(value):
+    """TIME columns come back as timedelta, like pymysql's"""
+    text = value.decode()
+    match = _TIME.match(text)
+    if not match:
+        return text
+    sign, hours, minutes, seconds = match.groups()
+    delta = timedelta(hours=int(hours), minutes=int(minutes), seconds=int(seconds))
+    return -delta if sign else delta
+
+
+# Applied by declared column type (detect_types=PARSE_DECLTYPES), never by
+# what a value looks like, so free text stays text
+sqlite3.register_converter('DATE', _to_date)
+sqlite3.register_converter('DATETIME', _to_datetime)
+sqlite3.register_converter('TIMESTAMP', _to_datetime)
+sqlite3.register_converter('TIME', _to_timedelta)
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+class _SQLiteCursor:
+    """pymysql-style cursor: MySQL statements in, dictionary rows out"""
+
+    def __init__(self, raw):
+        self._cursor = raw.cursor()
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query, params=()):
+        statements = SQLTranslator.to_sqlite(query)
+        # Only the first statement carries parameters (the rest are generated DDL)
+        for statement, args in zip(statements, itertools.chain([tuple(params)], itertools.repeat(()))):
+            self._cursor.execute(statement, args)
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+        return max(self.rowcount, 0)
+
+    def executemany(self, query, rows):
+        statement, = SQLTranslator.to_sqlite(query)
+        self._cursor.executemany(statement, [tuple(r) for r in rows])
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid
+        return max(self.rowcount, 0)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size):
+        return self._cursor.fetchmany(size)
+
+    def close(self):
+        self._cursor.close()
+
+
+class _SQLiteConnection:
+    """The subset of the pymysql connection API used by Database and ConnectionPool"""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def cursor(self, cursor_class=None):
+        return _SQLiteCursor(self._raw)
+
+    def begin(self):
+        if not self._raw.in_transaction:
+            self._raw.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def ping(self, reconnect=False):
+        self._raw.execute("SELECT 1")
+
+    def close(self):
+        self._raw.close()
+
+
+class SQLiteBackend:
+    """
+    Embedded SQLite backend.
+
+    Statements written for MySQL are translated by SQLTranslator, and rows
+    come back as dictionaries with date, datetime and TIME (timedelta)
+    values, like pymysql's, for columns declared with those types
+    (expressions such as MAX(date) come back as their stored text). File databases use WAL so readers don't block
+    the writer; PATH ':memory:' gives a throwaway in-memory database shared
+    by every connection of this process (kept alive by one extra
+    connection, and limited to a single pooled connection since shared
+    cache locks per table).
+
+    There are no server-side advisory locks: AdvisoryLock falls back to
+    process-local locks, which is enough for a single installation.
+    """
+
+    NAME = 'sqlite'
+    SUPPORTS_ADVISORY_LOCKS = False
+    SUPPORTS_STREAMING = False
+    MAX_PARAMS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    BUSY_TIMEOUT_SECONDS = 30
+
+    def __init__(self, path, wal=True):
+        self.path = path
+        self.wal = wal
+        self.memory = path == ':memory:'
+        self._keeper = None
+        self._uri = f"file:attendance_{id(self)}?mode=memory&cache=shared"
+
+    def describe(self):
+        if self.memory:
+            return "SQLite (in memory)"
+        return f"SQLite '{self.path}'" + (" (WAL)" if self.wal else "")
+
+    def _open(self):
+        if self.memory:
+            raw = sqlite3.connect(self._uri, uri=True, timeout=self.BUSY_TIMEOUT_SECONDS,
+                                  isolation_level=None, check_same_thread=False,
+                                  detect_types=sqlite3.PARSE_DECLTYPES)
+        else:
+            raw = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT_SECONDS,
+                                  isolation_level=None, check_same_thread=False,
+                                  detect_types=sqlite3.PARSE_DECLTYPES)
+        raw.row_factory = _dict_row
+        raw.execute("PRAGMA foreign_keys = ON")
+        if self.wal and not self.memory:
+            raw.execute("PRAGMA synchronous = NORMAL")
+        return raw
+
+    def prepare(self):
+        """Create the database file (or the in-memory database) and switch on WAL"""
+        if self.memory:
+            self._keeper = self._open()
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        raw = self._open()
+        try:
+            mode = raw.execute(f"PRAGMA journal_mode = {'WAL' if self.wal else 'DELETE'}").fetchone()
+            print(f"[Database] SQLite database '{self.path}' ready "
+                  f"(journal_mode={list(mode.values())[0]})")
+        finally:
+            raw.close()
+
+    def pool_max_size(self, requested):
+        return 1 if self.memory else requested
+
+    def connect(self):
+        return _SQLiteConnection(self._open())
+
+    @staticmethod
+    def is_connection_error(error):
+        return isinstance(error, (sqlite3.InterfaceError, sqlite3.ProgrammingError))
+
+    @staticmethod
+    def is_duplicate_key(error):
+        return isinstance(error, sqlite3.IntegrityError) and 'UNIQUE constraint failed' in str(error)
+
+    @staticmethod
+    def is_missing_table(error):
+        return isinstance(error, sqlite3.OperationalError) and 'no such table' in str(error)
+
+    @staticmethod
+    def index_exists(db, table, index_name):
+        row = db.query_one("""
+                           SELECT COUNT(*) AS c
+                           FROM sqlite_master
+                           WHERE type = 'index'
+                             AND tbl_name = %s
+                             AND name = %s
+                           """, (table, index_name))
+        return bool(row and row['c'])
+
+    @staticmethod
+    def column_exists(db, table, column):
+        row = db.query_one("SELECT COUNT(*) AS c FROM pragma_table_info(%s) WHERE name = %s",
+                           (table, column))
+        return bool(row and row['c'])
+
+    def close(self):
+        if self._keeper is not None:
+            self._keeper.close()
+            self._keeper = None
@@ -0,0 +1,52 @@
+from Project.Model.Database import Database
+
+
+class SchedulerRuns:
+    """Scheduler job ledger model - handles table initialization only"""
+
+    # Pseudo-job recording when the ledger started; catch-up never looks
+    # further back than this
+    LEDGER_JOB = 'ledger'
+
+    @classmethod
+    def initialize(cls):
+        """
+        Create the scheduler_runs table if it doesn't exist.
+
+        One row per (job, target period); re-running a period updates its row.
+        """
+        db = Database.get()
+        db.execute("""
+                   CREATE TABLE IF NOT EXISTS scheduler_runs
+                   (
+                       id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                       job VARCHAR(32) NOT NULL,
+                       target_start DATE NOT NULL,
+                       target_end DATE NOT NULL,
+                       scheduled_for DATETIME NOT NULL,
+                       started_at DATETIME NULL,
+                       finished_at DATETIME NULL,
+                       duration_ms INT NULL,
+                       rows_affected INT NULL,
+                       status ENUM('running', 'success', 'failed') DEFAULT 'running',
+                       error TEXT NULL,
+                       UNIQUE KEY uk_scheduler_runs_target (job, target_start, target_end),
+                       INDEX idx_scheduler_runs_scheduled (job, scheduled_for)
+                   ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                   """)
+
+        db.execute("""
+                   INSERT IGNORE INTO scheduler_runs
+                       (job, target_start, target_end, scheduled_for, started_at, finished_at, status)
+                   VALUES (%s, CURDATE(), CURDATE(), NOW(), NOW(), NOW(), 'success')
+                   """, (cls.LEDGER_JOB,))
+
+    @classmethod
+    def add_run_type(cls):
+        """
+        Record how each run was started: 'scheduled', 'manual', or 'early'
+        (a manual run before its period's scheduled time, which doesn't
+        complete the period)
+        """
+        db = Database.get()
+        db.execute("ALTER TABLE scheduler_runs ADD COLUMN run_type VARCHAR(16) NOT NULL DEFAULT 'scheduled'")
@@ -0,0 +1,47 @@
+import argparse
+import json
+from datetime import date, timedelta
+
+from Project.Model.Database import Database
+from Project.Controller.ScratchDatabase import ScratchDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay days of attendance and scheduler jobs on a simulated clock")
+    ScratchDatabase.add_arguments(parser, default="attendance_system_sim")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First simulated date (default: DAYS days ago)")
+    parser.add_argument("--employees", type=int, default=50,
+                        help="Create synthetic employees up to this count")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--include-weekends", action="store_true")
+    parser.add_argument("--json", help="Write the metrics to this file")
+    args = parser.parse_args()
+
+    ScratchDatabase.use(args, parser, "simulate")
+
+    # Imported after the database is switched so nothing touches the live one
+    from Project.Controller.SimulationDriver import SimulationDriver
+
+    start = args.start or date.today() - timedelta(days=args.days)
+    driver = SimulationDriver(seed=args.seed, workdays_only=not args.include_weekends)
+    metrics = driver.run(start, args.days, employees=args.employees)
+
+    print(f"\n[Simulation] {metrics['days']} days, {metrics['punches']} punches "
+          f"in {metrics['wall_seconds']}s ({metrics['simulated_days_per_minute']} days/min)")
+    for name, op in metrics['operations'].items():
+        rows = f", {op['rows']} rows" if 'rows' in op else ""
+        print(f"  {name:<24} n={op['count']:<6} p50={op['p50_ms']}ms p95={op['p95_ms']}ms "
+              f"max={op['max_ms']}ms{rows}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(metrics, f, indent=2, default=str)
+        print(f"[Simulation] Metrics written to {args.json}")
+
+    Database.get().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (
     QSizePolicy, QGroupBox
 )
 
+from Project.View.LoadingIndicator import LoadingIndicator
+
 
 class PieChartWidget(QWidget):
     """Simple pie chart widget for attendance visualization"""
@@ -121,6 +123,7 @@ class DashboardPage(QWidget):
         self.logo_paths = logo_paths
         self.all_records = []
         self.build_ui()
+        self.loading_indicator = LoadingIndicator(self)
 
         self.pie_chart.set_data(0, 1)  # Show at least a red circle by default
         self.apply_theme("light")
@@ -249,6 +252,10 @@ class DashboardPage(QWidget):
         # In a real app, this would trigger controller
         pass
 
+    def set_loading(self, loading):
+        """Show or hide the loading badge while the controller fetches data"""
+        self.loading_indicator.set_active(loading)
+
     def update_stats(self, total, clocked_in, not_clocked_in):
         """Update the stat cards with new values"""
         self.card_total.set_value(f"{total} Employees")
@@ -185,12 +185,12 @@ class AddPositionDialog(BaseDialog):
 
 # --- ADD EMPLOYEE ---
 class AddEmployeeDialog(BaseDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, positions=None):
         super().__init__(parent)
         self.setWindowTitle("Add Employee")
         self.setFixedSize(450, 780)
         self.employee_data = None
-        self.positions = get_position_items()
+        self.positions = positions if positions is not None else get_position_items()
         self.build_ui()
 
     def build_ui(self):
@@ -282,13 +282,13 @@ class AddEmployeeDialog(BaseDialog):
 
 # --- EDIT EMPLOYEE ---
 class EditEmployeeDialog(BaseDialog):
-    def __init__(self, employee_data, parent=None):
+    def __init__(self, employee_data, parent=None, positions=None):
         super().__init__(parent)
         self.setWindowTitle("Edit Employee")
         self.setFixedSize(450, 700)
         self.employee_data = employee_data
         self.updated_data = None
-        self.positions = get_position_items()
+        self.positions = positions if positions is not None else get_position_items()
         self.build_ui()
 
     def build_ui(self):
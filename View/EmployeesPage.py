@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import (
     QFrame, QTableWidget, QTableWidgetItem, QHeaderView, QComboBox
 )
 
+from Project.View.LoadingIndicator import LoadingIndicator
+
 
 class EmployeesPage(QWidget):
     """Employee management page with improved styling"""
@@ -16,6 +18,7 @@ class EmployeesPage(QWidget):
         self.all_employees = []
         self.selected_row = -1
         self.build_ui()
+        self.loading_indicator = LoadingIndicator(self)
         self.apply_theme("light")
 
     def build_ui(self):
@@ -120,6 +123,10 @@ class EmployeesPage(QWidget):
             employee_data = self.all_employees[self.selected_row]
             self.on_edit_employee(employee_data)
 
+    def set_loading(self, loading):
+        """Show or hide the loading badge while the controller fetches data"""
+        self.loading_indicator.set_active(loading)
+
     def populate_table(self, employees):
         """Populate table with employee data"""
         self.all_employees = employees
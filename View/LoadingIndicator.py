@@ -0,0 +1,54 @@
+from PyQt6.QtCore import Qt, QTimer, QEvent
+from PyQt6.QtWidgets import QLabel
+
+
+class LoadingIndicator(QLabel):
+    """Small animated "Loading..." badge floating in the top-right corner of a page"""
+
+    def __init__(self, parent):
+        super().__init__("Loading...", parent)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: rgba(17, 24, 39, 200);
+                color: #ffffff;
+                border-radius: 10px;
+                padding: 4px 12px;
+                font-size: 12px;
+                font-weight: 600;
+            }
+        """)
+        self.adjustSize()
+        self.setFixedSize(self.size())  # widest text, so the dots don't make it jitter
+        self.hide()
+
+        self._dots = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(400)
+        self._timer.timeout.connect(self._tick)
+        parent.installEventFilter(self)
+
+    def set_active(self, active):
+        if active:
+            self._dots = 0
+            self._tick()
+            self._place()
+            self.show()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.hide()
+
+    def _tick(self):
+        self._dots = self._dots % 3 + 1
+        self.setText("Loading" + "." * self._dots)
+
+    def _place(self):
+        parent = self.parentWidget()
+        self.move(max(0, parent.width() - self.width() - 28), 12)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Resize and self.isVisible():
+            self._place()
+        return False
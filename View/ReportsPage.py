@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import (
     QFrame, QTableWidget, QTableWidgetItem, QHeaderView, QTabWidget
 )
 
+from Project.View.LoadingIndicator import LoadingIndicator
+
 
 class ReportsPage(QWidget):
     def __init__(self):
@@ -16,6 +18,7 @@ class ReportsPage(QWidget):
         self.data_monthly = []
 
         self.build_ui()
+        self.loading_indicator = LoadingIndicator(self)
         self.apply_theme("light")
 
     def build_ui(self):
@@ -151,6 +154,10 @@ class ReportsPage(QWidget):
 
     # === POPULATION METHODS (Called by Controller) ===
 
+    def set_loading(self, loading):
+        """Show or hide the loading badge while the controller fetches data"""
+        self.loading_indicator.set_active(loading)
+
     def populate_table(self, reports):
         """Load Daily Reports"""
         self.daily_data = reports
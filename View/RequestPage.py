@@ -5,20 +5,39 @@ from PyQt6.QtWidgets import (
 )
 
 from Project.View.Dialogs import CompactMessageDialog, RequestDetailsDialog
+from Project.View.LoadingIndicator import LoadingIndicator
 
 
 class RequestsPage(QWidget):
     def __init__(self):
         super().__init__()
         self.cached_requests = []
+        # Set by the controller to load in the background; load_data() otherwise
+        self.on_load_requested = None
         self.build_ui()
+        self.loading_indicator = LoadingIndicator(self)
         # Initial empty state
         self.table.setRowCount(0)
 
     def showEvent(self, event):
         """Load data when page becomes visible"""
         super().showEvent(event)
-        self.load_data()
+        self.request_load()
+
+    def request_load(self):
+        if self.on_load_requested:
+            self.on_load_requested()
+        else:
+            self.load_data()
+
+    def set_loading(self, loading):
+        """Show or hide the loading badge while the controller fetches data"""
+        self.loading_indicator.set_active(loading)
+
+    def get_status_filter(self):
+        """Selected status, or None for all"""
+        status_filter = self.filter_combo.currentText()
+        return None if status_filter == "All" else status_filter
 
     def build_ui(self):
         layout = QVBoxLayout(self)
@@ -34,7 +53,7 @@ class RequestsPage(QWidget):
 
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["All", "Pending", "Approved", "Rejected"])
-        self.filter_combo.currentTextChanged.connect(self.load_data)
+        self.filter_combo.currentTextChanged.connect(lambda _: self.request_load())
         self.filter_combo.setStyleSheet("""
             QComboBox {
                 background-color: #ffffff;
@@ -141,7 +160,7 @@ class RequestsPage(QWidget):
         layout.addWidget(self.table)
 
     def load_data(self):
-        """Load requests data"""
+        """Load requests data (synchronously, on the calling thread)"""
         print("[RequestsPage] load_data() called")
 
         try:
@@ -151,19 +170,23 @@ class RequestsPage(QWidget):
             self.table.setRowCount(0)
             return
 
-        status_filter = self.filter_combo.currentText()
-        if status_filter == "All":
-            status_filter = None
+        status_filter = self.get_status_filter()
 
         try:
             print(f"[RequestsPage] Fetching requests with filter: {status_filter}")
-            self.cached_requests = LeaveRequestController.get_all_requests(status_filter)
-            print(f"[RequestsPage] Fetched {len(self.cached_requests)} requests")
+            requests = LeaveRequestController.get_all_requests(status_filter)
+            print(f"[RequestsPage] Fetched {len(requests)} requests")
         except Exception as e:
             print(f"[RequestsPage] Error loading data: {e}")
             import traceback
             traceback.print_exc()
-            self.cached_requests = []
+            requests = []
+
+        self.show_requests(requests)
+
+    def show_requests(self, requests):
+        """Render a list of leave requests"""
+        self.cached_requests = requests
 
         # Clear table
         self.table.setRowCount(0)
@@ -268,7 +291,7 @@ class RequestsPage(QWidget):
 
         if LeaveRequestController.update_status(request_id, status):
             CompactMessageDialog.show_success(self, "Success", f"Request {status}!")
-            self.load_data()
+            self.request_load()
         else:
             CompactMessageDialog.show_warning(self, "Error", "Failed to update status.")
 
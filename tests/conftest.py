@@ -0,0 +1,98 @@
+import os
+import sys
+import types
+
+import pytest
+
+# The checkout is imported as the `Project` package (Main.py is run from
+# its parent directory); alias it when the checkout has another name.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'Project' not in sys.modules:
+    sys.path.insert(0, os.path.dirname(ROOT))
+    try:
+        import Project  # noqa: F401
+    except ImportError:
+        package = types.ModuleType('Project')
+        package.__path__ = [ROOT]
+        sys.modules['Project'] = package
+
+from Project.Model.Database import Database
+from Project.Model.QueryBudget import QueryBudget
+from Project.Controller.Clock import Clock
+from Project.Controller.PositionRulesCache import PositionRulesCache
+
+# Scratch database for the MySQL tests (dropped afterwards; never the live one)
+MYSQL_TEST_DATABASE = os.environ.get('ATTENDANCE_TEST_DB_NAME', 'attendance_system_test')
+
+# Connection settings before any test configured Database (configure() is sticky)
+_SETTINGS = {attr: getattr(Database, attr) for attr in Database.ENVIRONMENT}
+_CONFIGURED = set(Database._configured)
+LIVE_DATABASE = Database.effective_setting('database')
+
+
+def use_database(**settings):
+    """Close the current connection pool and connect with new settings"""
+    if Database._instance is not None:
+        Database.get().close()
+    Database.detach()
+    Database.configure(**settings)
+    PositionRulesCache.invalidate()
+    return Database.get()
+
+
+def restore_database():
+    """Close the test connection pool and put the original settings back"""
+    if Database._pool is not None:
+        Database.get().close()
+    Database.detach()
+    for attr, value in _SETTINGS.items():
+        setattr(Database, attr, value)
+    Database._configured.clear()
+    Database._configured.update(_CONFIGURED)
+    PositionRulesCache.invalidate()
+
+
+@pytest.fixture
+def mysql_db():
+    """
+    Migrated scratch MySQL database (ATTENDANCE_DB_HOST/_USER/_PASSWORD);
+    the test is skipped when no server is reachable.
+    """
+    pytest.importorskip('pymysql')
+    if MYSQL_TEST_DATABASE == LIVE_DATABASE:
+        pytest.fail(f"refusing to run tests in the live database '{LIVE_DATABASE}'")
+    try:
+        db = use_database(backend='mysql', database=MYSQL_TEST_DATABASE)
+    except Exception as e:
+        restore_database()
+        pytest.skip(f"MySQL not available: {e}")
+
+    from Project.Model.Migrations import Migrations
+    Migrations.migrate()
+    yield db
+
+    Clock.install(None)
+    db.execute(f"DROP DATABASE IF EXISTS `{MYSQL_TEST_DATABASE}`")
+    restore_database()
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Migrated SQLite database in a temporary directory"""
+    db = use_database(backend='sqlite', sqlite_path=str(tmp_path / 'attendance.sqlite3'))
+
+    from Project.Model.Migrations import Migrations
+    Migrations.migrate()
+    yield db
+
+    Clock.install(None)
+    restore_database()
+
+
+@pytest.fixture
+def strict_budgets(monkeypatch):
+    """QueryBudget in strict mode: an exceeded budget raises QueryBudgetExceeded"""
+    monkeypatch.setattr(QueryBudget, 'STRICT', True)
+    QueryBudget.clear_violations()
+    yield
+    assert not QueryBudget.violations(), QueryBudget.violations()
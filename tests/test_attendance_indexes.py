@@ -0,0 +1,82 @@
+import re
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from Project.Model.Database import Database
+from Project.Model.Attendance import Attendance
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.ReportsC import ReportController
+from Project.Controller.Clock import Clock, SimulatedClock
+from Project.Controller.DatasetGenerator import DatasetGenerator
+
+UNIQUE_KEY = 'uk_attendance_employee_date'
+DATE_STATUS_INDEX = 'idx_attendance_date_status'
+
+END_DATE = DatasetGenerator.DEFAULT_END_DATE
+HOT_DAY = END_DATE + timedelta(days=1)
+
+
+def _clock_in(employee_id):
+    # Another employee: the fixture's one is already clocked in
+    other = Database.get().query_one("SELECT MAX(id) AS id FROM employees")['id']
+    AttendanceController.clock_in(other)
+
+
+def _clock_out(employee_id):
+    Clock.get().set(datetime.combine(HOT_DAY, time(17, 30)))
+    AttendanceController.clock_out(employee_id)
+
+
+def _today_stats(employee_id):
+    # A day without a counters row, so the stats are aggregated from attendance
+    Clock.install(SimulatedClock(datetime.combine(END_DATE, time(12, 0))))
+    AttendanceController.get_today_stats()
+
+
+# Hot path -> (controller call, index it must resolve attendance through).
+# clock_in reads no attendance row at all: its INSERT ... SELECT only reads
+# employees, and a second punch is rejected by uk_attendance_employee_date.
+HOT_PATHS = {
+    'clock_in': (_clock_in, None),
+    'clock_out': (_clock_out, UNIQUE_KEY),
+    'get_today_stats': (_today_stats, DATE_STATUS_INDEX),
+    'get_recent_attendance': (lambda employee_id: AttendanceController.get_recent_attendance(50), DATE_STATUS_INDEX),
+    'mark_absent_employees': (lambda employee_id: AttendanceController.mark_absent_employees(HOT_DAY), UNIQUE_KEY),
+    'get_attendance_details_by_date': (
+        lambda employee_id: ReportController.get_attendance_details_by_date(END_DATE), UNIQUE_KEY),
+}
+
+
+@pytest.fixture
+def hot_day(mysql_db):
+    """Enough history for the optimizer to prefer indexes, and one clock-in on HOT_DAY"""
+    DatasetGenerator(seed=7).generate(employees=200, years=0.25, admins=0, end_date=END_DATE)
+    mysql_db.execute("ANALYZE TABLE attendance")
+
+    Clock.install(SimulatedClock(datetime.combine(HOT_DAY, time(8, 0))))
+    employee_id = mysql_db.query_one("SELECT MIN(id) AS id FROM employees")['id']
+    AttendanceController.clock_in(employee_id)
+    return employee_id
+
+
+@pytest.mark.parametrize('name', sorted(HOT_PATHS))
+def test_hot_path_uses_attendance_index(mysql_db, hot_day, name):
+    run, expected = HOT_PATHS[name]
+    with Database.capture() as statements:
+        run(hot_day)
+
+    reads = [(query, params) for query, params in statements
+             if re.search(r'\battendance\b', query)
+             and not re.match(r'\s*INSERT\s+INTO\s+attendance\s*\(.*\)\s*VALUES', query, re.IGNORECASE | re.DOTALL)]
+    assert reads, f"{name} sent no attendance statement"
+
+    keys = []
+    for query, params in reads:
+        access = Attendance.explain_access(query, params)
+        assert all(key for _, key in access), f"{name} scans attendance: {access}\n{query}"
+        keys.extend(key for _, key in access)
+    if expected is None:
+        assert not keys, f"{name} reads attendance through {keys}"
+    else:
+        assert expected in keys, f"{name} used {keys}, expected {expected}"
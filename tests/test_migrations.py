@@ -0,0 +1,26 @@
+import sqlite3
+
+import pytest
+
+from Project.Model.Database import Database
+from Project.Model.Migrations import Migrations
+from conftest import use_database, restore_database
+
+
+def test_fresh_database_is_version_zero(tmp_path):
+    use_database(backend='sqlite', sqlite_path=str(tmp_path / 'fresh.sqlite3'))
+    try:
+        assert Migrations.current_version() == 0
+    finally:
+        restore_database()
+
+
+def test_version_read_errors_are_not_version_zero(sqlite_db, monkeypatch):
+    assert Migrations.current_version() == Migrations.latest_version()
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(Database, 'query_one', locked)
+    with pytest.raises(sqlite3.OperationalError):
+        Migrations.migrate()
@@ -0,0 +1,135 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from Project.Model.Database import Database
+from Project.Model.QueryBudget import QueryBudget, QueryBudgetExceeded
+from Project.Controller.MainActions import MainActions
+from Project.Controller.AttendanceC import AttendanceController
+from Project.Controller.PeriodicReportsC import PeriodicReportsController
+from Project.Controller.Clock import Clock, SimulatedClock
+from Project.Controller.DatasetGenerator import DatasetGenerator
+
+END_DATE = DatasetGenerator.DEFAULT_END_DATE
+TODAY = END_DATE + timedelta(days=1)
+ADMIN = DatasetGenerator.ADMIN_PREFIX + "0"
+EMPLOYEE = DatasetGenerator.EMPLOYEE_PREFIX + "0"
+PASSWORD = DatasetGenerator.PASSWORD
+
+NEW_EMPLOYEE = {
+    'first_name': "Budget",
+    'middle_initial': "",
+    'last_name': "Test",
+    'email_address': "budget.test@example.com",
+    'phone_number': "09990000000",
+    'username': "budget_test",
+    'password': "secret123",
+    'position_id': 1,
+}
+
+
+@pytest.fixture
+def history(sqlite_db):
+    """Generated history with reports, and a few clock-ins today"""
+    DatasetGenerator(seed=11).generate(employees=30, years=0.1, admins=1, end_date=END_DATE)
+    AttendanceController.generate_daily_report(END_DATE)
+    period_start, period_end = PeriodicReportsController.get_previous_15day_period(TODAY)
+    PeriodicReportsController.generate_15day_report(period_start, period_end)
+    PeriodicReportsController.generate_monthly_report(END_DATE.year, END_DATE.month)
+
+    Clock.install(SimulatedClock(datetime.combine(TODAY, time(8, 0)), speed=0))
+    employee_ids = [r['id'] for r in sqlite_db.query_all("SELECT id FROM employees ORDER BY id LIMIT 5")]
+    for employee_id in employee_ids:
+        AttendanceController.clock_in(employee_id)
+    return {
+        'admin_id': sqlite_db.query_one("SELECT id FROM admins WHERE username = %s", (ADMIN,))['id'],
+        'employee_id': employee_ids[-1],
+        'period': (period_start, period_end),
+    }
+
+
+def _run(call):
+    """(statements sent, result) of one call"""
+    with QueryBudget("test", max_queries=10 ** 6) as counter:
+        result = call()
+    return counter.queries, result
+
+
+def _within(budget, call):
+    queries, result = _run(call)
+    assert 0 < queries <= budget, f"sent {queries} statements, budget {budget}"
+    return result
+
+
+@pytest.mark.parametrize('fetch, budget', [
+    (MainActions.fetch_dashboard, MainActions.REFRESH_DASHBOARD_BUDGET),
+    (MainActions.fetch_employees, MainActions.REFRESH_EMPLOYEES_BUDGET),
+    (MainActions.fetch_reports, MainActions.REFRESH_REPORTS_BUDGET),
+    (lambda: MainActions.fetch_requests(None), MainActions.REFRESH_REQUESTS_BUDGET),
+    (lambda: MainActions.fetch_requests('Pending'), MainActions.REFRESH_REQUESTS_BUDGET),
+], ids=['dashboard', 'employees', 'reports', 'requests', 'requests_pending'])
+def test_page_fetch_within_budget(history, strict_budgets, fetch, budget):
+    assert _within(budget, fetch)
+
+
+@pytest.mark.parametrize('username, expected', [
+    (ADMIN, 'admin'),
+    (EMPLOYEE, 'employee'),
+    ('nobody', None),
+])
+def test_login_within_budget(history, strict_budgets, username, expected):
+    admin, employee = _within(MainActions.LOGIN_BUDGET, lambda: MainActions.login(username, PASSWORD))
+    assert (expected == 'admin') == bool(admin)
+    assert (expected == 'employee') == bool(employee)
+
+
+def test_employee_dialog_open_within_budget(history, strict_budgets):
+    # All the add/edit employee dialogs load when MainController opens them
+    assert _within(MainActions.DIALOG_OPEN_BUDGET, MainActions.employee_dialog_positions)
+
+
+def test_add_employee_within_budget(history, strict_budgets):
+    _within(MainActions.ADD_EMPLOYEE_BUDGET, lambda: MainActions.add_employee(dict(NEW_EMPLOYEE)))
+    assert Database.get().query_one("SELECT id FROM employees WHERE username = %s", (NEW_EMPLOYEE['username'],))
+
+
+def test_edit_employee_within_budget(history, strict_budgets):
+    employee_id = history['employee_id']
+    _within(MainActions.EDIT_EMPLOYEE_BUDGET,
+            lambda: MainActions.update_employee(employee_id, {'phone': "09990000001", 'password': "changed"}))
+    row = Database.get().query_one("SELECT phone_number FROM employees WHERE id = %s", (employee_id,))
+    assert row['phone_number'] == "09990000001"
+
+
+def test_delete_employee_within_budget(history, strict_budgets):
+    employee_id = history['employee_id']
+    _within(MainActions.DELETE_EMPLOYEE_BUDGET, lambda: MainActions.delete_employee(employee_id))
+    assert Database.get().query_one("SELECT id FROM employees WHERE id = %s", (employee_id,)) is None
+
+
+@pytest.mark.parametrize('current, expected', [(PASSWORD, True), ('wrong', False)])
+def test_credentials_change_within_budget(history, strict_budgets, current, expected):
+    changed = _within(MainActions.CREDENTIALS_BUDGET,
+                      lambda: MainActions.change_credentials(history['admin_id'], current, "renamed", "newpass"))
+    assert changed is expected
+
+
+def test_theme_change_within_budget(history, strict_budgets):
+    _within(MainActions.THEME_BUDGET, lambda: MainActions.update_theme(history['admin_id'], 'dark'))
+
+
+@pytest.mark.parametrize('details', [
+    lambda period: MainActions.daily_details(END_DATE),
+    lambda period: MainActions.details_for_15day(*period),
+    lambda period: MainActions.details_for_month(END_DATE.year, END_DATE.month),
+], ids=['daily', '15day', 'monthly'])
+def test_report_details_within_budget(history, strict_budgets, details):
+    assert _within(MainActions.DETAILS_BUDGET, lambda: details(history['period']))
+
+
+def test_strict_budget_raises(sqlite_db, strict_budgets):
+    with pytest.raises(QueryBudgetExceeded):
+        with QueryBudget("too_many", max_queries=1):
+            sqlite_db.query_one("SELECT 1")
+            sqlite_db.query_one("SELECT 1")
+    QueryBudget.clear_violations()
@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+from Project.Controller.RequestC import LeaveRequestController
+
+
+def _add_employee(db, last_name):
+    db.execute("""
+               INSERT INTO employees
+               (first_name, middle_initial, last_name, email_address, phone_number,
+                username, password_hash, salt, date_hired, position_id)
+               VALUES ('Test', '', %s, 'test@example.com', '09170000000', 'test', 'x', 'x', %s, 1)
+               """, (last_name, date(2024, 1, 2)))
+    return db.query_one("SELECT id FROM employees WHERE username = 'test'")['id']
+
+
+def test_columns_typed_by_declared_type(sqlite_db):
+    employee_id = _add_employee(sqlite_db, "Doe")
+    sqlite_db.execute("INSERT INTO attendance (employee_id, clock_in, date, status) VALUES (%s, %s, %s, 'Present')",
+                      (employee_id, datetime(2024, 1, 3, 7, 55), date(2024, 1, 3)))
+
+    employee = sqlite_db.query_one("SELECT date_hired FROM employees WHERE id = %s", (employee_id,))
+    attendance = sqlite_db.query_one("SELECT clock_in, date FROM attendance WHERE employee_id = %s", (employee_id,))
+    position = sqlite_db.query_one("SELECT late_time FROM positions WHERE id = 1")
+
+    assert employee['date_hired'] == date(2024, 1, 2)
+    assert attendance == {'clock_in': datetime(2024, 1, 3, 7, 55), 'date': date(2024, 1, 3)}
+    assert isinstance(position['late_time'], timedelta)
+
+
+def test_text_that_looks_like_a_date_stays_text(sqlite_db):
+    employee_id = _add_employee(sqlite_db, "10:30:00")
+    LeaveRequestController.submit_request(employee_id, "Vacation", date(2025, 12, 24), date(2025, 12, 26),
+                                          "2025-12-24")
+
+    employee = sqlite_db.query_one("SELECT last_name FROM employees WHERE id = %s", (employee_id,))
+    request, = LeaveRequestController.get_all_requests()
+
+    assert employee['last_name'] == "10:30:00"
+    assert request['reason'] == "2025-12-24"
+    assert request['start_date'] == date(2025, 12, 24)